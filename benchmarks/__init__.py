@@ -0,0 +1,21 @@
+"""Performance benchmarks of qrules on reference decay channels.
+
+Run the benchmarks from the root of the repository and write the results to
+a JSON file with:
+
+.. code-block:: shell
+
+    python -m benchmarks run --output results.json
+
+Use :code:`--keyword` to select benchmarks by (part of) their key and
+:code:`--threads` and :code:`--formalisms` to choose the configurations of
+the `.StateTransitionManager`. Results of two commits can then be compared
+with:
+
+.. code-block:: shell
+
+    python -m benchmarks compare old.json new.json
+
+which exits with a non-zero status if a benchmark became slower than the
+:code:`--threshold`.
+"""
@@ -0,0 +1,109 @@
+"""Command line interface of the benchmarks, see :mod:`benchmarks`."""
+
+import argparse
+import logging
+import sys
+import tempfile
+from typing import List, Optional, Sequence
+
+from .cases import create_benchmarks
+from .compare import compare_results, find_regressions, format_comparison
+from .runner import (
+    BenchmarkResult,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark qrules on reference decay channels",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument(
+        "-o", "--output", help="JSON file to which the results are written"
+    )
+    run_parser.add_argument(
+        "-k",
+        "--keyword",
+        default="",
+        help="only run benchmarks of which the key contains this string",
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=3, help="number of timed repetitions"
+    )
+    run_parser.add_argument(
+        "--formalisms",
+        nargs="+",
+        default=["helicity", "canonical-helicity"],
+    )
+    run_parser.add_argument("--threads", nargs="+", type=int, default=[1])
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="compare two result files; exits with 1 if there are regressions",
+    )
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown of the median time that counts as regression",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return _run(args)
+    return _compare(args)
+
+
+def _run(args: argparse.Namespace) -> int:
+    logging.getLogger().setLevel(logging.ERROR)  # hide progress bars
+    with tempfile.TemporaryDirectory(prefix="qrules-benchmarks-") as tmp_dir:
+        benchmarks = (
+            benchmark
+            for benchmark in create_benchmarks(
+                tmp_dir, args.formalisms, args.threads
+            )
+            if args.keyword in benchmark.key
+        )
+        results = run_benchmarks(benchmarks, args.repeat, _print_result)
+    if args.output:
+        write_results(results, args.output)
+    return 0
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(
+        f"{result.key}: median {result.median:.3f}s,"
+        f" best {result.best:.3f}s,"
+        f" peak memory {result.peak_memory / 2**20:.1f} MiB",
+        flush=True,
+    )
+
+
+def _compare(args: argparse.Namespace) -> int:
+    old = load_results(args.old)
+    new = load_results(args.new)
+    comparisons, removed, added = compare_results(old, new)
+    lines: List[str] = format_comparison(comparisons, args.threshold)
+    if removed:
+        lines.append(f"{len(removed)} benchmarks only in {args.old}")
+    if added:
+        lines.append(f"{len(added)} benchmarks only in {args.new}")
+    print("\n".join(lines))
+    regressions = find_regressions(comparisons, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmarks became slower")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""Reference decay channels and the operations that are benchmarked on them.
+
+The channels are the same as those under :file:`tests/channels`, so that the
+benchmarks measure workloads of which the correctness is tested.
+"""
+
+import subprocess  # noqa: S404
+import sys
+from itertools import product
+from os.path import join
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from attrs import field, frozen
+
+import qrules
+from qrules import InteractionType, StateTransitionManager
+from qrules._rule_cache import RULE_CACHE
+from qrules.combinatorics import StateDefinition
+from qrules.particle import ParticleCollection, load_pdg
+
+
+@frozen
+class Channel:
+    """Definition of a reaction as in :func:`.generate_transitions`."""
+
+    name: str
+    initial_state: Sequence[StateDefinition]
+    final_state: Sequence[StateDefinition]
+    allowed_intermediate_particles: Optional[List[str]] = None
+    allowed_interaction_types: Optional[List[str]] = None
+    final_state_grouping: Optional[List[List[str]]] = None
+
+    def create_stm(
+        self,
+        particle_db: ParticleCollection,
+        formalism: str,
+        number_of_threads: int,
+    ) -> StateTransitionManager:
+        stm = StateTransitionManager(
+            self.initial_state,
+            self.final_state,
+            particle_db,
+            allowed_intermediate_particles=self.allowed_intermediate_particles,
+            formalism=formalism,
+            number_of_threads=number_of_threads,
+        )
+        if self.allowed_interaction_types is not None:
+            stm.set_allowed_interaction_types(
+                [
+                    InteractionType.from_str(description)
+                    for description in self.allowed_interaction_types
+                ]
+            )
+        if self.final_state_grouping is not None:
+            stm.add_final_state_grouping(self.final_state_grouping)
+        return stm
+
+
+CHANNELS: List[Channel] = [
+    Channel(
+        name="jpsi-gamma-pi0-pi0",
+        initial_state=[("J/psi(1S)", [-1, +1])],
+        final_state=["gamma", "pi0", "pi0"],
+        allowed_intermediate_particles=[
+            "f(0)(980)",
+            "f(2)(1270)",
+            "f(0)(1500)",
+            "f(2)(1950)",
+            "omega(782)",
+        ],
+        allowed_interaction_types=["strong", "EM"],
+    ),
+    Channel(
+        name="d0-ks-kp-km",
+        initial_state=["D0"],
+        final_state=["K~0", "K+", "K-"],
+        allowed_intermediate_particles=[
+            "a(0)(980)",
+            "a(2)(1320)-",
+            "phi(1020)",
+        ],
+    ),
+    Channel(
+        name="y-dstar-dstarbar",
+        initial_state=[("Y(4260)", [-1, +1])],
+        final_state=["D*(2007)0", "D*(2007)~0"],
+        allowed_interaction_types=["strong"],
+    ),
+    Channel(
+        name="y-d0-d0bar-pi0-pi0",
+        initial_state=[("Y(4260)", [-1, +1])],
+        final_state=["D0", "D~0", "pi0", "pi0"],
+        allowed_intermediate_particles=["D*"],
+        allowed_interaction_types=["strong"],
+        final_state_grouping=[["D0", "pi0"], ["D~0", "pi0"]],
+    ),
+]
+"""Channels of the STM benchmarks."""
+
+REACTIONS: List[Any] = [
+    (["p", "p~"], ["pi+", "pi0"]),
+    (["eta"], ["pi+", "pi-"]),
+    (["Sigma-"], ["n", "pi-"]),
+    (["mu-"], ["e-", "nu(e)"]),
+    (["e-", "p"], ["nu(e)", "pi0"]),
+    (["pi0"], ["gamma", "gamma", "gamma"]),
+    (["J/psi(1S)"], ["pi0", "f(0)(980)"]),
+    (["p", "p"], ["Sigma+", "n", "K~0", "pi+", "pi0"]),
+    (["n", "n~"], ["pi+", "pi-", "pi0"]),
+]
+"""Initial and final states of the :func:`.check_reaction_violations`
+benchmark, taken from the n-body reaction tests."""
+
+MODULES: List[str] = [
+    "qrules",
+    "qrules.particle",
+    "qrules.conservation_rules",
+    "qrules.transition",
+    "qrules.io",
+]
+"""Modules of which the import time is benchmarked."""
+
+
+@frozen
+class Benchmark:
+    """An operation that is timed repeatedly.
+
+    The :code:`prepare` function is called before each repetition and is not
+    timed. It returns the function that is timed.
+    """
+
+    name: str
+    prepare: Callable[[], Callable[[], Any]] = field(eq=False, repr=False)
+    params: Dict[str, Any] = field(factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Identifier with which results are compared between runs."""
+        if not self.params:
+            return self.name
+        params = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.name}[{params}]"
+
+
+def reset_caches() -> None:
+    """Make each repetition start like a fresh process."""
+    RULE_CACHE.clear()
+
+
+def create_benchmarks(
+    output_dir: str,
+    formalisms: Sequence[str] = ("helicity", "canonical-helicity"),
+    threads: Sequence[int] = (1,),
+) -> Iterator[Benchmark]:
+    """Create all benchmarks for the given formalisms and thread counts.
+
+    The :mod:`.io` benchmarks write their files to :code:`output_dir`.
+    """
+    yield from _create_import_benchmarks()
+    particle_db = qrules.load_default_particles()
+    yield Benchmark("load_pdg", prepare=lambda: load_pdg)
+    for channel, formalism, number_of_threads in product(
+        CHANNELS, formalisms, threads
+    ):
+        params = {
+            "channel": channel.name,
+            "formalism": formalism,
+            "threads": number_of_threads,
+        }
+        yield Benchmark(
+            "create_problem_sets",
+            _prepare_create_problem_sets(
+                channel, particle_db, formalism, number_of_threads
+            ),
+            params,
+        )
+        yield Benchmark(
+            "find_solutions",
+            _prepare_find_solutions(
+                channel, particle_db, formalism, number_of_threads
+            ),
+            params,
+        )
+        if channel.final_state_grouping is None:
+            yield Benchmark(
+                "generate_transitions",
+                _prepare_generate_transitions(
+                    channel, particle_db, formalism, number_of_threads
+                ),
+                params,
+            )
+    yield Benchmark(
+        "check_reaction_violations",
+        _prepare_check_reaction_violations(particle_db),
+    )
+    yield from _create_io_benchmarks(particle_db, output_dir)
+
+
+def _create_import_benchmarks() -> Iterator[Benchmark]:
+    """Import each of the `MODULES` in a fresh interpreter.
+
+    The timings include the start-up time of the interpreter, which can be
+    measured separately with the benchmark of module :code:`-`, which only
+    starts the interpreter.
+    """
+    yield Benchmark("import", _bind(_run_python, "pass"), {"module": "-"})
+    for module in MODULES:
+        yield Benchmark(
+            "import",
+            _bind(_run_python, f"import {module}"),
+            {"module": module},
+        )
+
+
+def _run_python(command: str) -> None:
+    subprocess.check_call([sys.executable, "-c", command])  # noqa: S603
+
+
+def _prepare_create_problem_sets(
+    channel: Channel,
+    particle_db: ParticleCollection,
+    formalism: str,
+    number_of_threads: int,
+) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        stm = channel.create_stm(particle_db, formalism, number_of_threads)
+        return stm.create_problem_sets
+
+    return prepare
+
+
+def _prepare_find_solutions(
+    channel: Channel,
+    particle_db: ParticleCollection,
+    formalism: str,
+    number_of_threads: int,
+) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        stm = channel.create_stm(particle_db, formalism, number_of_threads)
+        problem_sets = stm.create_problem_sets()
+        return lambda: stm.find_solutions(problem_sets)
+
+    return prepare
+
+
+def _prepare_generate_transitions(
+    channel: Channel,
+    particle_db: ParticleCollection,
+    formalism: str,
+    number_of_threads: int,
+) -> Callable[[], Callable[[], Any]]:
+    def prepare() -> Callable[[], Any]:
+        return lambda: qrules.generate_transitions(
+            initial_state=channel.initial_state,
+            final_state=channel.final_state,
+            allowed_intermediate_particles=(
+                channel.allowed_intermediate_particles
+            ),
+            allowed_interaction_types=channel.allowed_interaction_types,
+            formalism=formalism,
+            particle_db=particle_db,
+            number_of_threads=number_of_threads,
+        )
+
+    return prepare
+
+
+def _prepare_check_reaction_violations(
+    particle_db: ParticleCollection,
+) -> Callable[[], Callable[[], Any]]:
+    def check_reactions() -> None:
+        for initial_state, final_state in REACTIONS:
+            qrules.check_reaction_violations(
+                initial_state, final_state, particle_db=particle_db
+            )
+
+    return lambda: check_reactions
+
+
+def _create_io_benchmarks(
+    particle_db: ParticleCollection, output_dir: str
+) -> Iterator[Benchmark]:
+    """Write and load the particle database and a `.ReactionInfo`.
+
+    Loading the binary :code:`qrules` format only opens the file, because
+    its transitions are built when they are accessed.
+    A `.ReactionInfo` is written to YAML only with a particle table, because
+    the default YAML output contains Python tags that `.io.load` cannot read.
+    """
+    stm = CHANNELS[0].create_stm(particle_db, "canonical-helicity", 1)
+    reaction = stm.find_solutions(stm.create_problem_sets())
+    for instance_name, instance, extension, particle_table in [
+        ("particles", particle_db, "json", False),
+        ("particles", particle_db, "yaml", False),
+        ("reaction", reaction, "json", False),
+        ("reaction", reaction, "json", True),
+        ("reaction", reaction, "yaml", True),
+        ("reaction", reaction, "qrules", False),
+    ]:
+        if particle_table:
+            instance_name += "-particle-table"
+        filename = join(output_dir, f"{instance_name}.{extension}")
+        qrules.io.write(instance, filename, particle_table)
+        params = {"instance": instance_name, "format": extension}
+        yield Benchmark(
+            "io.write",
+            _bind(qrules.io.write, instance, filename, particle_table),
+            params,
+        )
+        yield Benchmark("io.load", _bind(qrules.io.load, filename), params)
+
+
+def _bind(
+    function: Callable[..., Any], *args: Any
+) -> Callable[[], Callable[[], Any]]:
+    return lambda: lambda: function(*args)
@@ -0,0 +1,78 @@
+"""Compare the results of two benchmark runs."""
+
+from typing import Any, Dict, List, Tuple
+
+from attrs import frozen
+
+
+@frozen
+class Comparison:
+    """Median times of a benchmark in two runs."""
+
+    key: str
+    old: float
+    new: float
+
+    @property
+    def ratio(self) -> float:
+        return self.new / self.old
+
+
+def compare_results(
+    old: Dict[str, Any], new: Dict[str, Any]
+) -> Tuple[List[Comparison], List[str], List[str]]:
+    """Match the benchmarks of two runs by their key.
+
+    Returns the comparisons, the keys that only exist in the old run and the
+    keys that only exist in the new run.
+    """
+    old_medians = _get_medians(old)
+    new_medians = _get_medians(new)
+    comparisons = [
+        Comparison(key, old_median, new_medians[key])
+        for key, old_median in old_medians.items()
+        if key in new_medians
+    ]
+    removed = [key for key in old_medians if key not in new_medians]
+    added = [key for key in new_medians if key not in old_medians]
+    return comparisons, removed, added
+
+
+def _get_medians(results: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        benchmark["key"]: benchmark["median"]
+        for benchmark in results["benchmarks"]
+    }
+
+
+def format_comparison(
+    comparisons: List[Comparison], threshold: float
+) -> List[str]:
+    """Render a table of comparisons and mark the ones above threshold.
+
+    A benchmark is marked as regression if it became slower by more than the
+    :code:`threshold` fraction and as improvement if it became faster by more
+    than that fraction.
+    """
+    width = max((len(c.key) for c in comparisons), default=0)
+    lines = [f"{'benchmark':<{width}}  {'old':>9}  {'new':>9}  {'ratio':>6}"]
+    for comparison in comparisons:
+        if comparison.ratio > 1 + threshold:
+            marker = "  slower"
+        elif comparison.ratio < 1 - threshold:
+            marker = "  faster"
+        else:
+            marker = ""
+        lines.append(
+            f"{comparison.key:<{width}}"
+            f"  {comparison.old:8.3f}s"
+            f"  {comparison.new:8.3f}s"
+            f"  {comparison.ratio:6.2f}{marker}"
+        )
+    return lines
+
+
+def find_regressions(
+    comparisons: List[Comparison], threshold: float
+) -> List[Comparison]:
+    return [c for c in comparisons if c.ratio > 1 + threshold]
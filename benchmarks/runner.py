@@ -0,0 +1,128 @@
+"""Time benchmarks and store the results in a machine-readable format."""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from attrs import asdict, frozen
+
+from .cases import Benchmark, reset_caches
+
+
+@frozen
+class BenchmarkResult:
+    """Timings of one `.Benchmark`.
+
+    The peak memory is measured with :mod:`tracemalloc` in a separate
+    repetition, because tracing slows down the benchmark. It only covers the
+    main process, so it does not include the memory of worker processes.
+    """
+
+    key: str
+    name: str
+    params: Dict[str, Any]
+    times: List[float]
+    """Wall-clock time in seconds of each repetition."""
+    peak_memory: int
+    """Peak memory in bytes that Python allocated during one repetition."""
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int = 3) -> BenchmarkResult:
+    times = []
+    for _ in range(repeat):
+        function = _prepare(benchmark)
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    function = _prepare(benchmark)
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(
+        key=benchmark.key,
+        name=benchmark.name,
+        params=benchmark.params,
+        times=times,
+        peak_memory=peak_memory,
+    )
+
+
+def _prepare(benchmark: Benchmark) -> Callable[[], Any]:
+    reset_caches()
+    function = benchmark.prepare()
+    gc.collect()
+    return function
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    repeat: int = 3,
+    callback: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> Dict[str, Any]:
+    """Run benchmarks and collect their results with the environment."""
+    results = []
+    for benchmark in benchmarks:
+        result = run_benchmark(benchmark, repeat)
+        if callback is not None:
+            callback(result)
+        results.append(result)
+    return {
+        "environment": get_environment(),
+        "benchmarks": [
+            {**asdict(result), "best": result.best, "median": result.median}
+            for result in results
+        ],
+    }
+
+
+def get_environment() -> Dict[str, Any]:
+    return {
+        "commit": _get_git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "argv": sys.argv,
+    }
+
+
+def _get_git_commit() -> Optional[str]:
+    try:
+        output = subprocess.check_output(  # noqa: S603, S607
+            ["git", "describe", "--always", "--dirty"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode().strip()
+
+
+def write_results(results: Dict[str, Any], filename: str) -> None:
+    with open(filename, "w") as stream:
+        json.dump(results, stream, indent=2)
+
+
+def load_results(filename: str) -> Dict[str, Any]:
+    with open(filename) as stream:
+        return json.load(stream)
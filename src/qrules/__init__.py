@@ -17,8 +17,12 @@ Finally, the `.io` module provides tools that can read and write the objects of
 this framework.
 """
 
+import importlib
+import sys
 from itertools import product
 from typing import (
+    TYPE_CHECKING,
+    Any,
     Dict,
     FrozenSet,
     Iterable,
@@ -29,54 +33,146 @@ from typing import (
     Union,
 )
 
-import attrs
-
-from . import io
-from .combinatorics import InitialFacts, StateDefinition, create_initial_facts
-from .conservation_rules import (
-    BaryonNumberConservation,
-    BottomnessConservation,
-    ChargeConservation,
-    CharmConservation,
-    ElectronLNConservation,
-    GraphElementRule,
-    MassConservation,
-    MuonLNConservation,
-    StrangenessConservation,
-    TauLNConservation,
-    c_parity_conservation,
-    clebsch_gordan_helicity_to_canonical,
-    g_parity_conservation,
-    gellmann_nishijima,
-    identical_particle_symmetrization,
-    isospin_conservation,
-    isospin_validity,
-    parity_conservation,
-    spin_magnitude_conservation,
-)
-from .particle import ParticleCollection, load_pdg
-from .quantum_numbers import InteractionProperties
-from .settings import (
-    ADDITIONAL_PARTICLES_DEFINITIONS_PATH,
-    InteractionType,
-    _halves_domain,
-    _int_domain,
-)
-from .solving import NodeSettings, QNResult, Rule, validate_full_solution
-from .topology import MutableTransition, create_n_body_topology
-from .transition import (
-    EdgeSettings,
-    ProblemSet,
-    ReactionInfo,
-    StateTransitionManager,
-)
+if TYPE_CHECKING:
+    from . import io
+    from .combinatorics import (
+        InitialFacts,
+        StateDefinition,
+        create_initial_facts,
+    )
+    from .conservation_rules import (
+        BaryonNumberConservation,
+        BottomnessConservation,
+        ChargeConservation,
+        CharmConservation,
+        ElectronLNConservation,
+        GraphElementRule,
+        MassConservation,
+        MuonLNConservation,
+        StrangenessConservation,
+        TauLNConservation,
+        c_parity_conservation,
+        clebsch_gordan_helicity_to_canonical,
+        g_parity_conservation,
+        gellmann_nishijima,
+        identical_particle_symmetrization,
+        isospin_conservation,
+        isospin_validity,
+        parity_conservation,
+        spin_magnitude_conservation,
+    )
+    from .particle import ParticleCollection, load_pdg
+    from .quantum_numbers import InteractionProperties
+    from .settings import (
+        ADDITIONAL_PARTICLES_DEFINITIONS_PATH,
+        InteractionType,
+        _halves_domain,
+        _int_domain,
+    )
+    from .solving import NodeSettings, QNResult, Rule, validate_full_solution
+    from .topology import MutableTransition, create_n_body_topology
+    from .transition import (
+        EdgeSettings,
+        ProblemSet,
+        ReactionInfo,
+        StateTransitionManager,
+    )
+
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "InitialFacts": "combinatorics",
+    "StateDefinition": "combinatorics",
+    "create_initial_facts": "combinatorics",
+    "BaryonNumberConservation": "conservation_rules",
+    "BottomnessConservation": "conservation_rules",
+    "ChargeConservation": "conservation_rules",
+    "CharmConservation": "conservation_rules",
+    "ElectronLNConservation": "conservation_rules",
+    "GraphElementRule": "conservation_rules",
+    "MassConservation": "conservation_rules",
+    "MuonLNConservation": "conservation_rules",
+    "StrangenessConservation": "conservation_rules",
+    "TauLNConservation": "conservation_rules",
+    "c_parity_conservation": "conservation_rules",
+    "clebsch_gordan_helicity_to_canonical": "conservation_rules",
+    "g_parity_conservation": "conservation_rules",
+    "gellmann_nishijima": "conservation_rules",
+    "identical_particle_symmetrization": "conservation_rules",
+    "isospin_conservation": "conservation_rules",
+    "isospin_validity": "conservation_rules",
+    "parity_conservation": "conservation_rules",
+    "spin_magnitude_conservation": "conservation_rules",
+    "ParticleCollection": "particle",
+    "load_pdg": "particle",
+    "InteractionProperties": "quantum_numbers",
+    "ADDITIONAL_PARTICLES_DEFINITIONS_PATH": "settings",
+    "InteractionType": "settings",
+    "_halves_domain": "settings",
+    "_int_domain": "settings",
+    "NodeSettings": "solving",
+    "QNResult": "solving",
+    "Rule": "solving",
+    "validate_full_solution": "solving",
+    "MutableTransition": "topology",
+    "create_n_body_topology": "topology",
+    "EdgeSettings": "transition",
+    "ProblemSet": "transition",
+    "ReactionInfo": "transition",
+    "StateTransitionManager": "transition",
+}
+"""Attributes that are only imported from their submodule when accessed.
+
+This keeps :code:`import qrules` fast, because the submodules that import
+heavy dependencies (such as :code:`constraint`, :code:`tqdm` and
+:code:`yaml`) are only loaded once they are needed.
+"""
+
+_SUBMODULES = {
+    "argument_handling",
+    "combinatorics",
+    "conservation_rules",
+    "io",
+    "particle",
+    "profiling",
+    "quantum_numbers",
+    "settings",
+    "solving",
+    "topology",
+    "transition",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, *_SUBMODULES})
+
+
+def _import_lazy_attributes() -> None:
+    """Import the attributes to which the functions of this module refer."""
+    for name in _LAZY_ATTRIBUTES:
+        __getattr__(name)
+    __getattr__("io")
+
+
+if sys.version_info < (3, 7):  # module __getattr__ requires PEP 562
+    _import_lazy_attributes()
 
 
 def check_reaction_violations(  # pylint: disable=too-many-arguments
-    initial_state: Union[StateDefinition, Sequence[StateDefinition]],
-    final_state: Sequence[StateDefinition],
+    initial_state: Union["StateDefinition", Sequence["StateDefinition"]],
+    final_state: Sequence["StateDefinition"],
     mass_conservation_factor: Optional[float] = 3.0,
-    particle_db: Optional[ParticleCollection] = None,
+    particle_db: Optional["ParticleCollection"] = None,
     max_angular_momentum: int = 1,
     max_spin_magnitude: float = 2.0,
 ) -> Set[FrozenSet[str]]:
@@ -118,7 +214,10 @@ def check_reaction_violations(  # pylint: disable=too-many-arguments
 
     .. seealso:: :ref:`usage:Check allowed reactions`
     """
-    # pylint: disable=too-many-locals
+    # pylint: disable=import-outside-toplevel, too-many-locals
+    import attrs
+
+    _import_lazy_attributes()
     if not isinstance(initial_state, (list, tuple)):
         initial_state = [initial_state]  # type: ignore[list-item]
 
@@ -281,19 +380,20 @@ def check_reaction_violations(  # pylint: disable=too-many-arguments
     return violations
 
 
-def generate_transitions(  # pylint: disable=too-many-arguments
-    initial_state: Union[StateDefinition, Sequence[StateDefinition]],
-    final_state: Sequence[StateDefinition],
+def generate_transitions(  # pylint: disable=too-many-arguments, too-many-locals
+    initial_state: Union["StateDefinition", Sequence["StateDefinition"]],
+    final_state: Sequence["StateDefinition"],
     allowed_intermediate_particles: Optional[List[str]] = None,
     allowed_interaction_types: Optional[Union[str, Iterable[str]]] = None,
     formalism: str = "canonical-helicity",
-    particle_db: Optional[ParticleCollection] = None,
+    particle_db: Optional["ParticleCollection"] = None,
     mass_conservation_factor: Optional[float] = 3.0,
     max_angular_momentum: int = 2,
     max_spin_magnitude: float = 2.0,
     topology_building: str = "isobar",
     number_of_threads: Optional[int] = None,
-) -> ReactionInfo:
+    cache: Optional["io.ReactionCache"] = None,
+) -> "ReactionInfo":
     """Generate allowed transitions between an initial and final state.
 
     Serves as a facade to the `.StateTransitionManager` (see
@@ -346,7 +446,14 @@ def generate_transitions(  # pylint: disable=too-many-arguments
 
         number_of_threads: Number of cores with which to compute the allowed
             transitions. Defaults to the current value returned by
-            :meth:`.settings.NumberOfThreads.get`.
+            :meth:`.settings.NumberOfThreads.get`. Enable
+            `.settings.PersistentWorkerPool` to reuse the worker processes
+            across calls.
+
+        cache: A `.ReactionCache` in which the resulting `.ReactionInfo` is
+            stored. If the cache already contains a `.ReactionInfo` for the
+            same arguments and the same content of the :code:`particle_db`,
+            that `.ReactionInfo` is returned without solving anything.
 
     An example (where, for illustrative purposes only, we specify all
     arguments) would be:
@@ -366,12 +473,30 @@ def generate_transitions(  # pylint: disable=too-many-arguments
     >>> len(reaction.group_by_topology())
     3
     """
+    _import_lazy_attributes()
     if isinstance(initial_state, str) or (
         isinstance(initial_state, tuple)
         and len(initial_state) == 2
         and isinstance(initial_state[0], str)
     ):
         initial_state = [initial_state]  # type: ignore[list-item]
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.create_key(
+            particle_db,
+            initial_state=initial_state,
+            final_state=final_state,
+            allowed_intermediate_particles=allowed_intermediate_particles,
+            allowed_interaction_types=allowed_interaction_types,
+            formalism=formalism,
+            mass_conservation_factor=mass_conservation_factor,
+            max_angular_momentum=max_angular_momentum,
+            max_spin_magnitude=max_spin_magnitude,
+            topology_building=topology_building,
+        )
+        cached_reaction = cache.get(cache_key)
+        if cached_reaction is not None:
+            return cached_reaction
     stm = StateTransitionManager(
         initial_state=initial_state,  # type: ignore[arg-type]
         final_state=final_state,
@@ -396,16 +521,33 @@ def generate_transitions(  # pylint: disable=too-many-arguments
             ]
         stm.set_allowed_interaction_types(list(interaction_types))
     problem_sets = stm.create_problem_sets()
-    return stm.find_solutions(problem_sets)
+    reaction = stm.find_solutions(problem_sets)
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, reaction)
+    return reaction
 
 
-def load_default_particles() -> ParticleCollection:
+def load_default_particles(
+    cache: Optional["io.ParticleCache"] = None,
+) -> "ParticleCollection":
     """Load the default particle list that comes with `qrules`.
 
     Runs `.load_pdg` and supplements its output definitions from the file
     :download:`additional_definitions.yml
-    </../src/qrules/additional_definitions.yml>`.
+    </../src/qrules/additional_definitions.yml>`. If a `.ParticleCache` is
+    given, the particles are loaded from a snapshot in that cache, which is
+    recreated when that file or the :code:`particle` package changes.
     """
+    _import_lazy_attributes()
+    if cache is not None:
+        key = cache.create_key(
+            "default-particles", ADDITIONAL_PARTICLES_DEFINITIONS_PATH
+        )
+        particles = cache.get(key)
+        if particles is None:
+            particles = load_default_particles()
+            cache.put(key, particles)
+        return particles
     particle_db = load_pdg()
     additional_particles = io.load(ADDITIONAL_PARTICLES_DEFINITIONS_PATH)
     assert isinstance(additional_particles, ParticleCollection)
@@ -0,0 +1,321 @@
+"""Detect `.QNProblemSet` instances that have the same solutions.
+
+Many of the problem sets that the `.StateTransitionManager` creates differ only
+in a relabelling of their edges and nodes (for instance when two identical
+particles appear in the final state) or in the signs of all spin projections.
+Such problem sets are equivalent: the solutions of one can be obtained from
+the solutions of the other by applying the same relabelling. This module
+computes a canonical form for each problem set, so that only one problem set
+per equivalence class has to be solved.
+
+Equivalence is only assumed where it is known to hold for the conservation
+rules in :mod:`.conservation_rules`. Problem sets that contain other rules
+are never considered equivalent to another problem set.
+"""
+
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from attrs import frozen
+
+from . import conservation_rules
+from ._rule_cache import create_rule_key
+from .conservation_rules import clebsch_gordan_helicity_to_canonical
+from .quantum_numbers import EdgeQuantumNumbers, NodeQuantumNumbers
+from .solving import (
+    EdgeSettings,
+    GraphEdgePropertyMap,
+    GraphNodePropertyMap,
+    NodeSettings,
+    QNProblemSet,
+    QNResult,
+    QuantumNumberSolution,
+)
+from .topology import MutableTransition
+
+_PROJECTIONS = {
+    EdgeQuantumNumbers.spin_projection,
+    NodeQuantumNumbers.l_projection,
+    NodeQuantumNumbers.s_projection,
+}
+"""Quantum numbers that change sign when reversing all spin projections."""
+
+_OUT_EDGE_ORDER_DEPENDENT_RULES = {clebsch_gordan_helicity_to_canonical}
+"""Rules that depend on the order in which outgoing edges are provided."""
+
+
+@frozen
+class Relabelling:
+    """Mapping from the solutions of one problem set to an equivalent one."""
+
+    edges: Dict[int, int]
+    nodes: Dict[int, int]
+    reverse_projections: bool = False
+
+    def apply(self, result: QNResult, problem_set: QNProblemSet) -> QNResult:
+        """Convert a result into the result for the given problem set."""
+        return QNResult(
+            [
+                self.__relabel_solution(solution, problem_set)
+                for solution in result.solutions
+            ],
+            not_executed_node_rules=_relabel_keys(
+                result.not_executed_node_rules, self.nodes
+            ),
+            violated_node_rules=_relabel_keys(
+                result.violated_node_rules, self.nodes
+            ),
+            not_executed_edge_rules=_relabel_keys(
+                result.not_executed_edge_rules, self.edges
+            ),
+            violated_edge_rules=_relabel_keys(
+                result.violated_edge_rules, self.edges
+            ),
+        )
+
+    def __relabel_solution(
+        self, solution: QuantumNumberSolution, problem_set: QNProblemSet
+    ) -> QuantumNumberSolution:
+        initial_facts = problem_set.initial_facts
+        states: Dict[int, GraphEdgePropertyMap] = {}
+        for edge_id, edge_properties in solution.states.items():
+            new_id = self.edges[edge_id]
+            states[new_id] = self.__convert_properties(edge_properties)
+            states[new_id].update(initial_facts.states.get(new_id, {}))
+        interactions: Dict[int, GraphNodePropertyMap] = {}
+        for node_id, node_properties in solution.interactions.items():
+            new_id = self.nodes[node_id]
+            interactions[new_id] = self.__convert_properties(node_properties)
+            interactions[new_id].update(
+                initial_facts.interactions.get(new_id, {})
+            )
+        return MutableTransition(problem_set.topology, states, interactions)
+
+    def __convert_properties(self, properties: Dict[Any, Any]) -> dict:
+        if not self.reverse_projections:
+            return dict(properties)
+        return _reverse_projections(properties)
+
+
+def find_equivalent_problem_sets(
+    problem_sets: Sequence[QNProblemSet],
+) -> List[Optional[Tuple[int, Relabelling]]]:
+    """Find problem sets that are equivalent to an earlier problem set.
+
+    Returns:
+        For each problem set, `None` if it has to be solved or the index of
+        an earlier, equivalent problem set with the `Relabelling` that
+        converts the result of that problem set into the result of this one.
+    """
+    canonicalizer = _Canonicalizer()
+    representatives: Dict[Hashable, Tuple[int, List[int], List[int]]] = {}
+    equivalences: List[Optional[Tuple[int, Relabelling]]] = []
+    for index, problem_set in enumerate(problem_sets):
+        forms = canonicalizer.create_forms(problem_set)
+        equivalence = None
+        for reverse_projections, key, edge_order, node_order in forms:
+            representative = representatives.get(key)
+            if representative is not None:
+                representative_index, edges, nodes = representative
+                relabelling = Relabelling(
+                    edges=dict(zip(edges, edge_order)),
+                    nodes=dict(zip(nodes, node_order)),
+                    reverse_projections=reverse_projections,
+                )
+                equivalence = (representative_index, relabelling)
+                break
+        if equivalence is None and forms:
+            _, key, edge_order, node_order = forms[0]
+            representatives[key] = (index, edge_order, node_order)
+        equivalences.append(equivalence)
+    return equivalences
+
+
+_CanonicalForm = Tuple[bool, Hashable, List[int], List[int]]
+"""Projection reversal, key, and edge and node IDs in canonical order."""
+
+
+class _Canonicalizer:
+    """Create canonical forms for problem sets that are rooted trees.
+
+    The canonical form is the AHU encoding of the topology, where each edge
+    and node is labeled with its initial facts and solving settings. Codes
+    are interned as `int`, so that the codes of child edges can be sorted.
+    """
+
+    def __init__(self) -> None:
+        self.__codes: Dict[Hashable, int] = {}
+        self.__settings_keys: Dict[int, Tuple[object, Hashable]] = {}
+
+    def create_forms(self, problem_set: QNProblemSet) -> List[_CanonicalForm]:
+        topology = problem_set.topology
+        if len(topology.incoming_edge_ids) != 1 or any(
+            len(topology.get_edge_ids_ingoing_to_node(i)) != 1
+            for i in topology.nodes
+        ):
+            return []
+        settings = problem_set.solving_settings
+        all_settings: List[Any] = [
+            *settings.states.values(),
+            *settings.interactions.values(),
+        ]
+        rules = {r for s in all_settings for r in s.conservation_rules}
+        if not all(map(_is_builtin_rule, rules)):
+            return []
+        order_independent = rules.isdisjoint(_OUT_EDGE_ORDER_DEPENDENT_RULES)
+        try:
+            forms = [self.__create_form(problem_set, order_independent)]
+            if all(map(_has_symmetric_projections, all_settings)):
+                forms.append(
+                    self.__create_form(
+                        problem_set, order_independent, reverse=True
+                    )
+                )
+        except TypeError:  # unhashable quantum numbers or impure rules
+            return []
+        return forms
+
+    def __create_form(
+        self,
+        problem_set: QNProblemSet,
+        order_independent: bool,
+        reverse: bool = False,
+    ) -> _CanonicalForm:
+        topology = problem_set.topology
+        codes: Dict[int, int] = {}
+
+        def get_child_edges(node_id: int) -> List[int]:
+            # same order as in which the solver provides them to the rules
+            edge_ids = list(topology.get_edge_ids_outgoing_from_node(node_id))
+            if order_independent:
+                edge_ids.sort(key=codes.__getitem__)
+            return edge_ids
+
+        def compute_code(edge_id: int) -> int:
+            node_id = topology.edges[edge_id].ending_node_id
+            edge_label = self.__create_label(
+                problem_set.initial_facts.states.get(edge_id),
+                problem_set.solving_settings.states.get(edge_id),
+                reverse,
+            )
+            if node_id is None:
+                code = self.__intern((edge_label,))
+            else:
+                for child_id in topology.get_edge_ids_outgoing_from_node(
+                    node_id
+                ):
+                    compute_code(child_id)
+                node_label = self.__create_label(
+                    problem_set.initial_facts.interactions.get(node_id),
+                    problem_set.solving_settings.interactions.get(node_id),
+                    reverse,
+                )
+                child_codes = tuple(codes[i] for i in get_child_edges(node_id))
+                code = self.__intern((edge_label, node_label, child_codes))
+            codes[edge_id] = code
+            return code
+
+        edge_order: List[int] = []
+        node_order: List[int] = []
+
+        def traverse(edge_id: int) -> None:
+            edge_order.append(edge_id)
+            node_id = topology.edges[edge_id].ending_node_id
+            if node_id is not None:
+                node_order.append(node_id)
+                for child_id in get_child_edges(node_id):
+                    traverse(child_id)
+
+        (root_id,) = topology.incoming_edge_ids
+        key = (order_independent, compute_code(root_id))
+        traverse(root_id)
+        return reverse, key, edge_order, node_order
+
+    def __create_label(
+        self,
+        properties: Optional[Dict[Any, Any]],
+        settings: Optional[Any],
+        reverse: bool,
+    ) -> int:
+        if properties is None:
+            properties = {}
+        elif reverse:
+            properties = _reverse_projections(properties)
+        return self.__intern(
+            (frozenset(properties.items()), self.__get_settings_key(settings))
+        )
+
+    def __get_settings_key(self, settings: Optional[Any]) -> Hashable:
+        if settings is None:
+            return None
+        cached = self.__settings_keys.get(id(settings))
+        if cached is not None and cached[0] is settings:
+            return cached[1]
+        key = _create_settings_key(settings)
+        self.__settings_keys[id(settings)] = (settings, key)
+        return key
+
+    def __intern(self, obj: Hashable) -> int:
+        return self.__codes.setdefault(obj, len(self.__codes))
+
+
+def _create_settings_key(settings: Any) -> Hashable:
+    rule_keys = {
+        rule: create_rule_key(rule)
+        for rule in {*settings.conservation_rules, *settings.rule_priorities}
+    }
+    if None in rule_keys.values():
+        raise TypeError("Rules that are not pure cannot be compared")
+    key: Tuple[Hashable, ...] = (
+        frozenset(rule_keys[rule] for rule in settings.conservation_rules),
+        frozenset(
+            (rule_keys[rule], priority)
+            for rule, priority in settings.rule_priorities.items()
+        ),
+        frozenset(
+            (qn_type, tuple(domain))
+            for qn_type, domain in settings.qn_domains.items()
+        ),
+    )
+    if isinstance(settings, NodeSettings):
+        key += (settings.interaction_strength,)
+    return key
+
+
+def _is_builtin_rule(rule: Callable) -> bool:
+    return getattr(rule, "__module__", None) == conservation_rules.__name__
+
+
+def _has_symmetric_projections(settings: Any) -> bool:
+    if not isinstance(settings, (EdgeSettings, NodeSettings)):
+        return False
+    for qn_type, domain in settings.qn_domains.items():
+        if qn_type in _PROJECTIONS:
+            if set(domain) != {-value for value in domain}:
+                return False
+    return True
+
+
+def _reverse_projections(properties: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {
+        qn_type: -value if qn_type in _PROJECTIONS and value else value
+        for qn_type, value in properties.items()
+    }
+
+
+def _relabel_keys(
+    rules: Dict[int, Set[str]], mapping: Dict[int, int]
+) -> Dict[int, Set[str]]:
+    return defaultdict(
+        set, {mapping[i]: set(names) for i, names in rules.items()}
+    )
@@ -0,0 +1,103 @@
+"""Memoize the results of conservation rules.
+
+The conservation rules in :mod:`.conservation_rules` are pure functions of
+their arguments. The solvers evaluate the same rule with the same arguments
+many times, within one `.QNProblemSet` as well as across problem sets, so
+the results are stored in one bounded `RuleCache` per process. Worker
+processes of the `.StateTransitionManager` each have their own cache.
+
+A rule that is not pure can be excluded with `.impure_rule`.
+"""
+
+import inspect
+from typing import Any, Callable, Dict, Hashable, Optional, cast
+
+from attrs import frozen
+
+
+@frozen
+class RuleCacheInfo:
+    """Statistics of a `RuleCache`, see :meth:`RuleCache.info`."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class RuleCache:
+    """Bounded store of conservation rule results.
+
+    Results are stored under a key that identifies the rule and the quantum
+    numbers with which it was evaluated. If the cache contains
+    :code:`max_size` results, the oldest result is removed. A
+    :code:`max_size` of zero disables the cache.
+    """
+
+    def __init__(self, max_size: int = 2**16) -> None:
+        self.__results: Dict[Hashable, bool] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            raise ValueError("Maximum size has to be a non-negative int")
+        self.__max_size = value
+        self.clear()
+
+    def evaluate(self, key: Hashable, rule: Callable[[], bool]) -> bool:
+        """Get the stored result for a key or compute it with the rule."""
+        result = self.__results.get(key)
+        if result is not None:
+            self.__hits += 1
+            return result
+        self.__misses += 1
+        result = rule()
+        if self.__max_size:
+            if len(self.__results) >= self.__max_size:
+                self.__results.pop(next(iter(self.__results)))
+            self.__results[key] = result
+        return result
+
+    def info(self) -> RuleCacheInfo:
+        return RuleCacheInfo(
+            hits=self.__hits,
+            misses=self.__misses,
+            size=len(self.__results),
+            max_size=self.__max_size,
+        )
+
+    def clear(self) -> None:
+        """Remove all results and reset the statistics."""
+        self.__results.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+
+RULE_CACHE = RuleCache()
+"""The `RuleCache` that is used by the solvers of this process."""
+
+
+def create_rule_key(rule: Any) -> Optional[Hashable]:
+    """Identify a rule by its content, or `None` if it cannot be memoized.
+
+    Rules are copied for each problem set, so instances of a rule class are
+    identified by their type and attributes. The same key is used to compare
+    the rules of problem sets in `._equivalence`.
+    """
+    if not getattr(rule, "is_pure", True):
+        return None
+    if inspect.isfunction(rule) or inspect.isclass(rule):
+        return cast(Hashable, rule)
+    try:
+        key = type(rule), frozenset(vars(rule).items())
+        hash(key)
+    except TypeError:  # unhashable attributes or no __dict__
+        return None
+    return key
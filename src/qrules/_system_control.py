@@ -2,7 +2,18 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 import attrs
 
@@ -203,38 +214,55 @@ def remove_duplicate_solutions(
     remove_qns_list: Optional[Set[Type[NodeQuantumNumber]]] = None,
     ignore_qns_list: Optional[Set[Type[NodeQuantumNumber]]] = None,
 ) -> "List[MutableTransition[ParticleWithSpin, InteractionProperties]]":
-    if remove_qns_list is None:
-        remove_qns_list = set()
-    if ignore_qns_list is None:
-        ignore_qns_list = set()
     logging.info("removing duplicate solutions...")
     logging.info(f"removing these qns from graphs: {remove_qns_list}")
     logging.info(f"ignoring qns in graph comparison: {ignore_qns_list}")
+    filtered_solutions = list(
+        iter_unique_solutions(solutions, remove_qns_list, ignore_qns_list)
+    )
+    remove_counter = len(solutions) - len(filtered_solutions)
+    logging.info(f"removed {remove_counter} solutions")
+    return filtered_solutions
+
+
+def iter_unique_solutions(
+    solutions: Iterable[
+        "MutableTransition[ParticleWithSpin, InteractionProperties]"
+    ],
+    remove_qns_list: Optional[Set[Type[NodeQuantumNumber]]] = None,
+    ignore_qns_list: Optional[Set[Type[NodeQuantumNumber]]] = None,
+) -> "Iterator[MutableTransition[ParticleWithSpin, InteractionProperties]]":
+    """Generate solutions that are not equal to one of the earlier solutions.
 
-    filtered_solutions: List[
-        MutableTransition[ParticleWithSpin, InteractionProperties]
-    ] = []
-    remove_counter = 0
+    The quantum numbers in :code:`remove_qns_list` are removed from the
+    solutions that are generated, those in :code:`ignore_qns_list` are ignored
+    in the comparison.
+    """
+    if remove_qns_list is None:
+        remove_qns_list = set()
+    if ignore_qns_list is None:
+        ignore_qns_list = set()
+    ignored_names = {qn_type.__name__ for qn_type in ignore_qns_list}
+    compared_names = tuple(
+        attribute.name
+        for attribute in attrs.fields(InteractionProperties)
+        if attribute.name not in ignored_names
+    )
+    solution_keys: Set[Hashable] = set()
     for sol_graph in solutions:
         sol_graph = _remove_qns_from_graph(sol_graph, remove_qns_list)
-        found_graph = _check_equal_ignoring_qns(
-            sol_graph, filtered_solutions, ignore_qns_list
-        )
-        if found_graph is None:
-            filtered_solutions.append(sol_graph)
-        else:
-            # check if found solution also has the prefactors
-            # if not overwrite them
-            remove_counter += 1
-
-    logging.info(f"removed {remove_counter} solutions")
-    return filtered_solutions
+        key = _create_solution_key(sol_graph, compared_names)
+        if key not in solution_keys:
+            solution_keys.add(key)
+            yield sol_graph
 
 
 def _remove_qns_from_graph(  # pylint: disable=too-many-branches
     graph: "MutableTransition[ParticleWithSpin, InteractionProperties]",
     qn_list: Set[Type[NodeQuantumNumber]],
 ) -> "MutableTransition[ParticleWithSpin, InteractionProperties]":
+    if not qn_list:
+        return graph
     new_interactions = {}
     for node_id in graph.topology.nodes:
         interactions = graph.interactions[node_id]
@@ -245,49 +273,28 @@ def _remove_qns_from_graph(  # pylint: disable=too-many-branches
     return attrs.evolve(graph, interactions=new_interactions)
 
 
-def _check_equal_ignoring_qns(
-    ref_graph: MutableTransition,
-    solutions: List[MutableTransition],
-    ignored_qn_list: Set[Type[NodeQuantumNumber]],
-) -> Optional[MutableTransition]:
-    """Define equal operator for graphs, ignoring certain quantum numbers."""
-    if not isinstance(ref_graph, MutableTransition):
-        raise TypeError("Reference graph has to be of type MutableTransition")
-    found_graph = None
-    interaction_comparator = NodePropertyComparator(ignored_qn_list)
-    for graph in solutions:
-        if isinstance(graph, MutableTransition):
-            if graph.compare(
-                ref_graph,
-                state_comparator=lambda e1, e2: e1 == e2,
-                interaction_comparator=interaction_comparator,
-            ):
-                found_graph = graph
-                break
-    return found_graph
-
-
-class NodePropertyComparator:
-    """Functor for comparing node properties in two graphs."""
-
-    def __init__(
-        self,
-        ignored_qn_list: Optional[Set[Type[NodeQuantumNumber]]] = None,
-    ) -> None:
-        self.__ignored_qn_list = ignored_qn_list if ignored_qn_list else set()
+def _create_solution_key(
+    graph: "MutableTransition[ParticleWithSpin, InteractionProperties]",
+    interaction_attributes: Tuple[str, ...],
+) -> Hashable:
+    """Create a hashable representation of a solution.
 
-    def __call__(
-        self,
-        interactions1: InteractionProperties,
-        interactions2: InteractionProperties,
-    ) -> bool:
-        return attrs.evolve(
-            interactions1,
-            **{x.__name__: None for x in self.__ignored_qn_list},
-        ) == attrs.evolve(
-            interactions2,
-            **{x.__name__: None for x in self.__ignored_qn_list},
-        )
+    Two solutions have the same key if they have the same `.Topology`, the
+    same states on each edge and the same values for the given
+    `.InteractionProperties` attributes on each node.
+    """
+    topology = graph.topology
+    return (
+        topology,
+        tuple(graph.states[i] for i in sorted(topology.edges)),
+        tuple(
+            tuple(
+                getattr(graph.interactions[i], name)
+                for name in interaction_attributes
+            )
+            for i in sorted(topology.nodes)
+        ),
+    )
 
 
 def filter_graphs(
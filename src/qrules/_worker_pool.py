@@ -0,0 +1,184 @@
+"""Worker processes that solve `.QNProblemSet` instances in parallel.
+
+The `.StateTransitionManager` sends its problem sets to a
+`multiprocessing.pool.Pool`. Starting such a pool and sending the allowed
+intermediate particles to the workers is expensive compared to solving a
+small reaction, so this module keeps track of one pool that can be reused for
+all interaction strength groups and, if `.PersistentWorkerPool` is enabled,
+across successive calls to :meth:`.StateTransitionManager.find_solutions`.
+
+The solver settings are pickled only once per call in the main process. The
+resulting `bytes` are identified by a digest and installed in each worker by
+the initializer of the pool, so that the tasks only have to carry the digest
+and a problem set. A persistent pool is started again if it was initialized
+with a different context.
+
+The workers send the statistics that they record for each problem set back
+with its result, so that they can be merged into the `.RuleStatistics` of the
+main process.
+"""
+
+import atexit
+import hashlib
+import pickle  # noqa: S403
+from contextlib import contextmanager
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
+from typing import Iterator, List, Optional, Tuple, Type
+
+from attrs import evolve, frozen
+
+from .profiling import ProblemSetProfile, solve_with_profile
+from .settings import PersistentWorkerPool
+from .solving import (
+    GraphEdgePropertyMap,
+    QNProblemSet,
+    QNResult,
+    RuleStatistics,
+    Solver,
+)
+
+
+@frozen
+class SolvingContext:
+    """Everything a worker needs to create a `.Solver`.
+
+    Each worker orders the rules with its own copy of the
+    :code:`rule_statistics`, to which it adds the statistics that it records
+    itself. It also sends these statistics back for each problem set that it
+    solves. With :code:`profile`, the workers send back a
+    `.ProblemSetProfile` for each problem set as well.
+    """
+
+    solver_type: Type[Solver]
+    allowed_intermediate_particles: List[GraphEdgePropertyMap]
+    use_particle_table: bool = False
+    rule_statistics: Optional[RuleStatistics] = None
+    profile: bool = False
+
+    def create_solver(self) -> Solver:
+        return self.solver_type(  # type: ignore[call-arg]
+            self.allowed_intermediate_particles,
+            use_particle_table=self.use_particle_table,
+            rule_statistics=self.rule_statistics,
+        )
+
+
+@frozen
+class SerializedContext:
+    """A pickled `SolvingContext` that is identified by its digest.
+
+    The main process merges the statistics of the workers into its
+    :code:`rule_statistics` after each call. These changes do not change the
+    digest, so that a persistent pool does not have to be started again. Its
+    workers keep ordering the rules with the statistics they record
+    themselves.
+    """
+
+    digest: str
+    payload: bytes
+
+    @classmethod
+    def from_context(cls, context: SolvingContext) -> "SerializedContext":
+        payload = pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL)
+        identity = payload
+        if context.rule_statistics is not None:
+            identity = pickle.dumps(
+                evolve(context, rule_statistics=RuleStatistics()),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        digest = hashlib.sha256(identity).hexdigest()
+        return cls(digest, payload)
+
+
+_WORKER_CONTEXT: Optional[Tuple[str, SolvingContext, Solver]] = None
+
+
+def install_context(context: SerializedContext) -> None:
+    """Create the `.Solver` of a worker process, see `acquire_pool`."""
+    global _WORKER_CONTEXT  # pylint: disable=global-statement
+    solving_context: SolvingContext = pickle.loads(  # noqa: S301
+        context.payload
+    )
+    solver = solving_context.create_solver()
+    _WORKER_CONTEXT = context.digest, solving_context, solver
+
+
+def solve_problem_set(
+    task: Tuple[str, QNProblemSet]
+) -> Tuple[
+    QNProblemSet,
+    QNResult,
+    Optional[ProblemSetProfile],
+    Optional[RuleStatistics],
+]:
+    """Solve a `.QNProblemSet` within a worker process.
+
+    The task consists of the digest of a `SerializedContext` and the problem
+    set. The digest has to be the one of the context that the pool installed
+    in the worker. Next to the result, the worker returns a
+    `.ProblemSetProfile` if the context asks for it and the
+    `.RuleStatistics` of this problem set if the context has
+    :code:`rule_statistics`.
+    """
+    digest, problem_set = task
+    if _WORKER_CONTEXT is None or _WORKER_CONTEXT[0] != digest:
+        raise RuntimeError(
+            f"Worker process has not been initialized with context {digest}"
+        )
+    _, solving_context, solver = _WORKER_CONTEXT
+    profile = None
+    if solving_context.profile:
+        result, profile = solve_with_profile(solver, problem_set)
+    else:
+        result = solver.find_solutions(problem_set)
+    statistics = None
+    if solving_context.rule_statistics is not None:
+        statistics = RuleStatistics()
+        statistics.record(solver.scoresheet)  # type: ignore[attr-defined]
+    return problem_set, result, profile, statistics
+
+
+_PERSISTENT_POOL: Optional[PoolType] = None
+_PERSISTENT_POOL_KEY: Optional[Tuple[int, str]] = None
+
+
+@contextmanager
+def acquire_pool(
+    processes: int, context: SerializedContext
+) -> Iterator[PoolType]:
+    """Provide a worker pool of which the workers have installed a context.
+
+    Each worker process unpickles the :code:`context` once, when it starts.
+    If `.PersistentWorkerPool` is enabled, the pool is kept alive after
+    leaving the context, so that it can be reused for the same number of
+    processes and the same context. Otherwise, the pool is terminated when
+    leaving the context.
+    """
+    global _PERSISTENT_POOL, _PERSISTENT_POOL_KEY  # pylint: disable=global-statement
+    if not PersistentWorkerPool.get():
+        shutdown()
+        with _create_pool(processes, context) as pool:
+            yield pool
+        return
+    key = processes, context.digest
+    if _PERSISTENT_POOL is None or _PERSISTENT_POOL_KEY != key:
+        shutdown()
+        _PERSISTENT_POOL = _create_pool(processes, context)
+        _PERSISTENT_POOL_KEY = key
+    yield _PERSISTENT_POOL
+
+
+def _create_pool(processes: int, context: SerializedContext) -> PoolType:
+    return Pool(processes, initializer=install_context, initargs=(context,))
+
+
+@atexit.register
+def shutdown() -> None:
+    """Terminate the persistent worker pool, if there is one."""
+    global _PERSISTENT_POOL, _PERSISTENT_POOL_KEY  # pylint: disable=global-statement
+    if _PERSISTENT_POOL is not None:
+        _PERSISTENT_POOL.terminate()
+        _PERSISTENT_POOL.join()
+    _PERSISTENT_POOL = None
+    _PERSISTENT_POOL_KEY = None
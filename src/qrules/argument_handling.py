@@ -10,10 +10,9 @@ from typing import (
     Any,
     Callable,
     Dict,
-    Generic,
+    FrozenSet,
     List,
     Optional,
-    Sequence,
     Set,
     Tuple,
     Type,
@@ -64,221 +63,205 @@ def _is_node_quantum_number(qn_type: Any) -> bool:
     return qn_type in NodeQuantumNumber.__args__  # type: ignore[attr-defined]
 
 
-class _CompositeArgumentCheck:
-    def __init__(
-        self,
-        class_field_types: Union[
-            List[EdgeQuantumNumber], List[NodeQuantumNumber]
-        ],
-    ) -> None:
-        self.__class_field_types = class_field_types
-
-    def __call__(
-        self,
-        props: GraphElementPropertyMap,
-    ) -> bool:
-        return all(
-            class_field_type in props
-            for class_field_type in self.__class_field_types
+def _create_requirements_check(
+    input_type: type,
+) -> Callable[[GraphElementPropertyMap], bool]:
+    if attrs.has(input_type):
+        class_field_types = tuple(
+            class_field.type
+            for class_field in attrs.fields(input_type)
+            if not _is_optional(class_field.type)
         )
 
+        def check_composite(props: GraphElementPropertyMap) -> bool:
+            for class_field_type in class_field_types:
+                if class_field_type not in props:
+                    return False
+            return True
 
-def _direct_qn_check(
-    qn_type: Union[Type[EdgeQuantumNumber], Type[NodeQuantumNumber]]
-) -> Callable[[GraphElementPropertyMap], bool]:
-    def wrapper(props: GraphElementPropertyMap) -> bool:
-        return qn_type in props
+        return check_composite
 
-    return wrapper
+    def check_qn(props: GraphElementPropertyMap) -> bool:
+        return input_type in props
 
+    return check_qn
 
-def _sequence_input_check(func: Callable) -> Callable[[Sequence], bool]:
-    def wrapper(states_list: Sequence[Any]) -> bool:
-        if not isinstance(states_list, (list, tuple)):
-            raise TypeError("Rule evaluated with invalid argument type...")
 
-        return all(func(x) for x in states_list)
+def _create_value_extractor(
+    field_type: type,
+) -> Callable[[GraphElementPropertyMap], Any]:
+    optional = _is_optional(field_type)
+    qn_type = field_type
+    if optional:
+        qn_type = field_type.__args__[0]  # type: ignore[attr-defined]
+    converter: Callable[..., Any] = qn_type
+    if getattr(qn_type, "__supertype__", None) == Parity:
+        converter = Parity
 
-    return wrapper
+    def extract(props: GraphElementPropertyMap) -> Any:
+        value = props.get(qn_type) if optional else props[qn_type]
+        if value is None:
+            return None
+        return converter(value)
 
+    return extract
 
-def _check_all_arguments(checks: List[Callable]) -> Callable[..., bool]:
-    def wrapper(*args: Any) -> bool:
-        return all(check(arg) for check, arg in zip(checks, args))
 
-    return wrapper
+def _create_composite_builder(
+    class_type: type,
+) -> Callable[[GraphElementPropertyMap], Any]:
+    class_fields = attrs.fields(class_type)
+    extractors = tuple(_create_value_extractor(f.type) for f in class_fields)
+    if all(f.init and not f.kw_only for f in class_fields):
 
+        def build_positional(props: GraphElementPropertyMap) -> Any:
+            return class_type(*[extract(props) for extract in extractors])
 
-class _ValueExtractor(Generic[_ElementType]):
-    def __init__(self, obj_type: Optional[Type[_ElementType]]) -> None:
-        self.__obj_type: Type[_ElementType] = obj_type  # type: ignore[assignment]
-        self.__function = self.__extract
+        return build_positional
+    names = tuple(f.name for f in class_fields)
 
-        if _is_optional(obj_type):
-            self.__obj_type = obj_type.__args__[0]  # type: ignore[union-attr]
-            self.__function = self.__optional_extract  # type: ignore[assignment]
+    def build(props: GraphElementPropertyMap) -> Any:
+        return class_type(
+            **{
+                name: extract(props)
+                for name, extract in zip(names, extractors)
+            }
+        )
 
-    def __call__(
-        self, props: GraphElementPropertyMap[_ElementType]
-    ) -> Optional[_ElementType]:
-        return self.__function(props)
+    return build
 
-    def __optional_extract(
-        self, props: GraphElementPropertyMap[_ElementType]
-    ) -> Optional[_ElementType]:
-        if self.__obj_type in props:
-            return self.__extract(props)
 
-        return None
+def _create_argument_builder(input_type: type) -> Callable[[Any], Any]:
+    if attrs.has(input_type):
+        return _create_composite_builder(input_type)
+    if _is_edge_quantum_number(input_type) or _is_node_quantum_number(
+        input_type
+    ):
+        return _create_value_extractor(input_type)
+    raise TypeError(
+        f"Quantum number type {input_type} is not supported."
+        " Has to be of type Edge/NodeQuantumNumber."
+    )
 
-    def __extract(
-        self, props: GraphElementPropertyMap[_ElementType]
-    ) -> _ElementType:
-        value = props[self.__obj_type]
-        if value is None:
-            return None
-        if (
-            "__supertype__" in self.__obj_type.__dict__
-            and self.__obj_type.__supertype__ == Parity  # type: ignore[attr-defined]
-        ):
-            return self.__obj_type.__supertype__(value)  # type: ignore[attr-defined]
-        return self.__obj_type(value)  # type: ignore[call-arg]
 
+def _check_sequence(states_list: Any) -> None:
+    if not isinstance(states_list, (list, tuple)):
+        raise TypeError("Rule evaluated with invalid argument type...")
 
-class _CompositeArgumentCreator:
-    def __init__(self, class_type: type) -> None:
-        self.__class_type = class_type
-        self.__extractors = {
-            class_field.name: _ValueExtractor[EdgeQuantumNumber](
-                class_field.type
-            )
-            if _is_edge_quantum_number(class_field.type)
-            else _ValueExtractor[NodeQuantumNumber](class_field.type)
-            for class_field in attrs.fields(class_type)
-        }
-
-    def __call__(
-        self,
-        props: GraphElementPropertyMap,
-    ) -> Any:
-        return self.__class_type(
-            **{
-                arg_name: extractor(props)  # type: ignore[operator]
-                for arg_name, extractor in self.__extractors.items()
-            }
-        )
 
+def _compile_requirements_check(
+    argument_types: Tuple[type, ...],
+) -> Callable[..., bool]:
+    checks = []
+    for input_type in argument_types:
+        if _is_sequence_type(input_type):
+            item_type = input_type.__args__[0]  # type: ignore[attr-defined]
+            checks.append((True, _create_requirements_check(item_type)))
+        else:
+            checks.append((False, _create_requirements_check(input_type)))
 
-def _sequence_arg_builder(func: Callable) -> Callable[[Sequence], List[Any]]:
-    def wrapper(states_list: Sequence[Any]) -> List[Any]:
-        if not isinstance(states_list, (list, tuple)):
-            raise TypeError("Rule evaluated with invalid argument type...")
+    def check_all_arguments(*args: Any) -> bool:
+        for (is_list, check), arg in zip(checks, args):
+            if is_list:
+                _check_sequence(arg)
+                for props in arg:
+                    if not check(props):
+                        return False
+            elif not check(arg):
+                return False
+        return True
 
-        return [func(x) for x in states_list if x]
+    return check_all_arguments
 
-    return wrapper
 
+def _compile_argument_builder(
+    argument_types: Tuple[type, ...],
+) -> Callable[..., List[Any]]:
+    builders = []
+    for input_type in argument_types:
+        if _is_sequence_type(input_type):
+            item_type = input_type.__args__[0]  # type: ignore[attr-defined]
+            builders.append((True, _create_argument_builder(item_type)))
+        else:
+            builders.append((False, _create_argument_builder(input_type)))
 
-def _build_all_arguments(checks: List[Callable]) -> Callable:
-    def wrapper(*args: Any) -> List[Any]:
-        return [check(arg) for check, arg in zip(checks, args) if arg]
+    def build_all_arguments(*args: Any) -> List[Any]:
+        arguments = []
+        for (is_list, build), arg in zip(builders, args):
+            if not arg:
+                continue
+            if is_list:
+                _check_sequence(arg)
+                arguments.append([build(props) for props in arg if props])
+            else:
+                arguments.append(build(arg))
+        return arguments
 
-    return wrapper
+    return build_all_arguments
 
 
-class RuleArgumentHandler:
-    def __init__(self) -> None:
-        self.__rule_to_requirements_check: Dict[Rule, Callable] = {}
-        self.__rule_to_argument_builder: Dict[Rule, Callable] = {}
+_RULE_ANNOTATIONS: Dict[Any, Tuple[type, ...]] = {}
+"""Type annotations of the arguments of rules, see `_get_annotations`."""
 
-    def __verify(self, rule_annotations: list) -> None:
-        pass
+_COMPILED_RULES: Dict[
+    Tuple[type, ...], Tuple[Callable[..., bool], Callable[..., List[Any]]]
+] = {}
+"""Requirements checks and argument builders for argument type annotations.
 
-    @staticmethod
-    def __create_requirements_check(
-        argument_types: List[type],
-    ) -> Callable:
-        individual_argument_checkers = []
-        for input_type in argument_types:
-            is_list = False
-            qn_type = input_type
-            if _is_sequence_type(input_type):
-                qn_type = input_type.__args__[0]  # type: ignore[attr-defined]
-                is_list = True
-
-            if attrs.has(qn_type):
-                class_field_types = [
-                    class_field.type
-                    for class_field in attrs.fields(qn_type)
-                    if not _is_optional(class_field.type)
-                ]
-                qn_check_function: Callable[
-                    ..., bool
-                ] = _CompositeArgumentCheck(
-                    class_field_types  # type: ignore[arg-type]
-                )
-            else:
-                qn_check_function = _direct_qn_check(qn_type)
+Rules are copied for each problem set and a `RuleArgumentHandler` is created
+for each solver, so the compiled functions are shared by all handlers.
+"""
 
-            if is_list:
-                qn_check_function = _sequence_input_check(qn_check_function)
-
-            individual_argument_checkers.append(qn_check_function)
-
-        return _check_all_arguments(individual_argument_checkers)
-
-    @staticmethod
-    def __create_argument_builder(
-        argument_types: List[type],
-    ) -> Callable:
-        individual_argument_builders = []
-        for input_type in argument_types:
-            is_list = False
-            qn_type = input_type
-            if _is_sequence_type(input_type):
-                qn_type = input_type.__args__[0]  # type: ignore[attr-defined]
-                is_list = True
-
-            if attrs.has(qn_type):
-                arg_builder: Callable[..., Any] = _CompositeArgumentCreator(
-                    qn_type
+
+def _get_annotations(rule: Rule) -> Tuple[type, ...]:
+    """Get the type annotations of the arguments of a rule.
+
+    Instances of the same rule class have the same annotations, so these are
+    cached per class. Functions are cached by themselves. Other callables,
+    such as a `functools.partial` or a bound method, share their type with
+    callables that have different signatures, so their annotations are not
+    cached.
+    """
+    key: Any = None
+    if inspect.isfunction(rule) or inspect.isclass(rule):
+        key = rule
+    elif inspect.isfunction(getattr(type(rule), "__call__", None)):
+        key = type(rule)
+    annotations = _RULE_ANNOTATIONS.get(key)
+    if annotations is None:
+        rule_func_signature = inspect.signature(rule)
+        if not rule_func_signature.return_annotation:
+            raise TypeError(
+                f"missing return type annotation for rule {str(rule)}"
+            )
+        rule_annotations = []
+        for par in rule_func_signature.parameters.values():
+            if not par.annotation:
+                raise TypeError(
+                    f"missing type annotations for argument {par.name}"
+                    f" of rule {str(rule)}"
                 )
-            else:
-                if _is_edge_quantum_number(qn_type):
-                    arg_builder = _ValueExtractor[EdgeQuantumNumber](qn_type)
-                elif _is_node_quantum_number(qn_type):
-                    arg_builder = _ValueExtractor[NodeQuantumNumber](qn_type)
-                else:
-                    raise TypeError(
-                        f"Quantum number type {qn_type} is not supported."
-                        " Has to be of type Edge/NodeQuantumNumber."
-                    )
+            rule_annotations.append(par.annotation)
+        annotations = tuple(rule_annotations)
+        if key is not None:
+            _RULE_ANNOTATIONS[key] = annotations
+    return annotations
 
-            if is_list:
-                arg_builder = _sequence_arg_builder(arg_builder)
 
-            individual_argument_builders.append(arg_builder)
+class RuleArgumentHandler:
+    def __init__(self) -> None:
+        self.__rule_to_requirements_check: Dict[Rule, Callable] = {}
+        self.__rule_to_argument_builder: Dict[Rule, Callable] = {}
 
-        return _build_all_arguments(individual_argument_builders)
+    def __verify(self, rule_annotations: Tuple[type, ...]) -> None:
+        pass
 
     def register_rule(self, rule: Rule) -> Tuple[Callable, Callable]:
         if (
             rule not in self.__rule_to_requirements_check
             or rule not in self.__rule_to_argument_builder
         ):
-            rule_annotations = []
-            rule_func_signature = inspect.signature(rule)
-            if not rule_func_signature.return_annotation:
-                raise TypeError(
-                    f"missing return type annotation for rule {str(rule)}"
-                )
-            for par in rule_func_signature.parameters.values():
-                if not par.annotation:
-                    raise TypeError(
-                        f"missing type annotations for argument {par.name}"
-                        f" of rule {str(rule)}"
-                    )
-                rule_annotations.append(par.annotation)
+            rule_annotations = _get_annotations(rule)
 
             # check type annotations are legal
             try:
@@ -288,15 +271,17 @@ class RuleArgumentHandler:
                     f"rule {str(rule)}: {str(exception)}"
                 ) from exception
 
-            # then create requirements check function and add to dict
-            self.__rule_to_requirements_check[
-                rule
-            ] = self.__create_requirements_check(rule_annotations)
-
-            # then create arguments builder function and add to dict
-            self.__rule_to_argument_builder[
-                rule
-            ] = self.__create_argument_builder(rule_annotations)
+            compiled = _COMPILED_RULES.get(rule_annotations)
+            if compiled is None:
+                compiled = (
+                    _compile_requirements_check(rule_annotations),
+                    _compile_argument_builder(rule_annotations),
+                )
+                _COMPILED_RULES[rule_annotations] = compiled
+            (
+                self.__rule_to_requirements_check[rule],
+                self.__rule_to_argument_builder[rule],
+            ) = compiled
 
         return (
             self.__rule_to_requirements_check[rule],
@@ -307,20 +292,29 @@ class RuleArgumentHandler:
 def get_required_qns(
     rule: Rule,
 ) -> Tuple[Set[Type[EdgeQuantumNumber]], Set[Type[NodeQuantumNumber]]]:
-    rule_annotations = []
-    for par in inspect.signature(rule).parameters.values():
-        if not par.annotation:
-            raise TypeError(f"missing type annotations for rule {str(rule)}")
-        rule_annotations.append(par.annotation)
+    rule_annotations = _get_annotations(rule)
+    required_qns = _REQUIRED_QNS.get(rule_annotations)
+    if required_qns is None:
+        required_qns = _find_required_qns(rule_annotations)
+        _REQUIRED_QNS[rule_annotations] = required_qns
+    required_edge_qns, required_node_qns = required_qns
+    return set(required_edge_qns), set(required_node_qns)
+
+
+_RequiredQNs = Tuple[
+    FrozenSet[Type[EdgeQuantumNumber]], FrozenSet[Type[NodeQuantumNumber]]
+]
+_REQUIRED_QNS: Dict[Tuple[type, ...], _RequiredQNs] = {}
+
 
+def _find_required_qns(rule_annotations: Tuple[type, ...]) -> _RequiredQNs:
     required_edge_qns: Set[Type[EdgeQuantumNumber]] = set()
     required_node_qns: Set[Type[NodeQuantumNumber]] = set()
 
-    arg_counter = 0
     for input_type in rule_annotations:
         class_type = input_type
         if _is_sequence_type(input_type):
-            class_type = input_type.__args__[0]
+            class_type = input_type.__args__[0]  # type: ignore[attr-defined]
 
         if attrs.has(class_type):
             for class_field in attrs.fields(class_type):
@@ -338,6 +332,5 @@ def get_required_qns(
                 required_edge_qns.add(class_type)
             else:
                 required_node_qns.add(class_type)
-        arg_counter += 1
 
-    return (required_edge_qns, required_node_qns)
+    return frozenset(required_edge_qns), frozenset(required_node_qns)
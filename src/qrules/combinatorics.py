@@ -8,7 +8,7 @@ extract these edge and node properties.
 import sys
 from collections import OrderedDict
 from copy import deepcopy
-from itertools import permutations
+from itertools import permutations, product
 from typing import (
     Any,
     Callable,
@@ -75,6 +75,14 @@ class _KinematicRepresentation:
             f"Cannot compare {type(self).__name__} with {type(other).__name__}"
         )
 
+    def __hash__(self) -> int:
+        return hash(
+            (
+                _to_hashable_groups(self.initial_state),
+                _to_hashable_groups(self.final_state),
+            )
+        )
+
     def __repr__(self) -> str:
         return (
             f"{type(self).__name__}("
@@ -159,6 +167,14 @@ class _KinematicRepresentation:
         )
 
 
+def _to_hashable_groups(
+    groups: Optional[List[List[Any]]],
+) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    if groups is None:
+        return None
+    return tuple(map(tuple, groups))
+
+
 def _get_kinematic_representation(
     topology: Topology,
     initial_facts: Mapping[int, StateWithSpins],
@@ -230,7 +246,7 @@ def _get_kinematic_representation(
     )
 
 
-def create_initial_facts(  # pylint: disable=too-many-locals
+def create_initial_facts(
     topology: Topology,
     particle_db: ParticleCollection,
     initial_state: Sequence[StateDefinition],
@@ -239,6 +255,33 @@ def create_initial_facts(  # pylint: disable=too-many-locals
         Union[List[List[List[str]]], List[List[str]], List[str]]
     ] = None,
 ) -> List[InitialFacts]:
+    return list(
+        iter_initial_facts(
+            topology,
+            particle_db,
+            initial_state,
+            final_state,
+            final_state_groupings,
+        )
+    )
+
+
+def iter_initial_facts(
+    topology: Topology,
+    particle_db: ParticleCollection,
+    initial_state: Sequence[StateDefinition],
+    final_state: Sequence[StateDefinition],
+    final_state_groupings: Optional[
+        Union[List[List[List[str]]], List[List[str]], List[str]]
+    ] = None,
+) -> Generator[InitialFacts, None, None]:
+    """Generate the `InitialFacts` of `create_initial_facts` one by one.
+
+    The combinations of spin projections grow exponentially with the number
+    of initial and final states, so they are only created once they are
+    requested.
+    """
+
     def embed_in_list(some_list: List[Any]) -> List[List[Any]]:
         if not isinstance(some_list[0], list):
             return [some_list]
@@ -260,15 +303,12 @@ def create_initial_facts(  # pylint: disable=too-many-locals
         final_state=final_state,
         allowed_kinematic_groupings=allowed_kinematic_groupings,
     )
-    edge_initial_facts: List[InitialFacts] = []
     for kinematic_permutation in kinematic_permutation_graphs:
         spin_permutations = _generate_spin_permutations(
             kinematic_permutation, particle_db
         )
-        edge_initial_facts.extend(
-            [MutableTransition(topology, states=x) for x in spin_permutations]
-        )
-    return edge_initial_facts
+        for states in spin_permutations:
+            yield MutableTransition(topology, states=states)
 
 
 def _generate_kinematic_permutations(
@@ -310,7 +350,7 @@ def _generate_kinematic_permutations(
     )
 
     initial_facts_combinations: List[Dict[int, StateWithSpins]] = []
-    kinematic_representations: List[_KinematicRepresentation] = []
+    kinematic_representations: Set[_KinematicRepresentation] = set()
     for permutation in _generate_outer_edge_permutations(
         topology,
         initial_state_with_projections,
@@ -323,7 +363,7 @@ def _generate_kinematic_permutations(
             continue
         if not is_allowed_grouping(kinematic_representation):
             continue
-        kinematic_representations.append(kinematic_representation)
+        kinematic_representations.add(kinematic_representation)
         initial_facts_combinations.append(permutation)
 
     return initial_facts_combinations
@@ -361,8 +401,13 @@ def _generate_outer_edge_permutations(
 ) -> Generator[Dict[int, StateWithSpins], None, None]:
     initial_state_ids = list(topology.incoming_edge_ids)
     final_state_ids = list(topology.outgoing_edge_ids)
-    for initial_state_permutation in permutations(initial_state):
-        for final_state_permutation in permutations(final_state):
+    final_state_permutations = list(
+        _generate_distinct_permutations(final_state)
+    )
+    for initial_state_permutation in _generate_distinct_permutations(
+        initial_state
+    ):
+        for final_state_permutation in final_state_permutations:
             yield dict(
                 zip(
                     initial_state_ids + final_state_ids,
@@ -371,36 +416,66 @@ def _generate_outer_edge_permutations(
             )
 
 
+def _generate_distinct_permutations(
+    states: Sequence[StateWithSpins],
+) -> Generator[Tuple[StateWithSpins, ...], None, None]:
+    """Generate the permutations of states that are not equal to each other.
+
+    Identical states are interchangeable, so only the first of the
+    permutations that :func:`itertools.permutations` would generate for each
+    distinct ordering is yielded. The order of the yielded permutations is
+    the same as in :func:`itertools.permutations`.
+
+    >>> states = [("pi0", [0]), ("gamma", [-1, 1]), ("pi0", [0])]
+    >>> for permutation in _generate_distinct_permutations(states):
+    ...     print([name for name, _ in permutation])
+    ['pi0', 'gamma', 'pi0']
+    ['pi0', 'pi0', 'gamma']
+    ['gamma', 'pi0', 'pi0']
+    """
+    representatives: List[StateWithSpins] = []
+    state_ids: List[int] = []
+    for state in states:
+        if state in representatives:
+            state_ids.append(representatives.index(state))
+        else:
+            state_ids.append(len(representatives))
+            representatives.append(state)
+
+    remaining = [True] * len(states)
+    permutation: List[StateWithSpins] = []
+
+    def extend_permutation() -> Generator[
+        Tuple[StateWithSpins, ...], None, None
+    ]:
+        if len(permutation) == len(states):
+            yield tuple(permutation)
+            return
+        tried_state_ids = set()
+        for i, state in enumerate(states):
+            if not remaining[i] or state_ids[i] in tried_state_ids:
+                continue
+            tried_state_ids.add(state_ids[i])
+            remaining[i] = False
+            permutation.append(state)
+            yield from extend_permutation()
+            permutation.pop()
+            remaining[i] = True
+
+    yield from extend_permutation()
+
+
 def _generate_spin_permutations(
     initial_facts: Dict[int, StateWithSpins],
     particle_db: ParticleCollection,
-) -> List[Dict[int, ParticleWithSpin]]:
-    def populate_edge_with_spin_projections(
-        permutation: Dict[int, ParticleWithSpin],
-        edge_id: int,
-        state: StateWithSpins,
-    ) -> List[Dict[int, ParticleWithSpin]]:
-        particle_name, spin_projections = state
-        particle = particle_db[particle_name]
-        new_permutations = []
-        for projection in spin_projections:
-            temp_permutation = deepcopy(permutation)
-            temp_permutation.update({edge_id: (particle, projection)})
-            new_permutations.append(temp_permutation)
-        return new_permutations
-
-    initial_facts_permutations: List[Dict[int, ParticleWithSpin]] = [{}]
-    for edge_id, state in initial_facts.items():
-        temp_permutations = initial_facts_permutations
-        initial_facts_permutations = []
-        for temp_permutation in temp_permutations:
-            initial_facts_permutations.extend(
-                populate_edge_with_spin_projections(
-                    temp_permutation, edge_id, state
-                )
-            )
-
-    return initial_facts_permutations
+) -> Generator[Dict[int, ParticleWithSpin], None, None]:
+    edge_ids = list(initial_facts)
+    states_per_edge = [
+        [(particle_db[particle_name], projection) for projection in spins]
+        for particle_name, spins in initial_facts.values()
+    ]
+    for states in product(*states_per_edge):
+        yield dict(zip(edge_ids, states))
 
 
 def __get_initial_state_edge_ids(
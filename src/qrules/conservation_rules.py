@@ -39,6 +39,10 @@ could be created in the form of `~typing.Tuple` instead of `~typing.List`.
 For additive quantum numbers, the decorator `additive_quantum_number_rule`
 can be used to automatically generate the appropriate behavior.
 
+The solvers memoize the results of rules, so a rule has to be a pure function
+of its arguments. Rules that do not fulfill this requirement can be marked
+with `impure_rule`.
+
 
 The module is therefore strongly typed (both
 for the reader of the code and for type checking with :doc:`mypy
@@ -51,7 +55,17 @@ defined to provide type checks on `.parity_conservation_helicity`.
 import sys
 from copy import deepcopy
 from functools import reduce
-from typing import Any, Callable, List, Optional, Set, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from attrs import define, field, frozen
 from attrs.converters import optional
@@ -98,6 +112,19 @@ class ConservationRule(Protocol):
         ...
 
 
+_RuleType = TypeVar("_RuleType")  # pylint: disable=invalid-name
+
+
+def impure_rule(rule: _RuleType) -> _RuleType:
+    """Mark a rule of which the result is not memoized by the solvers.
+
+    Use this decorator for rules (functions or classes) of which the result
+    does not only depend on their arguments.
+    """
+    rule.is_pure = False  # type: ignore[attr-defined]
+    return rule
+
+
 # Note a generic would be more fitting here. However the type annotations of
 # __call__ method in a concrete version of the generic are still containing the
 # TypeVar types. See https://github.com/python/typing/issues/762
@@ -6,9 +6,11 @@ and from disk, so that they can be used by external packages, or just to store
 (cache) the state of the system.
 """
 
+import importlib
 import json
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import attrs
 import yaml
@@ -16,11 +18,41 @@ import yaml
 from qrules.particle import Particle, ParticleCollection
 from qrules.topology import Topology
 
-from . import _dict, _dot
+if TYPE_CHECKING:
+    from ._binary import MappedReactionInfo
+    from ._cache import ParticleCache, ReactionCache
+
+_LAZY_ATTRIBUTES = {
+    "MappedReactionInfo": "_binary",
+    "ParticleCache": "_cache",
+    "ReactionCache": "_cache",
+}
+"""Attributes that are only imported from their submodule when accessed.
+
+Their submodules import `.transition`, so importing them eagerly would make
+:code:`import qrules.io` as slow as importing the solvers.
+"""
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):  # module __getattr__ requires PEP 562
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
 
 
 def asdict(instance: object) -> dict:
-    # pylint: disable=protected-access
+    # pylint: disable=import-outside-toplevel,protected-access
+    from . import _dict
+
     if isinstance(instance, ParticleCollection):
         return _dict.from_particle_collection(instance)
     if attrs.has(type(instance)):
@@ -31,12 +63,15 @@ def asdict(instance: object) -> dict:
 
 
 def fromdict(definition: dict) -> object:
+    # pylint: disable=import-outside-toplevel
+    from . import _dict
+
     keys = set(definition.keys())
     if __REQUIRED_PARTICLE_FIELDS <= keys:
         return _dict.build_particle(definition)
     if keys == {"particles"}:
         return _dict.build_particle_collection(definition)
-    if keys == {"transitions", "formalism"}:
+    if keys in ({"transitions", "formalism"}, __REACTION_INFO_FIELDS):
         return _dict.build_reaction_info(definition)
     if keys == {"topology", "states", "interactions"}:
         return _dict.build_transition(definition)
@@ -53,6 +88,7 @@ __REQUIRED_PARTICLE_FIELDS = {
 __REQUIRED_TOPOLOGY_FIELDS = {
     field.name for field in attrs.fields(Topology) if field.init
 }
+__REACTION_INFO_FIELDS = {"formalism", "particles", "transitions"}
 
 
 def asdot(
@@ -109,6 +145,9 @@ def asdot(
 
     .. seealso:: :doc:`/usage/visualize`
     """
+    # pylint: disable=import-outside-toplevel
+    from . import _dot
+
     print_dot = _dot.GraphPrinter(
         render_node=render_node,
         render_final_state_id=render_final_state_id,
@@ -124,6 +163,17 @@ def asdot(
 
 
 def load(filename: str) -> object:
+    """Load an instance from a file that was written with `write`.
+
+    Files with extension :code:`.qrules` are opened as a
+    `.MappedReactionInfo`, which builds transitions only when they are
+    accessed.
+    """
+    if _get_file_extension(filename) == "qrules":
+        # pylint: disable=import-outside-toplevel
+        from ._binary import MappedReactionInfo
+
+        return MappedReactionInfo(filename)
     with open(filename) as stream:
         file_extension = _get_file_extension(filename)
         if file_extension == "json":
@@ -151,9 +201,48 @@ class _IncreasedIndent(yaml.Dumper):
             super().write_line_break()
 
 
-def write(instance: object, filename: str) -> None:
+def write(
+    instance: object, filename: str, particle_table: bool = False
+) -> None:
+    """Write an instance to a file of which the format follows its extension.
+
+    With :code:`particle_table`, a `.ReactionInfo` is written to JSON and YAML
+    transition by transition, with a table of the particles in its states.
+    The states refer to these particles by name, so each `.Particle` is
+    written only once. This keeps memory usage low for large reactions, but
+    requires different particles to have different names. The output can be
+    read back with `load`.
+
+    The extension :code:`.qrules` selects a compact binary format for a
+    `.ReactionInfo`, which `load` opens as a `.MappedReactionInfo`.
+    """
+    # pylint: disable=import-outside-toplevel
+    from qrules.transition import ReactionInfo
+
+    from . import _binary, _stream
+
+    if particle_table and not isinstance(instance, ReactionInfo):
+        raise NotImplementedError(
+            "Can only write a ReactionInfo with a particle table, not a"
+            f" {type(instance).__name__}"
+        )
+    if _get_file_extension(filename) == "qrules":
+        if not isinstance(instance, ReactionInfo):
+            raise NotImplementedError(
+                "Can only write a ReactionInfo in binary format, not a"
+                f" {type(instance).__name__}"
+            )
+        _binary.write(instance, filename)
+        return
     with open(filename, "w") as stream:
         file_extension = _get_file_extension(filename)
+        if particle_table and isinstance(instance, ReactionInfo):
+            if file_extension == "json":
+                _stream.write_json(instance, stream)
+                return
+            if file_extension in ["yaml", "yml"]:
+                _stream.write_yaml(instance, stream, _IncreasedIndent)
+                return
         if file_extension == "json":
             json.dump(asdict(instance), stream, indent=2, cls=JSONSetEncoder)
             return
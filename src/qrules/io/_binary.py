@@ -0,0 +1,225 @@
+"""Compact binary file format for `.ReactionInfo`.
+
+A file consists of:
+
+1. The bytes :code:`QRULES` followed by a two-byte format version.
+2. The size of the header as a little-endian unsigned 64-bit integer.
+3. A JSON header with the formalism and tables of the topologies, particles,
+   states and interactions that occur in the transitions. Each `.State` is
+   stored as the index of its particle and its spin projection. The header
+   is padded with spaces to a multiple of eight bytes.
+4. One row of little-endian 32-bit integers per transition. A row contains
+   the index of the topology, the indices of the states on the edges of that
+   topology (sorted by edge ID) and the indices of the interactions on its
+   nodes (sorted by node ID). Rows are padded with :code:`-1` to the same
+   width.
+
+The rows have a fixed width, so that a transition can be read from any
+position in the file without reading the transitions before it.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List, Sequence, Union, overload
+
+from qrules.particle import Particle
+from qrules.quantum_numbers import InteractionProperties
+from qrules.topology import FrozenTransition, Topology
+from qrules.transition import ReactionInfo, State, StateTransition
+
+from . import _dict
+
+_MAGIC = b"QRULES"
+_VERSION = 1
+_PREAMBLE = struct.Struct(f"<{len(_MAGIC)}sHQ")
+
+
+def write(reaction: ReactionInfo, filename: str) -> None:
+    topologies: Dict[Topology, int] = {}
+    particles: Dict[Particle, int] = {}
+    states: Dict[State, int] = {}
+    interactions: Dict[InteractionProperties, int] = {}
+    indices: List[List[int]] = []
+    for transition in reaction.transitions:
+        topology = transition.topology
+        row = [topologies.setdefault(topology, len(topologies))]
+        for i in sorted(topology.edges):
+            state = transition.states[i]
+            particles.setdefault(state.particle, len(particles))
+            row.append(states.setdefault(state, len(states)))
+        for i in sorted(topology.nodes):
+            interaction = transition.interactions[i]
+            n_interactions = len(interactions)
+            row.append(interactions.setdefault(interaction, n_interactions))
+        indices.append(row)
+    row_width = max(map(len, indices))
+    rows = array("i")
+    for row in indices:
+        rows.extend(row)
+        rows.extend([-1] * (row_width - len(row)))
+    header = {
+        "formalism": reaction.formalism,
+        "n_transitions": len(indices),
+        "row_width": row_width,
+        "topologies": [_dict.from_topology(t) for t in topologies],
+        "particles": [_dict.from_attrs_decorated(p) for p in particles],
+        "states": [[particles[s.particle], s.spin_projection] for s in states],
+        "interactions": [_dict.from_attrs_decorated(i) for i in interactions],
+    }
+    serialized_header = json.dumps(header).encode()
+    serialized_header += b" " * (-len(serialized_header) % 8)
+    if sys.byteorder == "big":
+        rows.byteswap()
+    with open(filename, "wb") as stream:
+        stream.write(_PREAMBLE.pack(_MAGIC, _VERSION, len(serialized_header)))
+        stream.write(serialized_header)
+        rows.tofile(stream)
+
+
+class MappedReactionInfo(Sequence[StateTransition]):
+    """Read-only view on a `.ReactionInfo` that was written in binary format.
+
+    The file is memory-mapped, so that the operating system shares its pages
+    between processes that open the same file. Only the tables of particles,
+    states, interactions and topologies are loaded on opening. Each
+    `.FrozenTransition` is built from its row in the file when it is
+    accessed, in the same order as the transitions of the original
+    `.ReactionInfo`.
+
+    Instances can be pickled, for instance to send them to worker processes,
+    in which case the file is opened again in the receiving process.
+
+    >>> import qrules
+    >>> reaction = qrules.generate_transitions(  # doctest: +SKIP
+    ...     initial_state="J/psi(1S)",
+    ...     final_state=["gamma", "pi0", "pi0"],
+    ... )
+    >>> qrules.io.write(reaction, "reaction.qrules")  # doctest: +SKIP
+    >>> mapped = qrules.io.load("reaction.qrules")  # doctest: +SKIP
+    >>> mapped[42] == reaction.transitions[42]  # doctest: +SKIP
+    True
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.__filename = filename
+        with open(filename, "rb") as stream:
+            self.__buffer = mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        try:
+            self.__read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def __read_header(self) -> None:
+        magic, version, header_size = _PREAMBLE.unpack_from(self.__buffer)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.__filename} is not a qrules binary file")
+        if version != _VERSION:
+            raise ValueError(
+                f"{self.__filename} has format version {version}, but only"
+                f" version {_VERSION} is supported"
+            )
+        header_end = _PREAMBLE.size + header_size
+        header = json.loads(self.__buffer[_PREAMBLE.size : header_end])
+        self.__formalism: str = header["formalism"]
+        self.__n_transitions: int = header["n_transitions"]
+        self.__row = struct.Struct(f"<{header['row_width']}i")
+        self.__offset = header_end
+        expected_size = header_end + self.__n_transitions * self.__row.size
+        if len(self.__buffer) != expected_size:
+            raise ValueError(
+                f"{self.__filename} has {len(self.__buffer)} bytes, but"
+                f" should have {expected_size} bytes"
+            )
+        self.__topologies = [
+            _dict.build_topology(definition)
+            for definition in header["topologies"]
+        ]
+        particles = [
+            _dict.build_particle(definition)
+            for definition in header["particles"]
+        ]
+        self.__states = [
+            State(particles[i], spin_projection)
+            for i, spin_projection in header["states"]
+        ]
+        self.__interactions = [
+            InteractionProperties(**definition)
+            for definition in header["interactions"]
+        ]
+
+    @property
+    def filename(self) -> str:
+        return self.__filename
+
+    @property
+    def formalism(self) -> str:
+        return self.__formalism
+
+    def __len__(self) -> int:
+        return self.__n_transitions
+
+    @overload
+    def __getitem__(self, index: int) -> StateTransition:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[StateTransition]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[StateTransition, List[StateTransition]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(
+                f"Transition index {index} out of range, file has"
+                f" {len(self)} transitions"
+            )
+        row = self.__row.unpack_from(
+            self.__buffer, self.__offset + index * self.__row.size
+        )
+        topology = self.__topologies[row[0]]
+        n_edges = len(topology.edges)
+        states = {
+            i: self.__states[state_index]
+            for i, state_index in zip(sorted(topology.edges), row[1:])
+        }
+        interactions = {
+            i: self.__interactions[interaction_index]
+            for i, interaction_index in zip(
+                sorted(topology.nodes), row[1 + n_edges :]
+            )
+        }
+        return FrozenTransition(topology, states, interactions)
+
+    def __iter__(self) -> Iterator[StateTransition]:
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__filename!r})"
+
+    def __reduce__(self) -> Any:
+        return type(self), (self.__filename,)
+
+    def __enter__(self) -> "MappedReactionInfo":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map of the file."""
+        self.__buffer.close()
+
+    def to_reaction_info(self) -> ReactionInfo:
+        """Load all transitions into a `.ReactionInfo`."""
+        return ReactionInfo(list(self), formalism=self.__formalism)
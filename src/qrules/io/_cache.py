@@ -0,0 +1,270 @@
+"""Store generated `.ReactionInfo` and loaded particles on disk."""
+
+import hashlib
+import json
+import logging
+import os
+import pickle  # noqa: S403
+from pathlib import Path
+from typing import Any, List, Optional
+
+from qrules.particle import ParticleCollection
+from qrules.transition import ReactionInfo
+
+try:
+    from qrules.version import version as _QRULES_VERSION
+except ImportError:  # pragma: no cover
+    _QRULES_VERSION = "unknown"
+
+
+class ReactionCache:
+    """Persistent cache for the output of `.generate_transitions`.
+
+    Each `.ReactionInfo` is stored as a JSON file with a particle table (see
+    `.io.write`) in the :code:`directory`, with a file name that is a hash of
+    the arguments with which it was generated (see :meth:`create_key`). If
+    the files in the directory take up more than :code:`max_size` bytes, the
+    least recently used files are removed.
+
+    >>> import qrules
+    >>> cache = qrules.io.ReactionCache("~/.cache/qrules")  # doctest: +SKIP
+    >>> reaction = qrules.generate_transitions(  # doctest: +SKIP
+    ...     initial_state="J/psi(1S)",
+    ...     final_state=["gamma", "pi0", "pi0"],
+    ...     cache=cache,
+    ... )
+    """
+
+    def __init__(
+        self, directory: str, max_size: Optional[int] = 100 * 1024**2
+    ) -> None:
+        self.__directory = Path(directory).expanduser()
+        self.__max_size = max_size
+
+    @property
+    def directory(self) -> Path:
+        return self.__directory
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """Maximum number of bytes on disk, or `None` for no limit."""
+        return self.__max_size
+
+    @staticmethod
+    def create_key(
+        particle_db: Optional[ParticleCollection], **arguments: Any
+    ) -> str:
+        """Create a hash for a `.ReactionInfo` that is to be generated.
+
+        The hash is computed from the :code:`arguments` of
+        `.generate_transitions`, the content of the :code:`particle_db`, and
+        the version of `qrules`. The arguments have to be serializable to
+        JSON, with tuples and lists being considered equal and sets being
+        sorted. Other arguments raise a `TypeError`, because they cannot be
+        identified across runs.
+        """
+        definition = {
+            "arguments": arguments,
+            "particle_db": _hash_particle_collection(particle_db),
+            "qrules": _QRULES_VERSION,
+        }
+        serialized = json.dumps(
+            definition, sort_keys=True, default=_serialize_argument
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[ReactionInfo]:
+        """Load the `.ReactionInfo` for a key, or `None` if it is missing."""
+        # pylint: disable=import-outside-toplevel
+        from qrules.io import load
+
+        path = self.__get_path(key)
+        if not path.exists():
+            return None
+        try:
+            reaction = load(str(path))
+        except (KeyError, TypeError, ValueError):
+            logging.warning(f"Removing corrupted cache file {path}")
+            path.unlink()
+            return None
+        if not isinstance(reaction, ReactionInfo):
+            return None
+        os.utime(path)
+        return reaction
+
+    def put(self, key: str, reaction: ReactionInfo) -> None:
+        """Store a `.ReactionInfo` and remove least recently used entries."""
+        # pylint: disable=import-outside-toplevel
+        from qrules.io import write
+
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        path = self.__get_path(key)
+        temporary_path = path.with_name(f"{key}.{os.getpid()}.tmp.json")
+        write(reaction, str(temporary_path), particle_table=True)
+        os.replace(temporary_path, path)
+        self.__evict()
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for path in self.__list_entries():
+            path.unlink()
+
+    def __get_path(self, key: str) -> Path:
+        return self.__directory / f"{key}.json"
+
+    def __list_entries(self) -> List[Path]:
+        if not self.__directory.exists():
+            return []
+        return [
+            path
+            for path in self.__directory.glob("*.json")
+            if not path.name.endswith(".tmp.json")
+        ]
+
+    def __evict(self) -> None:
+        if self.__max_size is None:
+            return
+        entries = sorted(
+            self.__list_entries(), key=lambda p: p.stat().st_mtime
+        )
+        total_size = sum(path.stat().st_size for path in entries)
+        for path in entries[:-1]:
+            if total_size <= self.__max_size:
+                break
+            total_size -= path.stat().st_size
+            path.unlink()
+
+
+def _serialize_argument(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    raise TypeError(
+        "Cannot create a cache key for an argument of type"
+        f" {type(value).__name__}"
+    )
+
+
+def _hash_particle_collection(
+    particles: Optional[ParticleCollection],
+) -> str:
+    """Compute a hash of the content of a `.ParticleCollection`.
+
+    If no particles are given, the `.StateTransitionManager` loads them with
+    `.load_pdg`, so the result depends on the installed version of the
+    :code:`particle` package.
+    """
+    # pylint: disable=import-outside-toplevel
+    if particles is None:
+        return f"pdg-{_get_particle_version()}"
+    from qrules.io import asdict
+
+    definitions = sorted(
+        asdict(particles)["particles"], key=lambda p: p["name"]
+    )
+    serialized = json.dumps(definitions, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class ParticleCache:
+    """Persistent cache for `.load_pdg` and `.load_default_particles`.
+
+    Each `.ParticleCollection` is stored as a pickled snapshot in the
+    :code:`directory`. Loading a snapshot skips the conversion of the PDG
+    entries and the validation of the particle definitions, which were done
+    before the snapshot was written. A snapshot is identified by a key that
+    is a hash of the versions of `qrules` and the :code:`particle` package and
+    of the files from which the particles are loaded (see
+    :meth:`create_key`), so it is not used anymore once either of them
+    changes. Unpickling can execute arbitrary code, so the
+    :code:`directory` should only be writable by trusted users.
+
+    >>> import qrules
+    >>> cache = qrules.io.ParticleCache("~/.cache/qrules")  # doctest: +SKIP
+    >>> particle_db = qrules.load_default_particles(cache)  # doctest: +SKIP
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.__directory = Path(directory).expanduser()
+
+    @property
+    def directory(self) -> Path:
+        return self.__directory
+
+    @staticmethod
+    def create_key(name: str, *filenames: str) -> str:
+        """Create a key for particles that are loaded from files.
+
+        The :code:`name` identifies the collection, for instance
+        :code:`"pdg"`. Snapshots with the same name but a different key are
+        removed when a new snapshot is stored.
+        """
+        file_hashes = []
+        for filename in filenames:
+            with open(filename, "rb") as stream:
+                file_hashes.append(hashlib.sha256(stream.read()).hexdigest())
+        definition = {
+            "files": file_hashes,
+            "particle": _get_particle_version(),
+            "qrules": _QRULES_VERSION,
+        }
+        serialized = json.dumps(definition, sort_keys=True)
+        digest = hashlib.sha256(serialized.encode()).hexdigest()
+        return f"{name}-{digest}"
+
+    def get(self, key: str) -> Optional[ParticleCollection]:
+        """Load the particles for a key, or `None` if they are missing."""
+        path = self.__get_path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as stream:
+                particles = pickle.load(stream)  # noqa: S301
+        except (AttributeError, EOFError, ImportError, pickle.PickleError):
+            particles = None
+        if not isinstance(particles, ParticleCollection):
+            logging.warning(f"Removing corrupted cache file {path}")
+            path.unlink()
+            return None
+        return particles
+
+    def put(self, key: str, particles: ParticleCollection) -> None:
+        """Store particles and remove outdated snapshots with the same name."""
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        path = self.__get_path(key)
+        temporary_path = path.with_name(f"{key}.{os.getpid()}.tmp.pickle")
+        with open(temporary_path, "wb") as stream:
+            pickle.dump(particles, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+        name = key.rsplit("-", 1)[0]
+        for entry in self.__list_entries():
+            if entry != path and entry.stem.rsplit("-", 1)[0] == name:
+                entry.unlink()
+
+    def clear(self) -> None:
+        """Remove all snapshots from the cache."""
+        for path in self.__list_entries():
+            path.unlink()
+
+    def __get_path(self, key: str) -> Path:
+        return self.__directory / f"{key}.pickle"
+
+    def __list_entries(self) -> List[Path]:
+        if not self.__directory.exists():
+            return []
+        return [
+            path
+            for path in self.__directory.glob("*.pickle")
+            if not path.name.endswith(".tmp.pickle")
+        ]
+
+
+def _get_particle_version() -> str:
+    """Get the version without importing the slow :code:`particle` package."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        from importlib.metadata import version
+    except ImportError:  # pragma: no cover
+        import particle
+
+        return particle.__version__
+    return version("particle")
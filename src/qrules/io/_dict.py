@@ -4,7 +4,7 @@
 import json
 from collections import abc
 from os.path import dirname, realpath
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Optional
 
 import attrs
 
@@ -27,6 +27,40 @@ def from_attrs_decorated(inst: Any) -> dict:
     )
 
 
+def from_transition(
+    transition: "FrozenTransition[State, InteractionProperties]",
+) -> dict:
+    """Convert a transition to a `dict` that refers to particles by name.
+
+    Contrary to `from_attrs_decorated`, the definition contains only
+    JSON-compatible types, so that it can also be loaded from YAML with a
+    safe loader.
+    """
+    return {
+        "topology": from_topology(transition.topology),
+        "states": {
+            i: {
+                "particle": state.particle.name,
+                "spin_projection": state.spin_projection,
+            }
+            for i, state in transition.states.items()
+        },
+        "interactions": {
+            i: from_attrs_decorated(interaction)
+            for i, interaction in transition.interactions.items()
+        },
+    }
+
+
+def from_topology(topology: Topology) -> dict:
+    return {
+        "nodes": sorted(topology.nodes),
+        "edges": {
+            i: from_attrs_decorated(edge) for i, edge in topology.edges.items()
+        },
+    }
+
+
 def _value_serializer(  # pylint: disable=unused-argument
     inst: type, field: attrs.Attribute, value: Any
 ) -> Any:
@@ -69,8 +103,22 @@ def build_particle(definition: dict) -> Particle:
 
 
 def build_reaction_info(definition: dict) -> ReactionInfo:
+    """Build a `.ReactionInfo` with or without a table of particles.
+
+    If the definition has a :code:`"particles"` table, the states of the
+    transitions refer to these particles by name and all states share the
+    same `.Particle` instances.
+    """
+    particles: Optional[Dict[str, Particle]] = None
+    if "particles" in definition:
+        particles = {
+            particle.name: particle
+            for particle in build_particle_collection(
+                {"particles": definition["particles"]}
+            )
+        }
     transitions = [
-        build_transition(transition_def)
+        build_transition(transition_def, particles)
         for transition_def in definition["transitions"]
     ]
     return ReactionInfo(transitions, formalism=definition["formalism"])
@@ -78,12 +126,13 @@ def build_reaction_info(definition: dict) -> ReactionInfo:
 
 def build_transition(
     definition: dict,
+    particles: Optional[Mapping[str, Particle]] = None,
 ) -> "FrozenTransition[State, InteractionProperties]":
     topology = build_topology(definition["topology"])
     states_def: Dict[int, dict] = definition["states"]
     states: Dict[int, State] = {}
     for i, edge_def in states_def.items():
-        states[int(i)] = build_state(edge_def)
+        states[int(i)] = build_state(edge_def, particles)
     interactions_def: Dict[int, dict] = definition["interactions"]
     interactions = {
         int(i): InteractionProperties(**node_def)
@@ -92,16 +141,26 @@ def build_transition(
     return FrozenTransition(topology, states, interactions)
 
 
-def build_state(definition: Any) -> State:
+def build_state(
+    definition: Any, particles: Optional[Mapping[str, Particle]] = None
+) -> State:
     if isinstance(definition, (list, tuple)) and len(definition) == 2:
-        particle = build_particle(definition[0])
-        spin_projection = float(definition[1])
-        return State(particle, spin_projection)
-    if isinstance(definition, dict):
-        particle = build_particle(definition["particle"])
-        spin_projection = float(definition["spin_projection"])
-        return State(particle, spin_projection)
-    raise NotImplementedError()
+        particle_def, spin_projection = definition
+    elif isinstance(definition, dict):
+        particle_def = definition["particle"]
+        spin_projection = definition["spin_projection"]
+    else:
+        raise NotImplementedError()
+    if isinstance(particle_def, str):
+        if particles is None:
+            raise ValueError(
+                f'State refers to particle "{particle_def}", but there is no'
+                " table of particles"
+            )
+        particle = particles[particle_def]
+    else:
+        particle = build_particle(particle_def)
+    return State(particle, float(spin_projection))
 
 
 def build_topology(definition: dict) -> Topology:
@@ -0,0 +1,101 @@
+"""Write a `.ReactionInfo` transition by transition.
+
+This layout is used by `qrules.io.write` if it is called with
+:code:`particle_table=True`.
+
+A `.ReactionInfo` is written with a table of the particles that appear in its
+states, followed by its transitions. The states refer to the particles in this
+table by name, so that each `.Particle` definition is written only once. Each
+transition is converted and written separately, so that the complete
+`dict` representation of the `.ReactionInfo` never has to be kept in memory.
+"""
+
+import json
+from typing import Dict, Iterable, List, TextIO, Type
+
+import yaml
+
+from qrules.particle import Particle
+from qrules.transition import ReactionInfo
+
+from . import _dict
+
+
+def collect_particles(reaction: ReactionInfo) -> List[Particle]:
+    """Collect the particles of all states in order of appearance.
+
+    Raises a `ValueError` if different particles have the same name, because
+    the states refer to particles by name.
+    """
+    particles: Dict[str, Particle] = {}
+    for transition in reaction.transitions:
+        for state in transition.states.values():
+            particle = state.particle
+            existing = particles.setdefault(particle.name, particle)
+            if existing != particle:
+                raise ValueError(
+                    "Cannot write a reaction with different particles that"
+                    f' have the same name "{particle.name}"'
+                )
+    return list(particles.values())
+
+
+def write_json(reaction: ReactionInfo, stream: TextIO) -> None:
+    particles = collect_particles(reaction)
+    stream.write("{\n")
+    stream.write(f'  "formalism": {json.dumps(reaction.formalism)},\n')
+    stream.write('  "particles": [')
+    _write_json_items(
+        (_dict.from_attrs_decorated(p) for p in particles), stream
+    )
+    stream.write("],\n")
+    stream.write('  "transitions": [')
+    _write_json_items(
+        (_dict.from_transition(t) for t in reaction.transitions), stream
+    )
+    stream.write("]\n}\n")
+
+
+def _write_json_items(items: Iterable[dict], stream: TextIO) -> None:
+    separator = "\n"
+    for item in items:
+        stream.write(separator)
+        serialized = json.dumps(item, indent=2)
+        stream.write(_indent(serialized, depth=2))
+        separator = ",\n"
+    if separator != "\n":
+        stream.write("\n  ")
+
+
+def write_yaml(
+    reaction: ReactionInfo, stream: TextIO, dumper: Type[yaml.Dumper]
+) -> None:
+    particles = collect_particles(reaction)
+    header = {
+        "formalism": reaction.formalism,
+        "particles": [_dict.from_attrs_decorated(p) for p in particles],
+    }
+    yaml.dump(
+        header,
+        stream,
+        sort_keys=False,
+        Dumper=dumper,
+        default_flow_style=False,
+    )
+    stream.write("\ntransitions:\n")
+    for transition in reaction.transitions:
+        serialized = yaml.dump(
+            [_dict.from_transition(transition)],
+            sort_keys=False,
+            Dumper=dumper,
+            default_flow_style=False,
+        )
+        stream.write(_indent(serialized, depth=2))
+
+
+def _indent(text: str, depth: int) -> str:
+    prefix = depth * " "
+    return "".join(
+        prefix + line if line.strip() else line
+        for line in text.splitlines(keepends=True)
+    )
@@ -41,9 +41,12 @@ from .conservation_rules import GellMannNishijimaInput, gellmann_nishijima
 from .quantum_numbers import Parity, _to_fraction
 
 if TYPE_CHECKING:
+    import numpy as np
     from particle import Particle as PdgDatabase
     from particle.particle import enums
 
+    from .io import ParticleCache
+
     try:
         from IPython.lib.pretty import PrettyPrinter
     except ImportError:
@@ -269,14 +272,29 @@ class ParticleCollection(abc.MutableSet):
     def __init__(self, particles: Optional[Iterable[Particle]] = None) -> None:
         self.__particles: Dict[str, Particle] = {}
         self.__pid_to_name: Dict[int, str] = {}
+        self.__value_to_name: Dict[Particle, str] = {}
+        self.__columns: Optional[ParticleColumns] = None
         if particles is not None:
             self.update(particles)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_ParticleCollection__value_to_name"]
+        state["_ParticleCollection__columns"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__value_to_name = {
+            particle: name for name, particle in self.__particles.items()
+        }
+        self.__columns = None
+
     def __contains__(self, instance: object) -> bool:
         if isinstance(instance, str):
             return instance in self.__particles
         if isinstance(instance, Particle):
-            return instance in self.__particles.values()
+            return instance in self.__value_to_name
         if isinstance(instance, int):
             return instance in self.__pid_to_name
         raise NotImplementedError(
@@ -347,15 +365,17 @@ class ParticleCollection(abc.MutableSet):
             p.text("})")
 
     def add(self, value: Particle) -> None:
-        if value in self.__particles.values():
-            equivalent_particles = {p for p in self if p == value}
-            equivalent_particle = next(iter(equivalent_particles))
+        # pylint: disable=protected-access
+        equivalent_name = self.__value_to_name.get(value)
+        if equivalent_name is not None:
             raise ValueError(
                 f'Added particle "{value.name}" is equivalent to '
-                f'existing particle "{equivalent_particle.name}"',
+                f'existing particle "{equivalent_name}"',
             )
-        if value.name in self.__particles:
+        overwrite = value.name in self.__particles
+        if overwrite:
             logging.warning(f'Overwriting particle with name "{value.name}"')
+            del self.__value_to_name[self.__particles[value.name]]
         if value.pid in self.__pid_to_name:
             logging.warning(
                 f"Particle with PID {value.pid} already exists:"
@@ -363,8 +383,15 @@ class ParticleCollection(abc.MutableSet):
             )
         self.__particles[value.name] = value
         self.__pid_to_name[value.pid] = value.name
+        self.__value_to_name[value] = value.name
+        if self.__columns is not None:
+            if overwrite:
+                self.__columns._replace(value)
+            else:
+                self.__columns._append(value)
 
     def discard(self, value: Union[Particle, str]) -> None:
+        # pylint: disable=protected-access
         particle_name = ""
         if isinstance(value, Particle):
             particle_name = value.name
@@ -374,8 +401,12 @@ class ParticleCollection(abc.MutableSet):
             raise NotImplementedError(
                 f"Cannot discard something of type {type(value).__name__}"
             )
-        del self.__pid_to_name[self[particle_name].pid]
+        particle = self[particle_name]
+        del self.__pid_to_name[particle.pid]
+        del self.__value_to_name[particle]
         del self.__particles[particle_name]
+        if self.__columns is not None:
+            self.__columns._remove(particle_name)
 
     def find(self, search_term: Union[int, str]) -> Particle:
         """Search for a particle by either name (`str`) or PID (`int`)."""
@@ -413,6 +444,49 @@ class ParticleCollection(abc.MutableSet):
             {particle for particle in self if function(particle)}
         )
 
+    @property
+    def columns(self) -> "ParticleColumns":
+        """Properties of the particles as NumPy arrays, see `ParticleColumns`.
+
+        The columns are created on first access and are updated when
+        particles are added or discarded. Requires :mod:`numpy`.
+        """
+        if self.__columns is None:
+            self.__columns = ParticleColumns(self)
+        return self.__columns
+
+    def select(
+        self, mask: Optional["np.ndarray"] = None, **conditions: Any
+    ) -> "ParticleCollection":
+        """Search by `Particle` properties with vectorized conditions.
+
+        The :code:`conditions` are combined with :meth:`.ParticleColumns.mask`
+        and with the optional boolean :code:`mask` over the `columns`. This is
+        much faster than `filter` for large collections. For example:
+
+        >>> from qrules.particle import load_pdg
+        >>> pdg = load_pdg()
+        >>> subset = pdg.select(mass=(1.8, 2.0), spin=2, strangeness=1)
+        >>> sorted(list(subset.names))
+        ['K(2)(1820)+', 'K(2)(1820)0', 'K(2)*(1980)+', 'K(2)*(1980)0']
+        >>> columns = pdg.columns
+        >>> heavy_mesons = pdg.select(
+        ...     (columns["charmness"] != 0) | (columns["bottomness"] != 0),
+        ...     baryon_number=0,
+        ...     parity=-1,
+        ... )
+        """
+        columns = self.columns
+        selection = columns.mask(**conditions)
+        if mask is not None:
+            selection &= mask
+        subset = ParticleCollection()
+        for particle in columns.select(selection):
+            subset.__particles[particle.name] = particle
+            subset.__pid_to_name[particle.pid] = particle.name
+            subset.__value_to_name[particle] = particle.name
+        return subset
+
     def update(self, other: Iterable[Particle]) -> None:
         if not isinstance(other, abc.Iterable):
             raise TypeError(
@@ -427,6 +501,168 @@ class ParticleCollection(abc.MutableSet):
         return [p.name for p in sorted(self)]
 
 
+class ParticleColumns:
+    """Columnar store of the properties of `Particle` instances.
+
+    Each property is stored as a :class:`numpy.ndarray` with one entry per
+    particle, in the order of the particles. The :code:`name` column holds
+    the names as Python `str` objects. Missing isospin values are stored
+    as :code:`nan` and missing parities as :code:`0`, so that they do not match
+    any physical value. Use `ParticleCollection.columns` to get the columns of
+    a `ParticleCollection`.
+
+    >>> from qrules.particle import load_pdg
+    >>> pdg = load_pdg()
+    >>> columns = pdg.columns
+    >>> mask = columns.mask(charge=0, spin=1, isospin_magnitude=1)
+    >>> mask &= columns["mass"] < 1.0
+    >>> [p.name for p in columns.select(mask)]
+    ['rho(770)0']
+    """
+
+    def __init__(self, particles: Iterable[Particle]) -> None:
+        import numpy as np
+
+        particle_list = list(particles)
+        self.__size = len(particle_list)
+        self.__rows = {p.name: i for i, p in enumerate(particle_list)}
+        self.__particles = np.empty(self.__size, dtype=object)
+        self.__particles[:] = particle_list
+        self.__columns: Dict[str, np.ndarray] = {
+            name: np.array(list(map(getter, particle_list)), dtype=dtype)
+            for name, (getter, dtype) in _COLUMNS.items()
+        }
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        if name not in self.__columns:
+            raise KeyError(
+                f'No column "{name}". Available columns: {list(self)}'
+            )
+        return self.__columns[name][: self.__size]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__columns)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def _append(self, particle: Particle) -> None:
+        """Add a row, see `ParticleCollection.add`.
+
+        The arrays are allocated with spare rows, so that adding many
+        particles one by one takes linear time.
+        """
+        if self.__size == len(self.__particles):
+            capacity = max(8, 2 * self.__size)
+            self.__particles = _grow(self.__particles, capacity)
+            self.__columns = {
+                name: _grow(array, capacity)
+                for name, array in self.__columns.items()
+            }
+        self.__rows[particle.name] = self.__size
+        self.__size += 1
+        self._replace(particle)
+
+    def _replace(self, particle: Particle) -> None:
+        """Overwrite the row of the particle with the same name."""
+        row = self.__rows[particle.name]
+        self.__particles[row] = particle
+        for name, (getter, _) in _COLUMNS.items():
+            self.__columns[name][row] = getter(particle)
+
+    def _remove(self, particle_name: str) -> None:
+        """Remove a row and shift the rows after it to keep their order."""
+        row = self.__rows.pop(particle_name)
+        for array in [self.__particles, *self.__columns.values()]:
+            array[row : self.__size - 1] = array[row + 1 : self.__size]
+        self.__size -= 1
+        self.__particles[self.__size] = None
+        for name, other_row in self.__rows.items():
+            if other_row > row:
+                self.__rows[name] = other_row - 1
+
+    def mask(self, **conditions: Any) -> "np.ndarray":
+        """Create a boolean mask of the particles that meet all conditions.
+
+        Each keyword is the name of a column. Its value can be:
+
+        - a tuple :code:`(low, high)` for a range that includes its bounds,
+          where one of the bounds can be `None`;
+        - a `set` or `list` of allowed values;
+        - a single value that the column has to be equal to.
+        """
+        import numpy as np
+
+        mask = np.ones(len(self), dtype=bool)
+        for name, condition in conditions.items():
+            column = self[name]
+            if isinstance(condition, tuple):
+                low, high = condition
+                if low is not None:
+                    mask &= column >= low
+                if high is not None:
+                    mask &= column <= high
+            elif isinstance(condition, (set, frozenset, list)):
+                mask &= np.isin(column, list(condition))
+            else:
+                mask &= column == condition
+        return mask
+
+    def select(self, mask: "np.ndarray") -> List[Particle]:
+        """Get the particles for which the boolean mask is `True`."""
+        return list(self.__particles[: self.__size][mask])
+
+
+def _grow(array: "np.ndarray", capacity: int) -> "np.ndarray":
+    import numpy as np
+
+    grown = np.empty(capacity, dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _get_isospin_magnitude(particle: Particle) -> float:
+    if particle.isospin is None:
+        return float("nan")
+    return particle.isospin.magnitude
+
+
+def _get_isospin_projection(particle: Particle) -> float:
+    if particle.isospin is None:
+        return float("nan")
+    return particle.isospin.projection
+
+
+def _get_parity(parity: Optional[Parity]) -> int:
+    if parity is None:
+        return 0
+    return int(parity)
+
+
+_COLUMNS: Dict[str, Tuple[Callable[[Particle], Any], str]] = {
+    "name": (lambda p: p.name, "object"),
+    "pid": (lambda p: p.pid, "int64"),
+    "mass": (lambda p: p.mass, "float64"),
+    "width": (lambda p: p.width, "float64"),
+    "spin": (lambda p: p.spin, "float64"),
+    "charge": (lambda p: p.charge, "int64"),
+    "isospin_magnitude": (_get_isospin_magnitude, "float64"),
+    "isospin_projection": (_get_isospin_projection, "float64"),
+    "strangeness": (lambda p: p.strangeness, "int64"),
+    "charmness": (lambda p: p.charmness, "int64"),
+    "bottomness": (lambda p: p.bottomness, "int64"),
+    "topness": (lambda p: p.topness, "int64"),
+    "baryon_number": (lambda p: p.baryon_number, "int64"),
+    "electron_lepton_number": (lambda p: p.electron_lepton_number, "int64"),
+    "muon_lepton_number": (lambda p: p.muon_lepton_number, "int64"),
+    "tau_lepton_number": (lambda p: p.tau_lepton_number, "int64"),
+    "parity": (lambda p: _get_parity(p.parity), "int64"),
+    "c_parity": (lambda p: _get_parity(p.c_parity), "int64"),
+    "g_parity": (lambda p: _get_parity(p.g_parity), "int64"),
+}
+"""Getters and data types of the `ParticleColumns`."""
+
+
 def create_particle(  # pylint: disable=too-many-arguments,too-many-locals
     template_particle: Particle,
     name: Optional[str] = None,
@@ -527,12 +763,22 @@ def create_antiparticle(
     )
 
 
-def load_pdg() -> ParticleCollection:
+def load_pdg(cache: Optional["ParticleCache"] = None) -> ParticleCollection:
     """Create a `.ParticleCollection` with all entries from the PDG.
 
     PDG info is imported from the `scikit-hep/particle
-    <https://github.com/scikit-hep/particle>`_ package.
+    <https://github.com/scikit-hep/particle>`_ package. If a `.ParticleCache`
+    is given, the particles are loaded from a snapshot in that cache, which is
+    created the first time.
     """
+    if cache is not None:
+        key = cache.create_key("pdg")
+        particles = cache.get(key)
+        if particles is None:
+            particles = load_pdg()
+            cache.put(key, particles)
+        return particles
+
     from particle import Particle as PdgDatabase
 
     all_pdg_particles = PdgDatabase.findall(
@@ -0,0 +1,241 @@
+"""Measure where the time is spent when solving problem sets.
+
+Give the `.StateTransitionManager` a :code:`profiler` to get a
+`ProblemSetProfile` for each `.QNProblemSet` that is solved, also when the
+problem sets are solved in worker processes. A `SolvingProfile` collects
+these profiles and can export them as JSON or in the Chrome trace event
+format, which can be viewed with for instance https://ui.perfetto.dev.
+
+>>> import qrules
+>>> from qrules.profiling import SolvingProfile
+>>> profile = SolvingProfile()
+>>> stm = qrules.StateTransitionManager(
+...     initial_state=["J/psi(1S)"],
+...     final_state=["gamma", "pi0", "pi0"],
+...     allowed_intermediate_particles=["f(0)(980)"],
+...     number_of_threads=1,
+...     profiler=profile,
+... )
+>>> reaction = stm.find_solutions(stm.create_problem_sets())
+>>> len(profile.problem_sets) > 0
+True
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, List, Tuple
+
+from attrs import frozen
+
+from .solving import (
+    CSPSolver,
+    QNProblemSet,
+    QNResult,
+    RuleStatistics,
+    Solver,
+)
+from .topology import Topology
+
+
+@frozen
+class RuleProfile:
+    """Calls of one rule on one edge or node of a `.QNProblemSet`."""
+
+    name: str
+    """Name of the rule, see `.RuleStatistics.get_rule_name`."""
+    element: str
+    """Either :code:`"edge"` or :code:`"node"`."""
+    element_id: int
+    calls: int
+    passes: int
+    time: float
+    """Time in seconds spent on checking the rule."""
+
+
+@frozen
+class ProblemSetProfile:
+    """Measurements of solving one `.QNProblemSet`."""
+
+    topology: Topology
+    interaction_strength: float
+    """Product of the interaction strengths of the nodes."""
+    start_time: float
+    """Time at which solving started, in seconds since the epoch."""
+    duration: float
+    """Time in seconds that it took to solve the problem set."""
+    process_id: int
+    n_solutions: int
+    domain_sizes: Dict[str, int]
+    """Size of the domain of each variable of the solver."""
+    rules: Tuple[RuleProfile, ...]
+
+    @property
+    def n_variables(self) -> int:
+        return len(self.domain_sizes)
+
+
+def solve_with_profile(
+    solver: Solver, problem_set: QNProblemSet
+) -> Tuple[QNResult, ProblemSetProfile]:
+    """Solve a `.QNProblemSet` and measure how the solver performs.
+
+    Rule calls and variable domains are only available for a `.CSPSolver`.
+    """
+    start_time = time.time()
+    start = time.perf_counter()
+    result = solver.find_solutions(problem_set)
+    duration = time.perf_counter() - start
+    domain_sizes: Dict[str, int] = {}
+    rules: List[RuleProfile] = []
+    if isinstance(solver, CSPSolver):
+        domain_sizes = {
+            variable: len(domain)
+            for variable, domain in sorted(solver.domains.items())
+        }
+        rules = _create_rule_profiles(solver, problem_set)
+    interaction_strength = 1.0
+    for settings in problem_set.solving_settings.interactions.values():
+        interaction_strength *= settings.interaction_strength
+    profile = ProblemSetProfile(
+        topology=problem_set.topology,
+        interaction_strength=interaction_strength,
+        start_time=start_time,
+        duration=duration,
+        process_id=os.getpid(),
+        n_solutions=len(result.solutions),
+        domain_sizes=domain_sizes,
+        rules=tuple(rules),
+    )
+    return result, profile
+
+
+def _create_rule_profiles(
+    solver: CSPSolver, problem_set: QNProblemSet
+) -> List[RuleProfile]:
+    scoresheet = solver.scoresheet
+    settings = problem_set.solving_settings
+    elements: List[Tuple[str, int, Any]] = [
+        *(("edge", i, s) for i, s in settings.states.items()),
+        *(("node", i, s) for i, s in settings.interactions.items()),
+    ]
+    rules = []
+    for element, element_id, element_settings in elements:
+        for rule in element_settings.conservation_rules:
+            key = (element_id, rule)
+            if key not in scoresheet.rule_calls:
+                continue
+            rules.append(
+                RuleProfile(
+                    name=RuleStatistics.get_rule_name(rule),
+                    element=element,
+                    element_id=element_id,
+                    calls=scoresheet.rule_calls[key],
+                    passes=scoresheet.rule_passes[key],
+                    time=scoresheet.rule_time[key],
+                )
+            )
+    return sorted(rules, key=lambda r: (r.element, r.element_id, r.name))
+
+
+class SolvingProfile:
+    """Collection of `ProblemSetProfile` instances.
+
+    An instance of this class can be used as :code:`profiler` for the
+    `.StateTransitionManager`.
+    """
+
+    def __init__(self) -> None:
+        self.__problem_sets: List[ProblemSetProfile] = []
+
+    def __call__(self, profile: ProblemSetProfile) -> None:
+        self.__problem_sets.append(profile)
+
+    @property
+    def problem_sets(self) -> List[ProblemSetProfile]:
+        return self.__problem_sets
+
+    def get_rule_time(self) -> Dict[str, float]:
+        """Total time in seconds spent on each rule, slowest rule first."""
+        rule_time: Dict[str, float] = {}
+        for problem_set in self.__problem_sets:
+            for rule in problem_set.rules:
+                rule_time[rule.name] = rule_time.get(rule.name, 0) + rule.time
+        return dict(sorted(rule_time.items(), key=lambda x: -x[1]))
+
+    def asdict(self) -> Dict[str, Any]:
+        # pylint: disable=import-outside-toplevel
+        from qrules.io import asdict
+
+        return {
+            "problem_sets": [
+                {
+                    "topology": asdict(profile.topology),
+                    "interaction_strength": profile.interaction_strength,
+                    "start_time": profile.start_time,
+                    "duration": profile.duration,
+                    "process_id": profile.process_id,
+                    "n_solutions": profile.n_solutions,
+                    "domain_sizes": profile.domain_sizes,
+                    "rules": [_rule_profile_to_dict(r) for r in profile.rules],
+                }
+                for profile in self.__problem_sets
+            ],
+            "rule_time": self.get_rule_time(),
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Create one complete event per problem set in Chrome trace format.
+
+        Rules are checked in an interleaved way, so their calls are added as
+        arguments to the event of the problem set.
+        """
+        events = []
+        for i, profile in enumerate(self.__problem_sets):
+            events.append(
+                {
+                    "name": f"problem set {i}",
+                    "cat": f"strength {profile.interaction_strength:g}",
+                    "ph": "X",
+                    "ts": profile.start_time * 1e6,
+                    "dur": profile.duration * 1e6,
+                    "pid": profile.process_id,
+                    "tid": profile.process_id,
+                    "args": {
+                        "edges": len(profile.topology.edges),
+                        "nodes": len(profile.topology.nodes),
+                        "n_solutions": profile.n_solutions,
+                        "n_variables": profile.n_variables,
+                        "rules": {
+                            f"{r.name} ({r.element} {r.element_id})": (
+                                f"{r.passes}/{r.calls} passed"
+                                f" in {r.time * 1e3:.3f} ms"
+                            )
+                            for r in profile.rules
+                        },
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, filename: str) -> None:
+        # pylint: disable=import-outside-toplevel
+        from qrules.io import JSONSetEncoder
+
+        with open(filename, "w") as stream:
+            json.dump(self.asdict(), stream, indent=2, cls=JSONSetEncoder)
+
+    def write_chrome_trace(self, filename: str) -> None:
+        with open(filename, "w") as stream:
+            json.dump(self.to_chrome_trace(), stream)
+
+
+def _rule_profile_to_dict(profile: RuleProfile) -> Dict[str, Any]:
+    return {
+        "name": profile.name,
+        "element": profile.element,
+        "element_id": profile.element_id,
+        "calls": profile.calls,
+        "passes": profile.passes,
+        "time": profile.time,
+    }
@@ -11,7 +11,7 @@ import multiprocessing
 from copy import deepcopy
 from enum import Enum, auto
 from os.path import dirname, join, realpath
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from qrules.conservation_rules import (
     BaryonNumberConservation,
@@ -41,7 +41,7 @@ from qrules.conservation_rules import (
     spin_magnitude_conservation,
     spin_validity,
 )
-from qrules.particle import Particle, ParticleCollection
+from qrules.particle import _COLUMNS, ParticleCollection
 from qrules.quantum_numbers import EdgeQuantumNumbers as EdgeQN
 from qrules.quantum_numbers import NodeQuantumNumbers as NodeQN
 from qrules.quantum_numbers import arange
@@ -259,26 +259,25 @@ def _create_domains(particle_db: ParticleCollection) -> Dict[Any, list]:
         EdgeQN.g_parity: [-1, +1, None],
     }
 
-    for edge_qn, getter in {
-        EdgeQN.charge: lambda p: p.charge,
-        EdgeQN.baryon_number: lambda p: p.baryon_number,
-        EdgeQN.strangeness: lambda p: p.strangeness,
-        EdgeQN.charmness: lambda p: p.charmness,
-        EdgeQN.bottomness: lambda p: p.bottomness,
+    for edge_qn, column in {
+        EdgeQN.charge: "charge",
+        EdgeQN.baryon_number: "baryon_number",
+        EdgeQN.strangeness: "strangeness",
+        EdgeQN.charmness: "charmness",
+        EdgeQN.bottomness: "bottomness",
     }.items():
         domains[edge_qn] = __extend_negative(
-            __positive_int_domain(particle_db, getter)
+            _int_domain(0, __get_maximum(particle_db, column))
         )
 
-    domains[EdgeQN.spin_magnitude] = __positive_halves_domain(
-        particle_db, lambda p: p.spin
+    domains[EdgeQN.spin_magnitude] = _halves_domain(
+        0, __get_maximum(particle_db, "spin")
     )
     domains[EdgeQN.spin_projection] = __extend_negative(
         domains[EdgeQN.spin_magnitude]
     )
-    domains[EdgeQN.isospin_magnitude] = __positive_halves_domain(
-        particle_db,
-        lambda p: 0 if p.isospin is None else p.isospin.magnitude,
+    domains[EdgeQN.isospin_magnitude] = _halves_domain(
+        0, __get_maximum(particle_db, "isospin_magnitude")
     )
     domains[EdgeQN.isospin_projection] = __extend_negative(
         domains[EdgeQN.isospin_magnitude]
@@ -306,18 +305,49 @@ class NumberOfThreads:
         cls.__n_cores = n_cores
 
 
-def __positive_halves_domain(
-    particle_db: ParticleCollection, attr_getter: Callable[[Particle], Any]
-) -> List[float]:
-    values = set(map(attr_getter, particle_db))
-    return _halves_domain(0, max(values))
+class PersistentWorkerPool:
+    """Keep the worker processes alive between calls to `.find_solutions`.
+
+    If `.NumberOfThreads` is larger than one, the problem sets of a
+    `.StateTransitionManager` are solved by a pool of worker processes. By
+    default, that pool is terminated once all solutions have been found. If
+    this setting is enabled, the pool is reused by subsequent calls to
+    :meth:`.StateTransitionManager.find_solutions` and
+    `.generate_transitions`, which saves the time to start the workers and to
+    send them the allowed intermediate particles. The pool is terminated when
+    the setting is disabled again or when the interpreter exits.
+    """
 
+    __enabled: bool = False
 
-def __positive_int_domain(
-    particle_db: ParticleCollection, attr_getter: Callable[[Particle], Any]
-) -> List[int]:
-    values = set(map(attr_getter, particle_db))
-    return _int_domain(0, max(values))
+    @classmethod
+    def get(cls) -> bool:
+        return cls.__enabled
+
+    @classmethod
+    def set(cls, enabled: bool) -> None:  # noqa: A003
+        if not isinstance(enabled, bool):
+            raise TypeError("Can only enable or disable the worker pool")
+        cls.__enabled = enabled
+        if not enabled:
+            # pylint: disable=import-outside-toplevel
+            from qrules._worker_pool import shutdown
+
+            shutdown()
+
+
+def __get_maximum(particle_db: ParticleCollection, column: str) -> Any:
+    """Largest value in a column of `.ParticleCollection.columns`.
+
+    Missing values (:code:`nan`) are ignored. Without :mod:`numpy`, the
+    values are computed particle by particle.
+    """
+    try:
+        values = particle_db.columns[column]
+    except ImportError:
+        getter, _ = _COLUMNS[column]
+        return max(v for v in map(getter, particle_db) if v == v)
+    return values[values == values].max().item()
 
 
 def _halves_domain(start: float, stop: float) -> List[float]:
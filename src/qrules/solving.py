@@ -10,17 +10,22 @@ module.
 
 
 import inspect
+import json
 import logging
 import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from copy import copy
+from itertools import chain, islice
+from time import perf_counter
+from types import FunctionType
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -35,6 +40,7 @@ from attrs import define, field, frozen
 from constraint import (
     BacktrackingSolver,
     Constraint,
+    Domain,
     Problem,
     Unassigned,
     Variable,
@@ -42,6 +48,7 @@ from constraint import (
 
 from qrules._implementers import implement_pretty_repr
 
+from ._rule_cache import RULE_CACHE, create_rule_key
 from .argument_handling import (
     GraphEdgePropertyMap,
     GraphElementRule,
@@ -242,11 +249,23 @@ class Solver(ABC):
           rules due to requirement issues.
         """
 
+    def iter_solutions(
+        self, problem_set: QNProblemSet
+    ) -> Iterator[QuantumNumberSolution]:
+        """Generate the solutions for the given input one by one.
+
+        Unlike :meth:`find_solutions`, solutions can be processed while the
+        solver is still searching for the next one. No information about
+        violated rules is given if there are no solutions; use
+        :meth:`find_solutions` for that.
+        """
+        yield from self.find_solutions(problem_set).solutions
+
 
 def _merge_particle_candidates_with_solutions(
     solutions: List[QuantumNumberSolution],
     topology: Topology,
-    allowed_particles: List[GraphEdgePropertyMap],
+    allowed_particles: "_ParticleCandidateIndex",
 ) -> List[QuantumNumberSolution]:
     merged_solutions = []
 
@@ -255,9 +274,8 @@ def _merge_particle_candidates_with_solutions(
     for solution in solutions:
         current_new_solutions = [solution]
         for int_edge_id in intermediate_edges:
-            particle_edges = __get_particle_candidates_for_state(
-                solution.states[int_edge_id],
-                allowed_particles,
+            particle_edges = allowed_particles.find_candidates(
+                solution.states[int_edge_id]
             )
             if len(particle_edges) == 0:
                 logging.debug("Did not find any particle candidates for")
@@ -285,31 +303,73 @@ def _merge_particle_candidates_with_solutions(
     return merged_solutions
 
 
-def __get_particle_candidates_for_state(
-    state: GraphEdgePropertyMap,
-    allowed_particles: List[GraphEdgePropertyMap],
-) -> List[GraphEdgePropertyMap]:
-    particle_edges = []
+_IndexKey = Tuple[Type[EdgeQuantumNumber], ...]
 
-    for particle_qns in allowed_particles:
-        if __is_sub_mapping(state, particle_qns):
-            particle_edges.append(particle_qns)
 
-    return particle_edges
+class _ParticleCandidateIndex:
+    """Hash index over the quantum numbers of the allowed particles.
 
+    An intermediate edge in a solution is matched by all particles that have
+    the same values for the quantum numbers that the solver assigned to that
+    edge (except for the spin projection, which is not a particle property).
+    The index is created lazily for each combination of quantum number types
+    that is requested, so that the particle candidates for an edge can be
+    looked up by value instead of comparing the edge with each particle.
+    """
 
-def __is_sub_mapping(
-    qn_state: GraphEdgePropertyMap, reference_qn_state: GraphEdgePropertyMap
-) -> bool:
-    for qn_type, qn_value in qn_state.items():
-        if qn_type is EdgeQuantumNumbers.spin_projection:
-            continue
-        if qn_type not in reference_qn_state:
-            return False
-        if qn_value != reference_qn_state[qn_type]:
-            return False
+    def __init__(self, particles: Iterable[GraphEdgePropertyMap]) -> None:
+        self.__particles = list(particles)
+        self.__indices: Dict[
+            _IndexKey, Dict[Tuple[Scalar, ...], List[GraphEdgePropertyMap]]
+        ] = {}
+        self.__key_orders: Dict[_IndexKey, _IndexKey] = {}
 
-    return True
+    @property
+    def particles(self) -> List[GraphEdgePropertyMap]:
+        return self.__particles
+
+    def find_candidates(
+        self, state: GraphEdgePropertyMap
+    ) -> List[GraphEdgePropertyMap]:
+        """Get all particles of which the quantum numbers match the state."""
+        qn_types = self.__get_key_order(tuple(state))
+        index = self.get_index(qn_types)
+        return index.get(tuple(state[qn_type] for qn_type in qn_types), [])
+
+    def get_index(
+        self, qn_types: _IndexKey
+    ) -> Dict[Tuple[Scalar, ...], List[GraphEdgePropertyMap]]:
+        """Get particles grouped by their values for the given quantum numbers.
+
+        Particles that do not define all of these quantum numbers are left
+        out.
+        """
+        index = self.__indices.get(qn_types)
+        if index is None:
+            index = defaultdict(list)
+            for particle_qns in self.__particles:
+                if all(qn_type in particle_qns for qn_type in qn_types):
+                    key = tuple(particle_qns[qn_type] for qn_type in qn_types)
+                    index[key].append(particle_qns)
+            index = dict(index)
+            self.__indices[qn_types] = index
+        return index
+
+    def __get_key_order(self, qn_types: _IndexKey) -> _IndexKey:
+        ordered_types = self.__key_orders.get(qn_types)
+        if ordered_types is None:
+            ordered_types = tuple(
+                sorted(
+                    (
+                        qn_type
+                        for qn_type in qn_types
+                        if qn_type is not EdgeQuantumNumbers.spin_projection
+                    ),
+                    key=lambda q: q.__name__,
+                )
+            )
+            self.__key_orders[qn_types] = ordered_types
+        return ordered_types
 
 
 def validate_full_solution(problem_set: QNProblemSet) -> QNResult:
@@ -448,8 +508,40 @@ def validate_full_solution(problem_set: QNProblemSet) -> QNResult:
     )
 
 
+def _validate_with_rules(
+    problem_set: QNProblemSet,
+    solution: QuantumNumberSolution,
+    node_rules: Dict[int, Set[Rule]],
+    edge_rules: Dict[int, Set[GraphElementRule]],
+) -> QNResult:
+    """Validate a full solution with rules the solver could not execute."""
+    topology = problem_set.topology
+    interactions = solution.interactions
+    states = solution.states
+    interactions.update(problem_set.initial_facts.interactions)
+    states.update(problem_set.initial_facts.states)
+    return validate_full_solution(
+        QNProblemSet(
+            initial_facts=MutableTransition(topology, states, interactions),
+            solving_settings=MutableTransition(
+                topology,
+                interactions={
+                    i: NodeSettings(conservation_rules=rules)
+                    for i, rules in node_rules.items()
+                },
+                states={
+                    i: EdgeSettings(conservation_rules=rules)
+                    for i, rules in edge_rules.items()
+                },
+            ),
+        )
+    )
+
+
 _EdgeVariableInfo = Tuple[int, Type[EdgeQuantumNumber]]
 _NodeVariableInfo = Tuple[int, Type[NodeQuantumNumber]]
+_ConstraintInfo = Tuple[Optional[int], Constraint, List[str]]
+"""Constraint with its variable names and the ID of its node."""
 
 
 def _create_variable_string(
@@ -482,11 +574,28 @@ class CSPSolver(Solver):
     composite quantum numbers which are attributed to the interaction nodes
     (such as angular momentum :math:`L`). The conservation rules serve as the
     constraints and a special wrapper class serves as an adapter.
+
+    Args:
+        allowed_intermediate_particles: Quantum numbers of the particles that
+            are allowed on the intermediate edges.
+        use_particle_table: Add a table constraint for each intermediate edge,
+            so that only those combinations of quantum numbers are considered
+            that belong to one of the
+            :code:`allowed_intermediate_particles`. Without this constraint,
+            the quantum numbers of an intermediate edge are searched
+            independently and combinations that do not correspond to any
+            particle are only filtered out after solving.
+        rule_statistics: Order the rules by their cost and selectivity and
+            record these for the rules that are checked, see
+            `.RuleStatistics`.
     """
 
     # pylint: disable=too-many-instance-attributes
     def __init__(
-        self, allowed_intermediate_particles: List[GraphEdgePropertyMap]
+        self,
+        allowed_intermediate_particles: List[GraphEdgePropertyMap],
+        use_particle_table: bool = False,
+        rule_statistics: Optional["RuleStatistics"] = None,
     ):
         self.__variables: Set[
             Union[_EdgeVariableInfo, _NodeVariableInfo]
@@ -502,15 +611,109 @@ class CSPSolver(Solver):
         self.__non_executable_edge_rules: Dict[
             int, Set[GraphElementRule]
         ] = defaultdict(set)
-        self.__problem = Problem(BacktrackingSolver(True))
-        self.__allowed_intermediate_particles = allowed_intermediate_particles
+        self.__domains: Dict[str, List[Any]] = {}
+        self.__constraints: List[_ConstraintInfo] = []
+        self.__allowed_intermediate_particles = _ParticleCandidateIndex(
+            allowed_intermediate_particles
+        )
+        self.__use_particle_table = use_particle_table
+        self.__rule_statistics = rule_statistics
         self.__scoresheet = Scoresheet()
 
+    @property
+    def domains(self) -> Dict[str, List[Any]]:
+        """Domains of the variables of the last solved `.QNProblemSet`."""
+        return self.__domains
+
+    @property
+    def scoresheet(self) -> "Scoresheet":
+        """Rule calls of the last solved `.QNProblemSet`."""
+        return self.__scoresheet
+
     def find_solutions(self, problem_set: QNProblemSet) -> QNResult:
-        # pylint: disable=too-many-locals
         self.__initialize_constraints(problem_set)
-        solutions = self.__problem.getSolutions()
+        solutions = list(
+            self._solve_constraints(self.__domains, self.__constraints)
+        )
+        if self.__rule_statistics is not None:
+            self.__rule_statistics.record(self.__scoresheet)
+        (
+            node_not_executed_rules,
+            node_not_satisfied_rules,
+            edge_not_executed_rules,
+            edge_not_satisfied_rules,
+        ) = self.__evaluate_scoresheet()
+        full_particle_solutions = list(
+            self.__complete_solutions(problem_set, solutions)
+        )
+
+        if full_particle_solutions and (
+            node_not_executed_rules or edge_not_executed_rules
+        ):
+            # rerun solver on these graphs using not executed rules
+            # and combine results
+            result = QNResult()
+            for full_particle_solution in full_particle_solutions:
+                result.extend(
+                    _validate_with_rules(
+                        problem_set,
+                        full_particle_solution,
+                        node_not_executed_rules,
+                        edge_not_executed_rules,
+                    )
+                )
+            return result
+
+        return QNResult(
+            full_particle_solutions,
+            _convert_non_executed_rules_to_names(node_not_executed_rules),
+            _convert_violated_rules_to_names(node_not_satisfied_rules),
+            _convert_non_executed_rules_to_names(edge_not_executed_rules),
+            _convert_violated_rules_to_names(edge_not_satisfied_rules),
+        )
+
+    def iter_solutions(
+        self, problem_set: QNProblemSet
+    ) -> Iterator[QuantumNumberSolution]:
+        self.__initialize_constraints(problem_set)
+        solutions = iter(
+            self._solve_constraints(self.__domains, self.__constraints)
+        )
+        # Once a first solution has been found, each constraint that can be
+        # executed has been called, so the scoresheet tells which rules have
+        # to be validated afterwards.
+        first_solutions = list(islice(solutions, 1))
+        (
+            node_not_executed_rules,
+            _,
+            edge_not_executed_rules,
+            _,
+        ) = self.__evaluate_scoresheet()
+        for full_particle_solution in self.__complete_solutions(
+            problem_set, chain(first_solutions, solutions)
+        ):
+            if node_not_executed_rules or edge_not_executed_rules:
+                result = _validate_with_rules(
+                    problem_set,
+                    full_particle_solution,
+                    node_not_executed_rules,
+                    edge_not_executed_rules,
+                )
+                yield from result.solutions
+            else:
+                yield full_particle_solution
+        if self.__rule_statistics is not None:
+            self.__rule_statistics.record(self.__scoresheet)
 
+    def __evaluate_scoresheet(
+        self,
+    ) -> Tuple[
+        Dict[int, Set[Rule]],
+        Dict[int, Set[Rule]],
+        Dict[int, Set[GraphElementRule]],
+        Dict[int, Set[GraphElementRule]],
+    ]:
+        """Determine which rules were not executed or never satisfied."""
         node_not_executed_rules = self.__non_executable_node_rules
         node_not_satisfied_rules: Dict[int, Set[Rule]] = defaultdict(set)
         edge_not_executed_rules = self.__non_executable_edge_rules
@@ -530,77 +733,62 @@ class CSPSolver(Solver):
                     edge_not_executed_rules[edge_id].add(rule)
                 elif self.__scoresheet.rule_passes[(edge_id, rule)] == 0:
                     edge_not_satisfied_rules[edge_id].add(rule)
-
-        solutions = self.__convert_solution_keys(
-            problem_set.topology, solutions
+        return (
+            node_not_executed_rules,
+            node_not_satisfied_rules,
+            edge_not_executed_rules,
+            edge_not_satisfied_rules,
         )
 
-        # insert particle instances
-        if self.__node_rules or self.__edge_rules:
-            full_particle_solutions = (
-                _merge_particle_candidates_with_solutions(
-                    solutions,
-                    problem_set.topology,
-                    self.__allowed_intermediate_particles,
-                )
+    def __complete_solutions(
+        self,
+        problem_set: QNProblemSet,
+        solutions: Iterable[Dict[str, Scalar]],
+    ) -> Iterator[QuantumNumberSolution]:
+        """Convert CSP solutions and insert the particle candidates."""
+        if not self.__node_rules and not self.__edge_rules:
+            yield QuantumNumberSolution(
+                topology=problem_set.topology,
+                interactions=problem_set.initial_facts.interactions,
+                states=problem_set.initial_facts.states,
+            )
+            return
+        for solution in solutions:
+            yield from _merge_particle_candidates_with_solutions(
+                [self.__convert_solution_keys(problem_set.topology, solution)],
+                problem_set.topology,
+                self.__allowed_intermediate_particles,
             )
-        else:
-            full_particle_solutions = [
-                QuantumNumberSolution(
-                    topology=problem_set.topology,
-                    interactions=problem_set.initial_facts.interactions,
-                    states=problem_set.initial_facts.states,
-                )
-            ]
 
-        if full_particle_solutions and (
-            node_not_executed_rules or edge_not_executed_rules
-        ):
-            # rerun solver on these graphs using not executed rules
-            # and combine results
-            topology = problem_set.topology
-            result = QNResult()
-            for full_particle_solution in full_particle_solutions:
-                interactions = full_particle_solution.interactions
-                states = full_particle_solution.states
-                interactions.update(problem_set.initial_facts.interactions)
-                states.update(problem_set.initial_facts.states)
-                result.extend(
-                    validate_full_solution(
-                        QNProblemSet(
-                            initial_facts=MutableTransition(
-                                topology, states, interactions
-                            ),
-                            solving_settings=MutableTransition(
-                                topology,
-                                interactions={
-                                    i: NodeSettings(conservation_rules=rules)
-                                    for i, rules in node_not_executed_rules.items()
-                                },
-                                states={
-                                    i: EdgeSettings(conservation_rules=rules)
-                                    for i, rules in edge_not_executed_rules.items()
-                                },
-                            ),
-                        )
-                    )
-                )
-            return result
+    def _solve_constraints(  # pylint: disable=no-self-use
+        self,
+        domains: Dict[str, List[Any]],
+        constraints: List[_ConstraintInfo],
+    ) -> Iterable[Dict[str, Scalar]]:
+        """Find all assignments of the variables that satisfy the constraints.
 
-        return QNResult(
-            full_particle_solutions,
-            _convert_non_executed_rules_to_names(node_not_executed_rules),
-            _convert_violated_rules_to_names(node_not_satisfied_rules),
-            _convert_non_executed_rules_to_names(edge_not_executed_rules),
-            _convert_violated_rules_to_names(edge_not_satisfied_rules),
-        )
+        Args:
+            domains: Mapping of variable names to their domains.
+            constraints: The constraints in the order in which they should be
+                checked, each with the names of the variables it acts on and
+                the ID of the node to which it is attached.
+        """
+        problem = Problem(BacktrackingSolver(True))
+        for var_string, domain in domains.items():
+            problem.addVariable(var_string, domain)
+        for _, constraint, var_strings in constraints:
+            problem.addConstraint(constraint, var_strings)
+        return problem.getSolutionIter()
 
     def __clear(self) -> None:
         self.__variables = set()
         self.__var_string_to_data = {}
         self.__node_rules = defaultdict(set)
+        self.__non_executable_node_rules = defaultdict(set)
         self.__edge_rules = defaultdict(set)
-        self.__problem = Problem(BacktrackingSolver(True))
+        self.__non_executable_edge_rules = defaultdict(set)
+        self.__domains = {}
+        self.__constraints = []
         self.__scoresheet = Scoresheet()
 
     def __initialize_constraints(self, problem_set: QNProblemSet) -> None:
@@ -634,7 +822,10 @@ class CSPSolver(Solver):
                 priority_list, key=lambda x: x[1], reverse=True
             )
             # and strip away the priorities again
-            return [x[0] for x in sorted_list]
+            rules = [x[0] for x in sorted_list]
+            if self.__rule_statistics is not None:
+                return self.__rule_statistics.sort_rules(rules)
+            return rules
 
         arg_handler = RuleArgumentHandler()
 
@@ -667,7 +858,15 @@ class CSPSolver(Solver):
                         _create_variable_string(*x) for x in edge_vars
                     ]
                     self.__edge_rules[edge_id].add(rule)  # type: ignore[arg-type]
-                    self.__problem.addConstraint(constraint, var_strings)
+                    self.__constraints.append(
+                        (
+                            _get_attached_node_id(
+                                problem_set.topology, edge_id
+                            ),
+                            constraint,
+                            var_strings,
+                        )
+                    )
                 else:
                     self.__non_executable_edge_rules[edge_id].add(rule)  # type: ignore[arg-type]
 
@@ -733,10 +932,56 @@ class CSPSolver(Solver):
                         _create_variable_string(*x) for x in var_list
                     ]
                     self.__node_rules[node_id].add(rule)
-                    self.__problem.addConstraint(constraint, var_strings)
+                    self.__constraints.append(
+                        (node_id, constraint, var_strings)
+                    )
                 else:
                     self.__non_executable_node_rules[node_id].add(rule)
 
+        if self.__use_particle_table:
+            self.__constraints[:0] = self.__create_particle_table_constraints(
+                problem_set.topology
+            )
+
+    def __create_particle_table_constraints(
+        self, topology: Topology
+    ) -> List[_ConstraintInfo]:
+        """Restrict intermediate edges to quantum numbers of allowed particles.
+
+        The quantum number variables of an intermediate edge are combined into
+        one table constraint, so that only combinations of quantum numbers that
+        belong to one of the allowed intermediate particles are considered. The
+        spin projection is left free, because it is not a property of the
+        particle.
+        """
+        edge_variables: Dict[int, List[Type[EdgeQuantumNumber]]] = defaultdict(
+            list
+        )
+        for element_id, qn_type in sorted(
+            self.__variables, key=lambda x: (x[0], x[1].__name__)
+        ):
+            if qn_type not in getattr(  # noqa: B009
+                EdgeQuantumNumber, "__args__"
+            ):
+                continue
+            if qn_type is EdgeQuantumNumbers.spin_projection:
+                continue
+            edge_variables[element_id].append(qn_type)  # type: ignore[arg-type]
+
+        constraints: List[_ConstraintInfo] = []
+        for edge_id, qn_types in edge_variables.items():
+            allowed_values = self.__allowed_intermediate_particles.get_index(
+                tuple(qn_types)
+            )
+            constraints.append(
+                (
+                    _get_attached_node_id(topology, edge_id),
+                    _ParticleTableConstraint(allowed_values),
+                    [_create_variable_string(edge_id, x) for x in qn_types],
+                )
+            )
+        return constraints
+
     def __create_node_variables(
         self,
         node_id: int,
@@ -819,51 +1064,203 @@ class CSPSolver(Solver):
             self.__variables.add(var_info)
             var_string = _create_variable_string(*var_info)
             self.__var_string_to_data[var_string] = var_info
-            self.__problem.addVariable(var_string, domain)
+            self.__domains[var_string] = domain
 
     def __convert_solution_keys(
-        self, topology: Topology, solutions: List[Dict[str, Scalar]]
-    ) -> List[QuantumNumberSolution]:
-        """Convert keys of CSP solutions from `str` to quantum number types."""
-        converted_solutions = []
-        for solution in solutions:
-            states: Dict[int, GraphEdgePropertyMap] = defaultdict(dict)
-            interactions: Dict[int, GraphNodePropertyMap] = defaultdict(dict)
-            for var_string, value in solution.items():
-                ele_id, qn_type = self.__var_string_to_data[var_string]
+        self, topology: Topology, solution: Dict[str, Scalar]
+    ) -> QuantumNumberSolution:
+        """Convert keys of a CSP solution from `str` to quantum numbers."""
+        states: Dict[int, GraphEdgePropertyMap] = defaultdict(dict)
+        interactions: Dict[int, GraphNodePropertyMap] = defaultdict(dict)
+        for var_string, value in solution.items():
+            ele_id, qn_type = self.__var_string_to_data[var_string]
+
+            if qn_type in getattr(EdgeQuantumNumber, "__args__"):  # noqa: B009
+                states[ele_id].update({qn_type: value})  # type: ignore[dict-item]
+            else:
+                interactions[ele_id].update({qn_type: value})  # type: ignore[dict-item]
+        return MutableTransition(topology, states, interactions)
 
-                if qn_type in getattr(  # noqa: B009
-                    EdgeQuantumNumber, "__args__"
-                ):
-                    states[ele_id].update({qn_type: value})  # type: ignore[dict-item]
-                else:
-                    interactions[ele_id].update({qn_type: value})  # type: ignore[dict-item]
-            converted_solutions.append(
-                MutableTransition(topology, states, interactions)
+
+def _get_attached_node_id(topology: Topology, edge_id: int) -> Optional[int]:
+    """Get the node to which the constraints of an edge are attached."""
+    edge = topology.edges[edge_id]
+    if edge.originating_node_id is not None:
+        return edge.originating_node_id
+    return edge.ending_node_id
+
+
+class TreeSolver(CSPSolver):
+    """Solver that makes use of the tree structure of a `.Topology`.
+
+    Instead of solving one large Constraint Satisfaction Problem for the whole
+    `.Topology`, each interaction node is solved as a small, local CSP. The
+    local solutions are then joined on the variables that they share, which are
+    the quantum numbers of the intermediate edges that connect the nodes.
+    Isobar and n-body topologies are trees, so the join is done with dynamic
+    programming: a semi-join pass discards local solutions that cannot be
+    extended to a full solution, after which the remaining local solutions are
+    combined with a hash join.
+
+    The constraints, the merging with particle candidates and the validation of
+    rules that could not be executed are the same as for the `.CSPSolver`, so
+    both solvers result in the same `.QNResult`.
+    """
+
+    def _solve_constraints(
+        self,
+        domains: Dict[str, List[Any]],
+        constraints: List[_ConstraintInfo],
+    ) -> Iterable[Dict[str, Scalar]]:
+        # pylint: disable=too-many-locals
+        node_constraints: Dict[
+            Optional[int], List[Tuple[Constraint, List[str]]]
+        ] = defaultdict(list)
+        for node_id, constraint, var_strings in constraints:
+            node_constraints[node_id].append((constraint, var_strings))
+        node_variables = {
+            node_id: {v for _, var_strings in items for v in var_strings}
+            for node_id, items in node_constraints.items()
+        }
+        order, parents = _order_by_shared_variables(node_variables)
+        if not order:
+            return []
+
+        local_solutions: Dict[Optional[int], List[Dict[str, Scalar]]] = {}
+        allowed_values: Dict[str, Set[Scalar]] = {}
+        is_feasible = True
+        for node_id in order:
+            problem = Problem(BacktrackingSolver(True))
+            for var_string in sorted(node_variables[node_id]):
+                domain = domains[var_string]
+                if is_feasible and var_string in allowed_values:
+                    domain = [
+                        x for x in domain if x in allowed_values[var_string]
+                    ]
+                if not domain:
+                    is_feasible = False
+                    domain = domains[var_string]
+                problem.addVariable(var_string, domain)
+            for constraint, var_strings in node_constraints[node_id]:
+                problem.addConstraint(constraint, var_strings)
+            # all nodes are solved, so that the scoresheet is also filled
+            # for nodes that come after an unsolvable node
+            solutions = problem.getSolutions()
+            local_solutions[node_id] = solutions
+            if not solutions:
+                is_feasible = False
+            if is_feasible:
+                for var_string in node_variables[node_id]:
+                    allowed_values[var_string] = {
+                        solution[var_string] for solution in solutions
+                    }
+        if not is_feasible:
+            return []
+
+        for node_id in reversed(order):
+            parent_id = parents[node_id]
+            if parent_id is None:
+                continue
+            shared = sorted(
+                node_variables[node_id] & node_variables[parent_id]
             )
-        return converted_solutions
+            keys = {
+                tuple(solution[v] for v in shared)
+                for solution in local_solutions[node_id]
+            }
+            local_solutions[parent_id] = [
+                solution
+                for solution in local_solutions[parent_id]
+                if tuple(solution[v] for v in shared) in keys
+            ]
+        return _join_local_solutions(order, node_variables, local_solutions)
+
+
+_T = TypeVar("_T")
+
+
+def _order_by_shared_variables(
+    variables: Dict[_T, Set[str]]
+) -> Tuple[List[_T], Dict[_T, Optional[_T]]]:
+    """Order groups of variables breadth-first over their shared variables.
+
+    Returns the order in which the groups are visited and, for each group, the
+    group from which it was reached (`None` for the first group of each
+    connected component).
+    """
+    order: List[_T] = []
+    parents: Dict[_T, Optional[_T]] = {}
+    for root in variables:
+        if root in parents:
+            continue
+        parents[root] = None
+        queue = [root]
+        while queue:
+            current = queue.pop(0)
+            order.append(current)
+            for other, other_variables in variables.items():
+                if other in parents:
+                    continue
+                if other_variables & variables[current]:
+                    parents[other] = current
+                    queue.append(other)
+    return order, parents
+
+
+def _join_local_solutions(
+    order: List[_T],
+    variables: Dict[_T, Set[str]],
+    local_solutions: Dict[_T, List[Dict[str, Scalar]]],
+) -> Iterator[Dict[str, Scalar]]:
+    indices = []
+    joined_variables: Set[str] = set()
+    for key in order:
+        shared = sorted(variables[key] & joined_variables)
+        index: Dict[Tuple[Scalar, ...], List[Dict[str, Scalar]]] = defaultdict(
+            list
+        )
+        for solution in local_solutions[key]:
+            index[tuple(solution[v] for v in shared)].append(solution)
+        indices.append((shared, index))
+        joined_variables |= variables[key]
+
+    def extend(
+        partial_solution: Dict[str, Scalar], depth: int
+    ) -> Iterator[Dict[str, Scalar]]:
+        if depth == len(indices):
+            yield partial_solution
+            return
+        shared, index = indices[depth]
+        key = tuple(partial_solution[v] for v in shared)
+        for solution in index.get(key, []):
+            yield from extend({**partial_solution, **solution}, depth + 1)
+
+    return extend({}, 0)
 
 
 class Scoresheet:
     def __init__(self) -> None:
         self.__rule_calls: Dict[Tuple[int, Rule], int] = {}
         self.__rule_passes: Dict[Tuple[int, Rule], int] = {}
+        self.__rule_time: Dict[Tuple[int, Rule], float] = {}
 
     def register_rule(
         self, graph_element_id: int, rule: Rule
-    ) -> Callable[[bool], None]:
+    ) -> Callable[..., None]:
         self.__rule_calls[(graph_element_id, rule)] = 0
         self.__rule_passes[(graph_element_id, rule)] = 0
+        self.__rule_time[(graph_element_id, rule)] = 0.0
 
         return self.__create_callback(graph_element_id, rule)
 
     def __create_callback(
         self, graph_element_id: int, rule: Rule
-    ) -> Callable[[bool], None]:
-        def passed_callback(passed: bool) -> None:
+    ) -> Callable[..., None]:
+        def passed_callback(passed: bool, duration: float = 0.0) -> None:
             if passed:
                 self.__rule_passes[(graph_element_id, rule)] += 1
             self.__rule_calls[(graph_element_id, rule)] += 1
+            self.__rule_time[(graph_element_id, rule)] += duration
 
         return passed_callback
 
@@ -875,6 +1272,127 @@ class Scoresheet:
     def rule_passes(self) -> Dict[Tuple[int, Rule], int]:
         return self.__rule_passes
 
+    @property
+    def rule_time(self) -> Dict[Tuple[int, Rule], float]:
+        """Seconds spent on evaluating each rule.
+
+        Checks of which the result was taken from the rule cache do not add
+        to this time.
+        """
+        return self.__rule_time
+
+
+class RuleStatistics:
+    """Cost and selectivity of rules, gathered over many problem sets.
+
+    If a `.CSPSolver` is given an instance of this class, it records how
+    often each rule was checked, how often it rejected the quantum numbers,
+    and how much time it took to evaluate the rule. Checks that are answered
+    by the rule cache take no time. The rules of each edge and node are
+    then ordered by the expected time to reject, so that cheap rules that
+    often fail are checked first. This order overrides the
+    :code:`rule_priorities` of the `.EdgeSettings` and `.NodeSettings`.
+    Rules of which no statistics are known yet are checked first, in the
+    order of their priorities.
+
+    Rules are identified by the name of their function or class, so the
+    statistics can be stored with :meth:`dump` and used in a later run with
+    :meth:`load`.
+    """
+
+    def __init__(self) -> None:
+        self.__calls: Dict[str, int] = defaultdict(int)
+        self.__rejections: Dict[str, int] = defaultdict(int)
+        self.__time: Dict[str, float] = defaultdict(float)
+
+    def record(self, scoresheet: Scoresheet) -> None:
+        """Add the rule calls of a `.Scoresheet` to the statistics."""
+        for key, calls in scoresheet.rule_calls.items():
+            if not calls:
+                continue
+            _, rule = key
+            name = self.get_rule_name(rule)
+            self.__calls[name] += calls
+            self.__rejections[name] += calls - scoresheet.rule_passes[key]
+            self.__time[name] += scoresheet.rule_time[key]
+
+    def merge(self, other: "RuleStatistics") -> None:
+        """Add the statistics of another instance to this one.
+
+        This is used to collect the statistics that worker processes record.
+        """
+        for name, calls in other.__calls.items():
+            self.__calls[name] += calls
+            self.__rejections[name] += other.__rejections[name]
+            self.__time[name] += other.__time[name]
+
+    def get_score(self, rule: Rule) -> Optional[float]:
+        """Expected time in seconds that it takes the rule to reject.
+
+        Returns `None` if the rule has not been checked yet and
+        :code:`float("inf")` if it has never rejected anything.
+        """
+        name = self.get_rule_name(rule)
+        calls = self.__calls.get(name)
+        if not calls:
+            return None
+        rejections = self.__rejections[name]
+        if not rejections:
+            return float("inf")
+        return self.__time[name] / rejections
+
+    def sort_rules(self, rules: Iterable[Rule]) -> List[Rule]:
+        """Order rules by their score, see :meth:`get_score`."""
+
+        def get_sort_key(rule: Rule) -> float:
+            score = self.get_score(rule)
+            if score is None:
+                return float("-inf")
+            return score
+
+        return sorted(rules, key=get_sort_key)
+
+    @staticmethod
+    def get_rule_name(rule: Rule) -> str:
+        rule_type: Union[FunctionType, type]
+        if inspect.isfunction(rule) or inspect.isclass(rule):
+            rule_type = rule
+        else:
+            rule_type = type(rule)
+        return f"{rule_type.__module__}.{rule_type.__qualname__}"
+
+    def asdict(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        return {
+            name: {
+                "calls": calls,
+                "rejections": self.__rejections[name],
+                "time": self.__time[name],
+            }
+            for name, calls in self.__calls.items()
+        }
+
+    def dump(self, filename: str) -> None:
+        """Write the statistics to a JSON file."""
+        with open(filename, "w") as stream:
+            json.dump(self.asdict(), stream, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, filename: str) -> "RuleStatistics":
+        """Read statistics that were written with :meth:`dump`."""
+        with open(filename) as stream:
+            definition = json.load(stream)
+        statistics = cls()
+        for name, values in definition.items():
+            statistics.__calls[name] = int(values["calls"])
+            statistics.__rejections[name] = int(values["rejections"])
+            statistics.__time[name] = float(values["time"])
+        return statistics
+
+
+def _get_qn_name(item: Tuple[type, Any]) -> str:
+    qn_type, _ = item
+    return qn_type.__name__
+
 
 _QNType = TypeVar(  # pylint: disable=invalid-name
     "_QNType", EdgeQuantumNumber, NodeQuantumNumber
@@ -895,21 +1413,29 @@ class _GraphElementConstraint(Generic[_QNType], Constraint):
         variables: Set[Tuple[int, Type[_QNType]]],
         fixed_variables: Dict[int, Dict[Type[_QNType], Scalar]],
         argument_handler: RuleArgumentHandler,
-        scoresheet: Callable[[bool], None],
+        scoresheet: Callable[..., None],
     ) -> None:
         if not callable(rule):
             raise TypeError("rule argument has to be a callable")
         self.__rule = rule
         (
-            self.__check_rule_requirements,
+            check_rule_requirements,
             self.__create_rule_args,
         ) = argument_handler.register_rule(rule)
         self.__score_callback = scoresheet
+        self.__duration = 0.0
 
         self.__var_string_to_data: Dict[str, Type[_QNType]] = {}
         self.__qns: Dict[Type[_QNType], Optional[Scalar]] = {}
 
         self.__initialize_variable_containers(variables, fixed_variables)
+        self.__qns = dict(sorted(self.__qns.items(), key=_get_qn_name))
+        # the quantum numbers that are available do not change when solving
+        self.__requirements_met = check_rule_requirements(self.__qns)
+        rule_key = create_rule_key(rule)
+        self.__rule_key: Optional[tuple] = None
+        if rule_key is not None:
+            self.__rule_key = (rule_key, tuple(self.__qns))
 
     @property
     def rule(self) -> Rule:
@@ -968,22 +1494,44 @@ class _GraphElementConstraint(Generic[_QNType], Constraint):
                 Boolean value stating if this constraint is currently broken
                 or not.
         """
+        if not self.__requirements_met:
+            return True
+
         params = [(x, assignments.get(x, _unassigned)) for x in variables]
         missing = [name for (name, val) in params if val is _unassigned]
         if missing:
+            if forwardcheck and len(missing) == 1:
+                (variable,) = missing
+                self.__update_variable_lists(
+                    [(x, val) for x, val in params if x != variable]
+                )
+                return _hide_violating_values(
+                    domains[variable],
+                    lambda value: self.__update_variable_lists(
+                        [(variable, value)]
+                    ),
+                    self.__check,
+                )
             return True
 
         self.__update_variable_lists(params)
 
-        if not self.__check_rule_requirements(
-            self.__qns,
-        ):
-            return True
-
-        passed = self.__rule(*self.__create_rule_args(self.__qns))
+        return self.__check()
 
-        self.__score_callback(passed)
+    def __check(self) -> bool:
+        self.__duration = 0.0
+        if self.__rule_key is None:
+            passed = self.__evaluate_rule()
+        else:
+            key = self.__rule_key, tuple(self.__qns.values())
+            passed = RULE_CACHE.evaluate(key, self.__evaluate_rule)
+        self.__score_callback(passed, self.__duration)
+        return passed
 
+    def __evaluate_rule(self) -> bool:
+        start = perf_counter()
+        passed = self.__rule(*self.__create_rule_args(self.__qns))
+        self.__duration = perf_counter() - start
         return passed
 
     def __update_variable_lists(
@@ -1002,6 +1550,80 @@ class _GraphElementConstraint(Generic[_QNType], Constraint):
                 )
 
 
+def _hide_violating_values(
+    domain: Domain,
+    assign: Callable[[Scalar], None],
+    check: Callable[[], bool],
+) -> bool:
+    """Forward check a constraint of which one variable is unassigned.
+
+    Each value in the :code:`domain` of that variable is assigned and checked.
+    Values that violate the constraint are hidden from the domain, so that
+    the solver does not have to try them.
+
+    Returns:
+        `False` if no values are left in the domain.
+    """
+    for value in domain[:]:
+        assign(value)
+        if not check():
+            domain.hideValue(value)
+    return bool(domain)
+
+
+class _ParticleTableConstraint(Constraint):
+    """Constraint that only allows certain combinations of values.
+
+    The allowed combinations are given as tuples of values, ordered in the same
+    way as the variables to which the constraint is applied. When forward
+    checking, values that do not appear in any of the combinations that are
+    still possible are hidden from the domains of the unassigned variables.
+    """
+
+    def __init__(self, allowed_values: Iterable[Tuple[Scalar, ...]]) -> None:
+        self.__rows = list(allowed_values)
+        self.__row_index: Dict[int, Dict[Scalar, Set[int]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        for row_id, row in enumerate(self.__rows):
+            for position, value in enumerate(row):
+                self.__row_index[position][value].add(row_id)
+
+    def __call__(
+        self,
+        variables: List[str],
+        domains: dict,
+        assignments: dict,
+        forwardcheck: bool = False,
+        _unassigned: Variable = Unassigned,
+    ) -> bool:
+        row_ids: Optional[Set[int]] = None
+        unassigned = []
+        for position, variable in enumerate(variables):
+            value = assignments.get(variable, _unassigned)
+            if value is _unassigned:
+                unassigned.append((position, variable))
+                continue
+            matches = self.__row_index[position].get(value, set())
+            row_ids = matches if row_ids is None else row_ids & matches
+            if not row_ids:
+                return False
+        if row_ids is None:
+            row_ids = set(range(len(self.__rows)))
+        if not row_ids:
+            return False
+        if forwardcheck:
+            for position, variable in unassigned:
+                allowed = {self.__rows[i][position] for i in row_ids}
+                domain = domains[variable]
+                for value in domain[:]:
+                    if value not in allowed:
+                        domain.hideValue(value)
+                if not domain:
+                    return False
+        return True
+
+
 class _ConservationRuleConstraintWrapper(Constraint):
     """Wrapper class of the python-constraint Constraint class.
 
@@ -1015,16 +1637,17 @@ class _ConservationRuleConstraintWrapper(Constraint):
         rule: Rule,
         variables: _VariableContainer,
         argument_handler: RuleArgumentHandler,
-        score_callback: Callable[[bool], None],
+        score_callback: Callable[..., None],
     ) -> None:
         if not callable(rule):
             raise TypeError("rule argument has to be a callable")
         self.__rule = rule
         (
-            self.__check_rule_requirements,
+            check_rule_requirements,
             self.__create_rule_args,
         ) = argument_handler.register_rule(rule)
         self.__score_callback = score_callback
+        self.__duration = 0.0
 
         self.__var_string_to_data: Dict[
             str,
@@ -1035,6 +1658,21 @@ class _ConservationRuleConstraintWrapper(Constraint):
         self.__node_qns: GraphNodePropertyMap = {}
 
         self.__initialize_variable_containers(variables)
+        # the quantum numbers that are available do not change when solving
+        self.__requirements_met = check_rule_requirements(
+            list(self.__in_edges_qns.values()),
+            list(self.__out_edges_qns.values()),
+            self.__node_qns,
+        )
+        rule_key = create_rule_key(rule)
+        self.__rule_key: Optional[tuple] = None
+        if rule_key is not None:
+            self.__rule_key = (
+                rule_key,
+                tuple(map(tuple, self.__in_edges_qns.values())),
+                tuple(map(tuple, self.__out_edges_qns.values())),
+                tuple(self.__node_qns),
+            )
 
     def __initialize_variable_containers(
         self, variables: _VariableContainer
@@ -1060,6 +1698,10 @@ class _ConservationRuleConstraintWrapper(Constraint):
                 if element_id not in container:
                     container[element_id] = {}
                 container[element_id].update({qn_type: None})  # type: ignore[dict-item]
+            for element_id, properties in container.items():
+                container[element_id] = dict(
+                    sorted(properties.items(), key=_get_qn_name)
+                )
 
         _initialize_edge_container(
             variables.ingoing_edge_variables,
@@ -1078,6 +1720,9 @@ class _ConservationRuleConstraintWrapper(Constraint):
                 _create_variable_string(*var_info)
             ] = var_info
         self.__node_qns.update(variables.fixed_node_variables)
+        self.__node_qns = dict(
+            sorted(self.__node_qns.items(), key=_get_qn_name)
+        )
 
     def __call__(
         self,
@@ -1113,20 +1758,48 @@ class _ConservationRuleConstraintWrapper(Constraint):
                 Boolean value stating if this constraint is currently broken
                 or not.
         """
+        if not self.__requirements_met:
+            return True
+
         params = [(x, assignments.get(x, _unassigned)) for x in variables]
         missing = [name for (name, val) in params if val is _unassigned]
         if missing:
+            if forwardcheck and len(missing) == 1:
+                (variable,) = missing
+                self.__update_variable_lists(
+                    [(x, val) for x, val in params if x != variable]
+                )
+                return _hide_violating_values(
+                    domains[variable],
+                    lambda value: self.__update_variable_lists(
+                        [(variable, value)]
+                    ),
+                    self.__check,
+                )
             return True
 
         self.__update_variable_lists(params)
 
-        if not self.__check_rule_requirements(
-            list(self.__in_edges_qns.values()),
-            list(self.__out_edges_qns.values()),
-            self.__node_qns,
-        ):
-            return True
+        return self.__check()
+
+    def __check(self) -> bool:
+        self.__duration = 0.0
+        if self.__rule_key is None:
+            passed = self.__evaluate_rule()
+        else:
+            key = self.__rule_key, tuple(
+                chain(
+                    *(qns.values() for qns in self.__in_edges_qns.values()),
+                    *(qns.values() for qns in self.__out_edges_qns.values()),
+                    self.__node_qns.values(),
+                )
+            )
+            passed = RULE_CACHE.evaluate(key, self.__evaluate_rule)
+        self.__score_callback(passed, self.__duration)
+        return passed
 
+    def __evaluate_rule(self) -> bool:
+        start = perf_counter()
         passed = self.__rule(
             *self.__create_rule_args(
                 list(self.__in_edges_qns.values()),
@@ -1134,7 +1807,7 @@ class _ConservationRuleConstraintWrapper(Constraint):
                 self.__node_qns,
             )
         )
-        self.__score_callback(passed)
+        self.__duration = perf_counter() - start
         return passed
 
     def __update_variable_lists(
@@ -16,12 +16,11 @@
     )
 """
 
-import copy
 import itertools
 import logging
 import sys
 from abc import ABC, abstractmethod
-from collections import abc
+from collections import abc, defaultdict
 from functools import total_ordering
 from typing import (
     TYPE_CHECKING,
@@ -41,6 +40,7 @@ from typing import (
     Set,
     Tuple,
     TypeVar,
+    Union,
     ValuesView,
     overload,
 )
@@ -261,7 +261,18 @@ class Topology:
     intermediate_edge_ids: FrozenSet[int] = field(init=False, repr=False)
     """Edge IDs of edges that connect two `nodes`."""
 
+    _ingoing_edges: Dict[int, Tuple[int, ...]] = field(
+        init=False, repr=False, eq=False
+    )
+    _outgoing_edges: Dict[int, Tuple[int, ...]] = field(
+        init=False, repr=False, eq=False
+    )
+    _final_state_descendants: Dict[int, Tuple[int, ...]] = field(
+        init=False, repr=False, eq=False
+    )
+
     def __attrs_post_init__(self) -> None:
+        self.__build_adjacency()
         self.__verify()
         incoming = sorted(
             edge_id
@@ -291,6 +302,40 @@ class Topology:
         object.__setattr__(self, "incoming_edge_ids", frozenset(incoming))
         object.__setattr__(self, "outgoing_edge_ids", frozenset(outgoing))
         object.__setattr__(self, "intermediate_edge_ids", frozenset(inter))
+        object.__setattr__(
+            self,
+            "_final_state_descendants",
+            {
+                i: tuple(self.__search_final_state_edge_ids(i))
+                for i in self.nodes
+            },
+        )
+
+    def __build_adjacency(self) -> None:
+        """Create lookup tables for the edges that surround each node.
+
+        A `Topology` is immutable, so the edges that are connected to a node
+        only have to be searched once. The tuples keep the order of the
+        `edges`, so that the `set` instances that are created from them
+        iterate in the same order as when searching the `edges` directly.
+        """
+        ingoing: Dict[int, List[int]] = defaultdict(list)
+        outgoing: Dict[int, List[int]] = defaultdict(list)
+        for edge_id, edge in self.edges.items():
+            if edge.ending_node_id is not None:
+                ingoing[edge.ending_node_id].append(edge_id)
+            if edge.originating_node_id is not None:
+                outgoing[edge.originating_node_id].append(edge_id)
+        object.__setattr__(
+            self,
+            "_ingoing_edges",
+            {i: tuple(ids) for i, ids in ingoing.items()},
+        )
+        object.__setattr__(
+            self,
+            "_outgoing_edges",
+            {i: tuple(ids) for i, ids in outgoing.items()},
+        )
 
     def __verify(self) -> None:
         """Verify if there are no dangling edges or nodes."""
@@ -320,10 +365,10 @@ class Topology:
 
     def __get_surrounding_nodes(self, node_id: int) -> Set[int]:
         surrounding_nodes = set()
-        for edge in self.edges.values():
-            connected_nodes = edge.get_connected_nodes()
-            if node_id in connected_nodes:
-                surrounding_nodes |= connected_nodes
+        for edge_id in self._ingoing_edges.get(node_id, ()):
+            surrounding_nodes |= self.edges[edge_id].get_connected_nodes()
+        for edge_id in self._outgoing_edges.get(node_id, ()):
+            surrounding_nodes |= self.edges[edge_id].get_connected_nodes()
         surrounding_nodes.discard(node_id)
         return surrounding_nodes
 
@@ -333,27 +378,27 @@ class Topology:
         Returns `True` if the two graphs have a one-to-one mapping of the node
         IDs and edge IDs.
 
-        .. warning:: Not yet implemented.
+        >>> topology1, topology2 = create_isobar_topologies(4)
+        >>> topology1.is_isomorphic(topology2)
+        False
+        >>> topology1.is_isomorphic(topology1.swap_edges(0, 2))
+        True
         """
-        raise NotImplementedError
+        return _get_canonical_form(self) == _get_canonical_form(other)
 
     def get_edge_ids_ingoing_to_node(self, node_id: int) -> Set[int]:
-        return {
-            edge_id
-            for edge_id, edge in self.edges.items()
-            if edge.ending_node_id == node_id
-        }
+        return set(self._ingoing_edges.get(node_id, ()))
 
     def get_edge_ids_outgoing_from_node(self, node_id: int) -> Set[int]:
-        return {
-            edge_id
-            for edge_id, edge in self.edges.items()
-            if edge.originating_node_id == node_id
-        }
+        return set(self._outgoing_edges.get(node_id, ()))
 
     def get_originating_final_state_edge_ids(self, node_id: int) -> Set[int]:
+        return set(self._final_state_descendants.get(node_id, ()))
+
+    def __search_final_state_edge_ids(self, node_id: int) -> Set[int]:
         fs_edges = self.outgoing_edge_ids
         edge_ids = set()
+        visited_nodes = {node_id}
         temp_edge_list = self.get_edge_ids_outgoing_from_node(node_id)
         while temp_edge_list:
             new_temp_edge_list = set()
@@ -362,7 +407,11 @@ class Topology:
                     edge_ids.add(edge_id)
                 else:
                     new_node_id = self.edges[edge_id].ending_node_id
-                    if new_node_id is not None:
+                    if (
+                        new_node_id is not None
+                        and new_node_id not in visited_nodes
+                    ):
+                        visited_nodes.add(new_node_id)
                         new_temp_edge_list.update(
                             self.get_edge_ids_outgoing_from_node(new_node_id)
                         )
@@ -641,6 +690,9 @@ class SimpleStateTransitionTopologyBuilder:
         while extendable_graph_list:
             active_graph_list = extendable_graph_list
             extendable_graph_list = []
+            # isomorphic graphs have the same extensions, so only the first
+            # graph of each isomorphism class is kept
+            canonical_forms: Set[Any] = set()
             for active_graph in active_graph_list:
                 # check if finished
                 if (
@@ -650,7 +702,12 @@ class SimpleStateTransitionTopologyBuilder:
                     graph_tuple_list.append(active_graph)
                     continue
 
-                extendable_graph_list.extend(self._extend_graph(active_graph))
+                for extended_graph in self._extend_graph(active_graph):
+                    canonical_form = _get_canonical_form(extended_graph[0])
+                    if canonical_form in canonical_forms:
+                        continue
+                    canonical_forms.add(canonical_form)
+                    extendable_graph_list.append(extended_graph)
 
         logging.info("finished building topology graphs...")
         # strip the current open end edges list from the result graph tuples
@@ -674,23 +731,19 @@ class SimpleStateTransitionTopologyBuilder:
             if interaction_node.number_of_ingoing_edges <= len(
                 current_open_end_edges
             ):
-                # make all combinations
-                combis = list(
-                    itertools.combinations(
-                        current_open_end_edges,
-                        interaction_node.number_of_ingoing_edges,
+                # make all combinations, but skip the combinations that
+                # originate from the same nodes as an earlier combination
+                combis: Dict[Tuple[Optional[int], ...], Tuple[int, ...]] = {}
+                for combi in itertools.combinations(
+                    current_open_end_edges,
+                    interaction_node.number_of_ingoing_edges,
+                ):
+                    origin = tuple(
+                        topology.edges[i].originating_node_id for i in combi
                     )
-                )
-                # remove all combinations that originate from the same nodes
-                for comb1, comb2 in itertools.combinations(combis, 2):
-                    if get_originating_node_list(
-                        topology, comb1  # type: ignore[arg-type]
-                    ) == get_originating_node_list(
-                        topology, comb2  # type: ignore[arg-type]
-                    ):  # type: ignore[arg-type]
-                        combis.remove(comb2)
-
-                for combi in combis:
+                    combis.setdefault(origin, combi)
+
+                for combi in combis.values():
                     new_graph = _attach_node_to_edges(
                         pair, interaction_node, combi
                     )
@@ -791,8 +844,9 @@ def _attach_node_to_edges(
     interaction_node: InteractionNode,
     ingoing_edge_ids: Iterable[int],
 ) -> Tuple[MutableTopology, List[int]]:
-    temp_graph = copy.deepcopy(graph[0])
-    new_open_end_lines = list(copy.deepcopy(graph[1]))
+    # Edge instances are immutable, so a shallow copy suffices
+    temp_graph = MutableTopology(graph[0].nodes, graph[0].edges)
+    new_open_end_lines = list(graph[1])
 
     # add node
     new_node_id = len(temp_graph.nodes)
@@ -820,6 +874,102 @@ def _attach_node_to_edges(
     return (temp_graph, new_open_end_lines)
 
 
+def _get_canonical_form(topology: Union[Topology, MutableTopology]) -> Any:
+    """Compute a representation that is the same for isomorphic topologies.
+
+    If each node has at most one ingoing edge that comes from another node
+    and there are no cycles, the nodes form a forest of rooted trees. This is
+    the case for all decay topologies and for scattering topologies in which
+    the initial state edges only meet at the roots of these trees. The
+    canonical form of such a topology is then computed in linear time by
+    recursively sorting the forms of the outgoing edges of each node (AHU
+    algorithm), where each node is labeled with its number of initial state
+    edges.
+
+    Otherwise, the canonical form is the smallest sorted list of edges over
+    all relabelings of the nodes that only permute nodes with the same
+    numbers of ingoing and outgoing edges. This fallback scales with the
+    factorial of the size of these groups of nodes, but topologies with
+    loops have few nodes in practice.
+    """
+    outgoing_edges: Dict[Optional[int], List[int]] = defaultdict(list)
+    n_internal_ingoing: Dict[int, int] = defaultdict(int)
+    n_initial_ingoing: Dict[int, int] = defaultdict(int)
+    n_free_edges = 0
+    for edge_id, edge in topology.edges.items():
+        outgoing_edges[edge.originating_node_id].append(edge_id)
+        if edge.ending_node_id is None:
+            if edge.originating_node_id is None:
+                n_free_edges += 1
+        elif edge.originating_node_id is None:
+            n_initial_ingoing[edge.ending_node_id] += 1
+        else:
+            n_internal_ingoing[edge.ending_node_id] += 1
+    if all(n_internal_ingoing[i] <= 1 for i in topology.nodes):
+        visited_nodes: Set[int] = set()
+
+        def get_node_form(node_id: int) -> tuple:
+            visited_nodes.add(node_id)
+            child_forms = map(get_edge_form, outgoing_edges[node_id])
+            return n_initial_ingoing[node_id], tuple(sorted(child_forms))
+
+        def get_edge_form(edge_id: int) -> tuple:
+            node_id = topology.edges[edge_id].ending_node_id
+            if node_id is None:
+                return ()
+            return (get_node_form(node_id),)
+
+        root_forms = tuple(
+            sorted(
+                get_node_form(node_id)
+                for node_id in topology.nodes
+                if n_internal_ingoing[node_id] == 0
+            )
+        )
+        # nodes on a cycle cannot be reached from a root
+        if len(visited_nodes) == len(topology.nodes):
+            return "forest", n_free_edges, root_forms
+    return "graph", _get_smallest_edge_list(topology)
+
+
+def _get_smallest_edge_list(
+    topology: Union[Topology, MutableTopology]
+) -> tuple:
+    n_ingoing: Dict[int, int] = defaultdict(int)
+    n_outgoing: Dict[int, int] = defaultdict(int)
+    for edge in topology.edges.values():
+        if edge.ending_node_id is not None:
+            n_ingoing[edge.ending_node_id] += 1
+        if edge.originating_node_id is not None:
+            n_outgoing[edge.originating_node_id] += 1
+    groups: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for node_id in topology.nodes:
+        groups[(n_ingoing[node_id], n_outgoing[node_id])].append(node_id)
+    signatures = sorted(groups)
+    node_groups = [groups[signature] for signature in signatures]
+    smallest_form = None
+    for permutations in itertools.product(
+        *(itertools.permutations(group) for group in node_groups)
+    ):
+        new_node_ids: Dict[Optional[int], int] = {None: -1}
+        new_node_ids.update(
+            (node_id, i)
+            for i, node_id in enumerate(itertools.chain(*permutations))
+        )
+        form = tuple(
+            sorted(
+                (
+                    new_node_ids[edge.originating_node_id],
+                    new_node_ids[edge.ending_node_id],
+                )
+                for edge in topology.edges.values()
+            )
+        )
+        if smallest_form is None or form < smallest_form:
+            smallest_form = form
+    return tuple((s, len(groups[s])) for s in signatures), smallest_form
+
+
 # pylint: disable=invalid-name
 EdgeType = TypeVar("EdgeType")
 NodeType = TypeVar("NodeType")
@@ -3,13 +3,16 @@
 import logging
 import sys
 from collections import defaultdict
+from contextlib import ExitStack
 from copy import copy, deepcopy
 from enum import Enum, auto
-from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
 from typing import (
     TYPE_CHECKING,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -26,6 +29,7 @@ from tqdm.auto import tqdm
 
 from qrules._implementers import implement_pretty_repr
 
+from ._equivalence import find_equivalent_problem_sets
 from ._system_control import (
     GammaCheck,
     InteractionDeterminator,
@@ -35,12 +39,18 @@ from ._system_control import (
     create_node_properties,
     create_particle,
     filter_interaction_types,
-    remove_duplicate_solutions,
+    iter_unique_solutions,
+)
+from ._worker_pool import (
+    SerializedContext,
+    SolvingContext,
+    acquire_pool,
+    solve_problem_set,
 )
 from .combinatorics import (
     InitialFacts,
     StateDefinition,
-    create_initial_facts,
+    iter_initial_facts,
     match_external_edges,
 )
 from .particle import (
@@ -50,6 +60,7 @@ from .particle import (
     _to_float,
     load_pdg,
 )
+from .profiling import ProblemSetProfile, solve_with_profile
 from .quantum_numbers import (
     EdgeQuantumNumber,
     EdgeQuantumNumbers,
@@ -70,6 +81,8 @@ from .solving import (
     NodeSettings,
     QNProblemSet,
     QNResult,
+    RuleStatistics,
+    TreeSolver,
 )
 from .topology import (
     FrozenDict,
@@ -231,6 +244,13 @@ def _group_by_strength(
     return strength_sorted_problem_sets
 
 
+_SOLVER_TYPES: Dict[str, Type[CSPSolver]] = {
+    "csp": CSPSolver,
+    "tree": TreeSolver,
+}
+"""Solvers that can be selected in the `.StateTransitionManager`."""
+
+
 class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
     """Main handler for decay topologies.
 
@@ -254,6 +274,10 @@ class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
         max_angular_momentum: int = 1,
         max_spin_magnitude: float = 2.0,
         number_of_threads: Optional[int] = None,
+        solver: str = "csp",
+        use_particle_table: bool = False,
+        rule_statistics: Optional[RuleStatistics] = None,
+        profiler: Optional[Callable[[ProblemSetProfile], None]] = None,
     ) -> None:
         if number_of_threads is not None:
             NumberOfThreads.set(number_of_threads)
@@ -271,6 +295,15 @@ class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
                 f" Use one of {allowed_formalisms} instead."
             )
         self.__formalism = str(formalism)
+        if solver not in _SOLVER_TYPES:
+            raise NotImplementedError(
+                f'Solver "{solver}" not implemented.'
+                f" Use one of {list(_SOLVER_TYPES)} instead."
+            )
+        self.__solver_type = _SOLVER_TYPES[solver]
+        self.__use_particle_table = use_particle_table
+        self.__rule_statistics = rule_statistics
+        self.__profiler = profiler
         self.__particles = ParticleCollection()
         if particle_db is not None:
             self.__particles = particle_db
@@ -347,11 +380,8 @@ class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
         self, particle_names: List[str]
     ) -> None:
         self.__allowed_intermediate_particles = []
-        for particle_name in particle_names:
-            matches = self.__particles.filter(
-                lambda p: particle_name  # pylint: disable=cell-var-from-loop
-                in p.name
-            )
+        selections = _find_by_name_parts(self.__particles, particle_names)
+        for particle_name, matches in zip(particle_names, selections):
             if len(matches) == 0:
                 raise LookupError(
                     "Could not find any matches for allowed intermediate"
@@ -398,7 +428,7 @@ class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
     def create_problem_sets(self) -> Dict[float, List[ProblemSet]]:
         problem_sets = []
         for topology in self.topologies:
-            for initial_facts in create_initial_facts(
+            for initial_facts in iter_initial_facts(
                 topology=topology,
                 particle_db=self.__particles,
                 initial_state=self.initial_state,
@@ -530,13 +560,66 @@ class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
 
         return graph_settings
 
-    def find_solutions(  # pylint: disable=too-many-branches
+    def find_solutions(
         self,
         problem_sets: Dict[float, List[ProblemSet]],
     ) -> "ReactionInfo":
-        # pylint: disable=too-many-locals
         """Check for solutions for a specific set of interaction settings."""
-        results: Dict[float, _SolutionContainer] = {}
+        transitions = list(self.iter_transitions(problem_sets))
+        return ReactionInfo(transitions, self.formalism)
+
+    def iter_transitions(
+        self,
+        problem_sets: Dict[float, List[ProblemSet]],
+    ) -> "Iterator[StateTransition]":
+        """Generate the allowed transitions one by one.
+
+        Same as :meth:`find_solutions`, but transitions are generated as soon
+        as the `ProblemSet` from which they result has been solved. Duplicate
+        solutions are removed and the external edges are matched on the fly,
+        so the transitions do not have to be kept in memory.
+
+        Raises:
+            RuntimeError: If no solutions were found, because of violated
+                conservation rules.
+            RuntimeWarning: If no solutions were found and some conservation
+                rules could not be executed.
+            ValueError: If no solutions were found at all.
+        """
+        execution_info = ExecutionInfo()
+        unique_solutions = iter_unique_solutions(
+            self.__iter_solutions(problem_sets, execution_info),
+            self.filter_remove_qns,
+            self.filter_ignore_qns,
+        )
+        reference_solution = None
+        for solution in unique_solutions:
+            # copy, because external edges are matched in-place
+            solution = MutableTransition(
+                solution.topology,
+                states=dict(solution.states),
+                interactions=dict(solution.interactions),
+            )
+            if reference_solution is None:
+                reference_solution = solution
+            else:
+                match_external_edges([reference_solution, solution])
+            solution = _match_final_state_ids(solution, self.final_state)
+            yield solution.freeze().convert(lambda s: State(*s))
+        if reference_solution is None:
+            _raise_execution_errors(execution_info)
+            raise ValueError("No solutions were found")
+
+    def __iter_solutions(
+        self,
+        problem_sets: Dict[float, List[ProblemSet]],
+        execution_info: ExecutionInfo,
+    ) -> "Iterator[MutableTransition[ParticleWithSpin, InteractionProperties]]":
+        """Solve the problem sets and generate their solutions.
+
+        If no solutions are found, the :code:`execution_info` is filled with
+        the rules that were violated or could not be executed.
+        """
         logging.info(
             "Number of interaction settings groups being processed: %d",
             len(problem_sets),
@@ -547,113 +630,146 @@ class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
             desc="Propagating quantum numbers",
             disable=logging.getLogger().level > logging.WARNING,
         )
-        for strength, problems in sorted(problem_sets.items(), reverse=True):
-            logging.info(
-                "processing interaction settings group with "
-                f"strength {strength}",
-            )
-            logging.info(f"{len(problems)} entries in this group")
-            logging.info(f"running with {self.__number_of_threads} threads...")
-
-            qn_problems = [x.to_qn_problem_set() for x in problems]
-
-            # Because of pickling problems of Generic classes (in this case
-            # MutableTransition), multithreaded code has to work with
-            # QNProblemSet's and QNResult's. So the appropriate conversions
-            # have to be done before and after
-            temp_qn_results: List[Tuple[QNProblemSet, QNResult]] = []
+        has_solutions = False
+        with ExitStack() as stack:
+            pool: Optional[PoolType] = None
+            context: Optional[SerializedContext] = None
             if self.__number_of_threads > 1:
-                with Pool(self.__number_of_threads) as pool:
-                    for qn_result in pool.imap_unordered(
-                        self._solve, qn_problems, 1
-                    ):
-                        temp_qn_results.append(qn_result)
-                        progress_bar.update()
-            else:
-                for problem in qn_problems:
-                    temp_qn_results.append(self._solve(problem))
-                    progress_bar.update()
-            for temp_qn_result in temp_qn_results:
-                temp_result = self.__convert_result(
-                    temp_qn_result[0].topology,
-                    temp_qn_result[1],
+                context = SerializedContext.from_context(
+                    SolvingContext(
+                        self.__solver_type,
+                        self.__allowed_intermediate_particles,
+                        self.__use_particle_table,
+                        self.__rule_statistics,
+                        profile=self.__profiler is not None,
+                    )
                 )
-                if strength not in results:
-                    results[strength] = temp_result
-                else:
-                    results[strength].extend(temp_result, True)
-            if (
-                results[strength].solutions
-                and self.reaction_mode == SolvingMode.FAST
+                pool = stack.enter_context(
+                    acquire_pool(self.__number_of_threads, context)
+                )
+            for strength, problems in sorted(
+                problem_sets.items(), reverse=True
             ):
-                break
-        progress_bar.close()
-
-        for key, result in results.items():
-            logging.info(
-                f"number of solutions for strength ({key}) "
-                f"after qn solving: {len(result.solutions)}",
-            )
-
-        final_result = _SolutionContainer()
-        for temp_result in results.values():
-            final_result.extend(temp_result)
-
-        # remove duplicate solutions, which only differ in the interaction qns
-        final_solutions = remove_duplicate_solutions(
-            final_result.solutions,
-            self.filter_remove_qns,
-            self.filter_ignore_qns,
-        )
-
-        execution_info = final_result.execution_info
-        if (
-            final_result.execution_info.violated_edge_rules
-            or final_result.execution_info.violated_node_rules
-        ):
-            violated_rules: Set[str] = set()
-            for rules in execution_info.violated_edge_rules.values():
-                violated_rules |= rules
-            for rules in execution_info.violated_node_rules.values():
-                violated_rules |= rules
-            if violated_rules:
-                raise RuntimeError(
-                    "There were violated conservation rules: "
-                    + ", ".join(violated_rules)
+                logging.info(
+                    "processing interaction settings group with "
+                    f"strength {strength}",
                 )
-        if (
-            final_result.execution_info.not_executed_edge_rules
-            or final_result.execution_info.not_executed_node_rules
-        ):
-            not_executed_rules: Set[str] = set()
-            for rules in execution_info.not_executed_edge_rules.values():
-                not_executed_rules |= rules
-            for rules in execution_info.not_executed_node_rules.values():
-                not_executed_rules |= rules
-            raise RuntimeWarning(
-                "There are conservation rules that were not executed: "
-                + ", ".join(not_executed_rules)
-            )
-        if not final_solutions:
-            raise ValueError("No solutions were found")
+                logging.info(f"{len(problems)} entries in this group")
+                logging.info(
+                    f"running with {self.__number_of_threads} threads..."
+                )
+                n_solutions = 0
+                strength_info: Optional[ExecutionInfo] = None
+                for qn_problem_set, qn_result in self.__iter_qn_results(
+                    problems, pool, context
+                ):
+                    progress_bar.update()
+                    result = self.__convert_result(
+                        qn_problem_set.topology, qn_result
+                    )
+                    if result.solutions:
+                        n_solutions += len(result.solutions)
+                        yield from result.solutions
+                    elif strength_info is None:
+                        strength_info = result.execution_info
+                    else:
+                        strength_info.extend(result.execution_info, True)
+                logging.info(
+                    f"number of solutions for strength ({strength}) "
+                    f"after qn solving: {n_solutions}",
+                )
+                if n_solutions:
+                    has_solutions = True
+                elif strength_info is not None:
+                    execution_info.extend(strength_info)
+                if has_solutions and self.reaction_mode == SolvingMode.FAST:
+                    break
+        progress_bar.close()
+        if has_solutions:
+            execution_info.clear()
 
-        match_external_edges(final_solutions)
-        final_solutions = [
-            _match_final_state_ids(graph, self.final_state)
-            for graph in final_solutions
+    def __iter_qn_results(
+        self,
+        problems: List[ProblemSet],
+        pool: Optional[PoolType] = None,
+        context: Optional[SerializedContext] = None,
+    ) -> Iterator[Tuple[QNProblemSet, QNResult]]:
+        qn_problems = [x.to_qn_problem_set() for x in problems]
+        results = self.__solve_qn_problems(qn_problems, pool, context)
+        yield from zip(qn_problems, results)
+
+    def __solve_qn_problems(
+        self,
+        qn_problems: List[QNProblemSet],
+        pool: Optional[PoolType] = None,
+        context: Optional[SerializedContext] = None,
+    ) -> Iterator[QNResult]:
+        # Equivalent problem sets are solved only once. Their result is
+        # converted to the other problem sets of the equivalence class, so
+        # only the representatives are profiled.
+        equivalences = find_equivalent_problem_sets(qn_problems)
+        representatives = [
+            problem
+            for problem, equivalence in zip(qn_problems, equivalences)
+            if equivalence is None
         ]
-        transitions = [
-            graph.freeze().convert(lambda s: State(*s))
-            for graph in final_solutions
+        logging.info(
+            f"{len(representatives)} of {len(qn_problems)} problem sets are"
+            " not equivalent to another problem set"
+        )
+        # Because of pickling problems of Generic classes (in this case
+        # MutableTransition), multithreaded code has to work with
+        # QNProblemSet's and QNResult's. So the appropriate conversions
+        # have to be done before and after
+        solved: Iterator[
+            Tuple[
+                QNProblemSet,
+                QNResult,
+                Optional[ProblemSetProfile],
+                Optional[RuleStatistics],
+            ]
         ]
-        return ReactionInfo(transitions, self.formalism)
+        if pool is not None and context is not None:
+            tasks = ((context.digest, p) for p in representatives)
+            solved = pool.imap(solve_problem_set, tasks, 1)
+        else:
+            solved = map(self._solve, representatives)
+        results: Dict[int, QNResult] = {}
+        for i, (problem, equivalence) in enumerate(
+            zip(qn_problems, equivalences)
+        ):
+            if equivalence is None:
+                _, results[i], profile, statistics = next(solved)
+                if self.__profiler is not None and profile is not None:
+                    self.__profiler(profile)
+                if statistics is not None:
+                    self.__rule_statistics.merge(  # type: ignore[union-attr]
+                        statistics
+                    )
+                yield results[i]
+            else:
+                representative_id, relabelling = equivalence
+                yield relabelling.apply(results[representative_id], problem)
 
     def _solve(
         self, qn_problem_set: QNProblemSet
-    ) -> Tuple[QNProblemSet, QNResult]:
-        solver = CSPSolver(self.__allowed_intermediate_particles)
-
-        return (qn_problem_set, solver.find_solutions(qn_problem_set))
+    ) -> Tuple[
+        QNProblemSet,
+        QNResult,
+        Optional[ProblemSetProfile],
+        Optional[RuleStatistics],
+    ]:
+        # The solver records its statistics in self.__rule_statistics itself
+        solver = self.__solver_type(
+            self.__allowed_intermediate_particles,
+            use_particle_table=self.__use_particle_table,
+            rule_statistics=self.__rule_statistics,
+        )
+        if self.__profiler is not None:
+            result, profile = solve_with_profile(solver, qn_problem_set)
+            return qn_problem_set, result, profile, None
+        result = solver.find_solutions(qn_problem_set)
+        return qn_problem_set, result, None, None
 
     def __convert_result(
         self, topology: Topology, qn_result: QNResult
@@ -689,6 +805,61 @@ class StateTransitionManager:  # pylint: disable=too-many-instance-attributes
         )
 
 
+def _raise_execution_errors(execution_info: ExecutionInfo) -> None:
+    if (
+        execution_info.violated_edge_rules
+        or execution_info.violated_node_rules
+    ):
+        violated_rules: Set[str] = set()
+        for rules in execution_info.violated_edge_rules.values():
+            violated_rules |= rules
+        for rules in execution_info.violated_node_rules.values():
+            violated_rules |= rules
+        if violated_rules:
+            raise RuntimeError(
+                "There were violated conservation rules: "
+                + ", ".join(violated_rules)
+            )
+    if (
+        execution_info.not_executed_edge_rules
+        or execution_info.not_executed_node_rules
+    ):
+        not_executed_rules: Set[str] = set()
+        for rules in execution_info.not_executed_edge_rules.values():
+            not_executed_rules |= rules
+        for rules in execution_info.not_executed_node_rules.values():
+            not_executed_rules |= rules
+        raise RuntimeWarning(
+            "There are conservation rules that were not executed: "
+            + ", ".join(not_executed_rules)
+        )
+
+
+def _find_by_name_parts(
+    particles: ParticleCollection, name_parts: Iterable[str]
+) -> List[ParticleCollection]:
+    """Select the particles of which the name contains each name part.
+
+    Uses the `.ParticleCollection.columns` if :mod:`numpy` is installed.
+    """
+    try:
+        names = particles.columns["name"]
+    except ImportError:
+        return [
+            particles.filter(
+                lambda p: part in p.name  # pylint: disable=cell-var-from-loop
+            )
+            for part in name_parts
+        ]
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+
+    names = names.astype(str)
+    return [
+        particles.select(np.char.find(names, part) >= 0) for part in name_parts
+    ]
+
+
 def _safe_wrap_list(
     nested_list: Union[List[str], List[List[str]]]
 ) -> List[List[str]]:
@@ -0,0 +1,146 @@
+# pylint: disable=no-self-use
+import os
+import pickle  # noqa: S403
+
+import pytest
+
+import qrules
+from qrules.io import ParticleCache, ReactionCache
+from qrules.particle import ParticleCollection
+from qrules.transition import ReactionInfo
+
+
+class TestReactionCache:
+    def test_create_key(self, particle_database: ParticleCollection):
+        key = ReactionCache.create_key(
+            particle_database,
+            initial_state=["J/psi(1S)"],
+            formalism="helicity",
+        )
+        assert key == ReactionCache.create_key(
+            particle_database,
+            initial_state=("J/psi(1S)",),
+            formalism="helicity",
+        )
+        assert key != ReactionCache.create_key(
+            particle_database,
+            initial_state=["J/psi(1S)"],
+            formalism="canonical",
+        )
+        selection = ParticleCollection(
+            particle_database.filter(lambda p: p.name.startswith("pi"))
+        )
+        assert key != ReactionCache.create_key(
+            selection, initial_state=["J/psi(1S)"], formalism="helicity"
+        )
+        assert ReactionCache.create_key(
+            ParticleCollection(), initial_state=["J/psi(1S)"]
+        ) != ReactionCache.create_key(None, initial_state=["J/psi(1S)"])
+        assert ReactionCache.create_key(
+            particle_database, allowed_interaction_types={"strong", "EM"}
+        ) == ReactionCache.create_key(
+            particle_database, allowed_interaction_types=["EM", "strong"]
+        )
+        with pytest.raises(TypeError, match="Cannot create a cache key"):
+            ReactionCache.create_key(particle_database, formalism=object())
+
+    def test_generate_transitions(
+        self,
+        particle_database: ParticleCollection,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        cache = ReactionCache(str(tmp_path))
+        arguments = dict(
+            initial_state=[("J/psi(1S)", [-1, +1])],
+            final_state=["gamma", "pi0", "pi0"],
+            allowed_intermediate_particles=["f(0)(980)"],
+            allowed_interaction_types="strong",
+            particle_db=particle_database,
+            cache=cache,
+        )
+        reaction = qrules.generate_transitions(**arguments)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        def raise_error(*_, **__):
+            raise AssertionError("Reaction should have been loaded from cache")
+
+        monkeypatch.setattr(
+            qrules.transition, "StateTransitionManager", raise_error
+        )
+        cached_reaction = qrules.generate_transitions(**arguments)
+        assert cached_reaction == reaction
+
+    def test_eviction(self, reaction: ReactionInfo, tmp_path):
+        cache = ReactionCache(str(tmp_path), max_size=None)
+        for i in range(3):
+            cache.put(f"key{i}", reaction)
+            os.utime(tmp_path / f"key{i}.json", (i, i))
+        entry_size = (tmp_path / "key0.json").stat().st_size
+        assert cache.get("key0") == reaction  # now most recently used
+
+        cache = ReactionCache(str(tmp_path), max_size=3 * entry_size)
+        cache.put("key3", reaction)
+        assert cache.get("key1") is None
+        assert cache.get("key2") == reaction
+        assert cache.get("key0") == reaction
+        assert cache.get("key3") == reaction
+
+        cache.clear()
+        assert cache.get("key3") is None
+        assert not list(tmp_path.glob("*.json"))
+
+
+class TestParticleCache:
+    def test_create_key(self, tmp_path):
+        filename = tmp_path / "particles.yml"
+        filename.write_text("particles: []\n")
+        key = ParticleCache.create_key("selection", str(filename))
+        assert key.startswith("selection-")
+        assert key == ParticleCache.create_key("selection", str(filename))
+        assert key != ParticleCache.create_key("selection")
+        filename.write_text("particles: [] # changed\n")
+        assert key != ParticleCache.create_key("selection", str(filename))
+
+    def test_load_default_particles(
+        self,
+        particle_database: ParticleCollection,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        cache = ParticleCache(str(tmp_path))
+        cache.put("default-particles-outdated", ParticleCollection())
+        particles = qrules.load_default_particles(cache)
+        assert particles == particle_database
+        assert [p.name for p in tmp_path.glob("*.pickle")] == [
+            f"{cache.create_key('default-particles', _DEFINITIONS)}.pickle"
+        ]
+
+        def raise_error():
+            raise AssertionError("Particles should be loaded from cache")
+
+        monkeypatch.setattr(qrules.particle, "load_pdg", raise_error)
+        assert qrules.load_default_particles(cache) == particle_database
+
+        cache.clear()
+        assert not list(tmp_path.glob("*.pickle"))
+
+    def test_corrupted_snapshot(self, tmp_path):
+        cache = ParticleCache(str(tmp_path))
+        key = cache.create_key("pdg")
+        (tmp_path / f"{key}.pickle").write_bytes(b"corrupted")
+        assert cache.get(key) is None
+        assert not list(tmp_path.glob("*.pickle"))
+        (tmp_path / f"{key}.pickle").write_bytes(pickle.dumps({"pdg": []}))
+        assert cache.get(key) is None
+        assert not list(tmp_path.glob("*.pickle"))
+
+    def test_put_get(self, particle_selection: ParticleCollection, tmp_path):
+        cache = ParticleCache(str(tmp_path))
+        key = cache.create_key("selection")
+        assert cache.get(key) is None
+        cache.put(key, particle_selection)
+        assert cache.get(key) == particle_selection
+
+
+_DEFINITIONS = qrules.ADDITIONAL_PARTICLES_DEFINITIONS_PATH
@@ -1,4 +1,5 @@
 import json
+import pickle  # noqa: S403
 
 import pytest
 
@@ -58,3 +59,77 @@ def test_asdict_fromdict_reaction(reaction: ReactionInfo):
 def test_fromdict_exceptions():
     with pytest.raises(NotImplementedError):
         io.fromdict({"non-sense": 1})
+
+
+def test_write_load_pickle(particle_selection: ParticleCollection, tmp_path):
+    filename = str(tmp_path / "snapshot.pickle")
+    with pytest.raises(NotImplementedError):
+        io.write(particle_selection, filename)
+    with pytest.raises(NotImplementedError):
+        io.load(filename)
+
+
+@pytest.mark.parametrize("extension", ["json", "yaml"])
+def test_write_load_reaction(reaction: ReactionInfo, extension: str, tmp_path):
+    filename = str(tmp_path / f"reaction.{extension}")
+    io.write(reaction, filename, particle_table=True)
+    imported = io.load(filename)
+    assert isinstance(imported, ReactionInfo)
+    assert imported == reaction
+    particles = {
+        state.particle.name: state.particle
+        for transition in imported.transitions
+        for state in transition.states.values()
+    }
+    for transition in imported.transitions:
+        for state in transition.states.values():
+            assert state.particle is particles[state.particle.name]
+
+
+def test_write_reaction_particle_table(
+    particle_selection: ParticleCollection, reaction: ReactionInfo, tmp_path
+):
+    filename = str(tmp_path / "reaction.json")
+    io.write(reaction, filename)
+    with open(filename) as stream:
+        assert json.load(stream) == json.loads(
+            json.dumps(io.asdict(reaction), cls=io.JSONSetEncoder)
+        )
+
+    io.write(reaction, filename, particle_table=True)
+    with open(filename) as stream:
+        definition = json.load(stream)
+    assert set(definition) == {"formalism", "particles", "transitions"}
+    particle_names = [p["name"] for p in definition["particles"]]
+    assert len(particle_names) == len(set(particle_names))
+    for transition_def in definition["transitions"]:
+        for state_def in transition_def["states"].values():
+            assert state_def["particle"] in particle_names
+
+    with pytest.raises(NotImplementedError):
+        io.write(particle_selection, filename, particle_table=True)
+
+
+def test_write_load_binary(
+    particle_selection: ParticleCollection, reaction: ReactionInfo, tmp_path
+):
+    filename = str(tmp_path / "reaction.qrules")
+    io.write(reaction, filename)
+    with io.load(filename) as mapped:
+        assert isinstance(mapped, io.MappedReactionInfo)
+        assert mapped.formalism == reaction.formalism
+        assert len(mapped) == len(reaction.transitions)
+        assert mapped[-1] == reaction.transitions[-1]
+        assert mapped[1:3] == list(reaction.transitions[1:3])
+        assert mapped.to_reaction_info() == reaction
+        with pytest.raises(IndexError):
+            _ = mapped[len(reaction.transitions)]
+        unpickled = pickle.loads(pickle.dumps(mapped))  # noqa: S301
+        assert list(unpickled) == list(reaction.transitions)
+        unpickled.close()
+
+    with pytest.raises(NotImplementedError):
+        io.write(particle_selection, filename)
+    io.write(particle_selection, str(tmp_path / "particles.json"))
+    with pytest.raises(ValueError, match="not a qrules binary file"):
+        io.MappedReactionInfo(str(tmp_path / "particles.json"))
@@ -0,0 +1,106 @@
+from functools import partial
+from typing import Optional
+
+import pytest
+
+from qrules.argument_handling import RuleArgumentHandler, get_required_qns
+from qrules.conservation_rules import (
+    ChargeConservation,
+    CParityEdgeInput,
+    CParityNodeInput,
+    MassConservation,
+    c_parity_conservation,
+)
+from qrules.quantum_numbers import EdgeQuantumNumbers, NodeQuantumNumbers
+
+
+def _create_edge(pid: int, spin: float, c_parity: Optional[int] = None):
+    edge = {
+        EdgeQuantumNumbers.pid: pid,
+        EdgeQuantumNumbers.spin_magnitude: spin,
+    }
+    if c_parity is not None:
+        edge[EdgeQuantumNumbers.c_parity] = c_parity
+    return edge
+
+
+class TestRuleArgumentHandler:
+    def test_register_rule(self):
+        check, build = RuleArgumentHandler().register_rule(
+            c_parity_conservation
+        )
+        in_edges = [_create_edge(443, spin=1, c_parity=-1)]
+        out_edges = [
+            _create_edge(22, spin=1, c_parity=-1),
+            _create_edge(111, spin=0),
+        ]
+        node = {
+            NodeQuantumNumbers.l_magnitude: 0,
+            NodeQuantumNumbers.s_magnitude: 1,
+        }
+        assert check(in_edges, out_edges, node)
+        assert not check(in_edges, out_edges, {})
+        assert not check(in_edges, [{EdgeQuantumNumbers.pid: 22}], node)
+        with pytest.raises(TypeError, match=r"invalid argument type"):
+            check(in_edges[0], out_edges, node)
+
+        arguments = build(in_edges, out_edges, node)
+        assert arguments == [
+            [CParityEdgeInput(spin_magnitude=1, pid=443, c_parity=-1)],
+            [
+                CParityEdgeInput(spin_magnitude=1, pid=22, c_parity=-1),
+                CParityEdgeInput(spin_magnitude=0, pid=111, c_parity=None),
+            ],
+            CParityNodeInput(l_magnitude=0, s_magnitude=1),
+        ]
+        assert c_parity_conservation(*arguments)
+
+    def test_share_compiled_rules(self):
+        check1, build1 = RuleArgumentHandler().register_rule(
+            MassConservation(3)
+        )
+        check2, build2 = RuleArgumentHandler().register_rule(
+            MassConservation(5)
+        )
+        assert check1 is check2
+        assert build1 is build2
+
+
+def test_get_required_qns():
+    assert get_required_qns(ChargeConservation()) == (
+        {EdgeQuantumNumbers.charge},
+        set(),
+    )
+    edge_qns, node_qns = get_required_qns(c_parity_conservation)
+    assert edge_qns == {
+        EdgeQuantumNumbers.spin_magnitude,
+        EdgeQuantumNumbers.pid,
+        EdgeQuantumNumbers.c_parity,
+    }
+    assert node_qns == {
+        NodeQuantumNumbers.l_magnitude,
+        NodeQuantumNumbers.s_magnitude,
+    }
+
+
+def test_get_required_qns_partial():
+    charge_rule = partial(_is_below, 1)
+    spin_rule = partial(_is_integer, 2)
+    assert get_required_qns(charge_rule) == (
+        {EdgeQuantumNumbers.charge},
+        set(),
+    )
+    assert get_required_qns(spin_rule) == (
+        {EdgeQuantumNumbers.spin_magnitude},
+        set(),
+    )
+
+
+def _is_below(limit: int, charge: EdgeQuantumNumbers.charge) -> bool:
+    return abs(charge) <= limit  # pragma: no cover
+
+
+def _is_integer(
+    factor: int, spin_magnitude: EdgeQuantumNumbers.spin_magnitude
+) -> bool:
+    return float(factor * spin_magnitude).is_integer()  # pragma: no cover
@@ -11,6 +11,7 @@ from qrules.combinatorics import (
     _KinematicRepresentation,
     _safe_set_spin_projections,
     create_initial_facts,
+    iter_initial_facts,
 )
 from qrules.particle import ParticleCollection
 from qrules.topology import Topology, create_isobar_topologies
@@ -49,6 +50,24 @@ def test_initialize_graph(
     assert len(initial_facts) == 4
 
 
+def test_iter_initial_facts(
+    three_body_decay: Topology, particle_database: ParticleCollection
+):
+    arguments = dict(
+        topology=three_body_decay,
+        particle_db=particle_database,
+        initial_state=["J/psi(1S)"],
+        final_state=["omega(782)", "pi0", "pi0"],
+    )
+    initial_facts = iter_initial_facts(**arguments)
+    first_facts = next(initial_facts)
+    assert first_facts.states[-1] == (particle_database["J/psi(1S)"], -1)
+    assert first_facts.states[0] == (particle_database["omega(782)"], -1)
+    remaining_facts = list(initial_facts)
+    assert [first_facts] + remaining_facts == create_initial_facts(**arguments)
+    assert len(remaining_facts) == 2 * 3 * 3 - 1
+
+
 @pytest.mark.parametrize(
     ("initial_state", "final_state"),
     [
@@ -77,12 +96,19 @@ def test_generate_outer_edge_permutations(
             final_state_with_spins,
         )
     )
-    n_permutations_final_state = factorial(len(final_state))
-    n_permutations_initial_state = factorial(len(initial_state))
+    n_permutations_final_state = _count_distinct_permutations(final_state)
+    n_permutations_initial_state = _count_distinct_permutations(initial_state)
     n_permutations = n_permutations_final_state * n_permutations_initial_state
     assert len(list_of_permutations) == n_permutations
 
 
+def _count_distinct_permutations(states) -> int:
+    n_permutations = factorial(len(states))
+    for name in set(states):
+        n_permutations //= factorial(states.count(name))
+    return n_permutations
+
+
 class TestKinematicRepresentation:
     def test_constructor(self):
         representation = _KinematicRepresentation(
@@ -147,6 +173,13 @@ class TestKinematicRepresentation:
             str(kinematic_representation)
         )
         assert constructed_from_repr == kinematic_representation
+        assert hash(constructed_from_repr) == hash(kinematic_representation)
+        other_representation = _KinematicRepresentation(
+            initial_state=[["J/psi"]],
+            final_state=[["gamma", "pi0"]],
+        )
+        assert len({kinematic_representation, other_representation}) == 2
+        assert len({kinematic_representation, constructed_from_repr}) == 1
 
     def test_in_operator(self):
         kinematic_representation = _KinematicRepresentation(
@@ -204,8 +237,8 @@ def test_generate_permutations(
     ]
 
     permutation0 = permutations[0]
-    spin_permutations = _generate_spin_permutations(
-        permutation0, particle_database
+    spin_permutations = list(
+        _generate_spin_permutations(permutation0, particle_database)
     )
     assert len(spin_permutations) == 4
     assert spin_permutations[0][-1][1] == -1
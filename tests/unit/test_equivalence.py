@@ -0,0 +1,101 @@
+# pylint: disable=no-self-use
+from typing import FrozenSet, Set, Tuple
+
+import pytest
+
+from qrules._equivalence import find_equivalent_problem_sets
+from qrules._system_control import create_edge_properties
+from qrules.particle import ParticleCollection
+from qrules.settings import InteractionType
+from qrules.solving import CSPSolver, QNResult
+from qrules.transition import StateTransitionManager
+
+
+def _to_hashable(result: QNResult) -> Set[Tuple[FrozenSet, FrozenSet]]:
+    return {
+        (
+            frozenset(
+                (i, frozenset(props.items()))
+                for i, props in solution.states.items()
+            ),
+            frozenset(
+                (i, frozenset(props.items()))
+                for i, props in solution.interactions.items()
+            ),
+        )
+        for solution in result.solutions
+    }
+
+
+def _create_qn_problem_sets(
+    particle_database: ParticleCollection, formalism: str
+):
+    stm = StateTransitionManager(
+        initial_state=[("J/psi(1S)", [-1, +1])],
+        final_state=["gamma", "pi0", "pi0"],
+        particle_db=particle_database,
+        allowed_intermediate_particles=["f(0)(980)", "f(2)(1270)", "omega"],
+        formalism=formalism,
+    )
+    stm.set_allowed_interaction_types(
+        [InteractionType.STRONG, InteractionType.EM]
+    )
+    problem_sets = [
+        problem_set.to_qn_problem_set()
+        for group in stm.create_problem_sets().values()
+        for problem_set in group
+    ]
+    allowed_particles = [
+        create_edge_properties(particle)
+        for particle in particle_database.filter(
+            lambda p: p.name in {"f(0)(980)", "f(2)(1270)", "omega(782)"}
+        )
+    ]
+    return problem_sets, allowed_particles
+
+
+@pytest.mark.parametrize(
+    "formalism", ["canonical", "canonical-helicity", "helicity"]
+)
+def test_find_equivalent_problem_sets(
+    particle_database: ParticleCollection, formalism: str
+):
+    problem_sets, allowed_particles = _create_qn_problem_sets(
+        particle_database, formalism
+    )
+    equivalences = find_equivalent_problem_sets(problem_sets)
+    assert len(equivalences) == len(problem_sets)
+    n_equivalent = sum(1 for e in equivalences if e is not None)
+    assert 0 < n_equivalent < len(problem_sets)
+
+    results = [
+        CSPSolver(allowed_particles).find_solutions(problem_set)
+        for problem_set in problem_sets
+    ]
+    for problem_set, result, equivalence in zip(
+        problem_sets, results, equivalences
+    ):
+        if equivalence is None:
+            continue
+        representative_id, relabelling = equivalence
+        assert equivalences[representative_id] is None
+        converted = relabelling.apply(results[representative_id], problem_set)
+        assert _to_hashable(converted) == _to_hashable(result)
+        assert converted.violated_node_rules == result.violated_node_rules
+        assert converted.violated_edge_rules == result.violated_edge_rules
+
+
+def test_custom_rules_are_not_deduplicated(
+    particle_database: ParticleCollection,
+):
+    problem_sets, _ = _create_qn_problem_sets(particle_database, "helicity")
+
+    def custom_rule(ingoing_edge_qns, outgoing_edge_qns) -> bool:
+        # pylint: disable=unused-argument
+        return True
+
+    for problem_set in problem_sets:
+        for settings in problem_set.solving_settings.interactions.values():
+            settings.conservation_rules.add(custom_rule)
+    equivalences = find_equivalent_problem_sets(problem_sets)
+    assert equivalences == [None] * len(problem_sets)
@@ -10,6 +10,7 @@ from IPython.lib.pretty import pretty
 from qrules.particle import (
     Particle,
     ParticleCollection,
+    ParticleColumns,
     Spin,
     _get_name_root,
     create_antiparticle,
@@ -191,6 +192,24 @@ class TestParticleCollection:
             pions.add(create_particle(pi_plus, width=1.0))
         assert "pi+" in caplog.text
 
+    def test_add_equivalent(self, particle_database: ParticleCollection):
+        pions = particle_database.filter(lambda p: p.name.startswith("pi"))
+        pi_plus = pions["pi+"]
+        copied_pion = create_particle(pi_plus, name="pion", pid=666)
+        with pytest.raises(ValueError, match=r'equivalent to .* "pi\+"'):
+            pions.add(copied_pion)
+
+        wider_pion = create_particle(pi_plus, width=1.0)
+        pions.add(wider_pion)  # overwrites pi+
+        assert pi_plus not in pions
+        assert wider_pion in pions
+        pions.add(copied_pion)
+        pions.discard(copied_pion)
+        assert copied_pion not in pions
+        pions.add(copied_pion)
+        with pytest.raises(ValueError, match=r'equivalent to .* "pion"'):
+            deepcopy(pions).add(pi_plus)
+
     @pytest.mark.parametrize("name", ["gamma", "pi0", "K+"])
     def test_contains(self, name: str, particle_database: ParticleCollection):
         assert name in particle_database
@@ -243,6 +262,75 @@ class TestParticleCollection:
             "K(2)*(1980)+",
         ]
 
+    def test_select(self, particle_database: ParticleCollection):
+        np = pytest.importorskip("numpy")
+        predicates = [
+            (
+                dict(mass=(1.8, 2.0), spin=2, strangeness=1),
+                lambda p: 1.8 <= p.mass <= 2.0
+                and p.spin == 2
+                and p.strangeness == 1,
+            ),
+            (
+                dict(charge={-1, 1}, width=(None, 0.0), baryon_number=0),
+                lambda p: p.charge in {-1, 1}
+                and p.width <= 0
+                and p.baryon_number == 0,
+            ),
+            (
+                dict(isospin_magnitude=1, parity=-1, c_parity=-1),
+                lambda p: p.isospin is not None
+                and p.isospin.magnitude == 1
+                and p.parity == -1
+                and p.c_parity == -1,
+            ),
+        ]
+        for conditions, function in predicates:
+            selection = particle_database.select(**conditions)
+            assert len(selection) > 0
+            assert selection == particle_database.filter(function)
+
+        columns = particle_database.columns
+        mask = np.isnan(columns["isospin_magnitude"])
+        selection = particle_database.select(mask, charge=0)
+        assert selection == particle_database.filter(
+            lambda p: p.isospin is None and p.charge == 0
+        )
+        with pytest.raises(KeyError, match=r"No column \"isospin\""):
+            particle_database.select(isospin=1)
+
+    def test_columns_in_sync(self, particle_database: ParticleCollection):
+        pytest.importorskip("numpy")
+        pions = particle_database.filter(lambda p: p.name.startswith("pi"))
+        light = dict(charge=0, mass=(None, 1.0))
+        assert pions.select(**light).names == ["pi0"]
+        pions.discard("pi0")
+        assert len(pions.select(**light)) == 0
+        pions.add(particle_database["pi0"])
+        assert len(pions.columns) == len(pions)
+        assert pions.select(**light).names == ["pi0"]
+        assert deepcopy(pions).select(charge=0) == pions.select(charge=0)
+
+    def test_columns_updated(self, particle_database: ParticleCollection):
+        np = pytest.importorskip("numpy")
+        particles = ParticleCollection(list(particle_database)[:5])
+        columns = particles.columns
+        for particle in list(particle_database)[5:50]:
+            particles.add(particle)
+        particles.discard(list(particles)[3])
+        particles.discard(list(particles)[-1])
+        pi0 = particle_database["pi0"]
+        if pi0 not in particles:
+            particles.add(pi0)
+        particles.add(create_particle(pi0, mass=0.2))
+        assert particles["pi0"].mass == 0.2
+        assert particles.columns is columns
+        expected = ParticleColumns(particles)
+        assert len(columns) == len(expected) == len(particles)
+        for name in expected:
+            np.testing.assert_array_equal(columns[name], expected[name])
+        assert columns["name"].tolist() == [p.name for p in particles]
+
     def test_find(self, particle_database: ParticleCollection):
         f2_1950 = particle_database.find(9050225)
         assert f2_1950.name == "f(2)(1950)"
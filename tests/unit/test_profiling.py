@@ -0,0 +1,53 @@
+import json
+import os
+
+import pytest
+
+from qrules.particle import ParticleCollection
+from qrules.profiling import SolvingProfile
+from qrules.transition import StateTransitionManager
+
+
+@pytest.mark.parametrize("number_of_threads", [1, 2])
+def test_solving_profile(
+    particle_database: ParticleCollection, number_of_threads: int, tmp_path
+):
+    profile = SolvingProfile()
+    stm = StateTransitionManager(
+        initial_state=[("J/psi(1S)", [-1, +1])],
+        final_state=["gamma", "pi0", "pi0"],
+        particle_db=particle_database,
+        allowed_intermediate_particles=["f(0)", "omega"],
+        number_of_threads=number_of_threads,
+        profiler=profile,
+    )
+    problem_sets = stm.create_problem_sets()
+    reaction = stm.find_solutions(problem_sets)
+    assert len(profile.problem_sets) > 0
+    assert len(reaction.transitions) > 0
+    assert sum(p.n_solutions for p in profile.problem_sets) > 0
+    for problem_set in profile.problem_sets:
+        assert problem_set.duration > 0
+        assert problem_set.n_variables == len(problem_set.domain_sizes) > 0
+        for rule in problem_set.rules:
+            assert rule.element in {"edge", "node"}
+            assert 0 <= rule.passes <= rule.calls
+    process_ids = {p.process_id for p in profile.problem_sets}
+    assert (os.getpid() in process_ids) == (number_of_threads == 1)
+    rule_time = profile.get_rule_time()
+    assert "qrules.conservation_rules.ChargeConservation" in rule_time
+    assert list(rule_time.values()) == sorted(rule_time.values())[::-1]
+
+    json_file = tmp_path / "profile.json"
+    profile.write_json(str(json_file))
+    with open(json_file) as stream:
+        definition = json.load(stream)
+    assert len(definition["problem_sets"]) == len(profile.problem_sets)
+
+    trace_file = tmp_path / "trace.json"
+    profile.write_chrome_trace(str(trace_file))
+    with open(trace_file) as stream:
+        trace = json.load(stream)
+    events = trace["traceEvents"]
+    assert len(events) == len(profile.problem_sets)
+    assert {event["ph"] for event in events} == {"X"}
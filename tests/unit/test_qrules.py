@@ -1,5 +1,9 @@
+import subprocess
+import sys
+
 import pytest
 
+import qrules
 from qrules import generate_transitions
 
 
@@ -31,3 +35,25 @@ def test_generate_transitions(resonance_names):
             for i, state in transition.final_states.items()
         }
         assert final_state == this_final_state
+
+
+@pytest.mark.parametrize(
+    "module", ["qrules", "qrules.conservation_rules", "qrules.particle"]
+)
+def test_lazy_import(module: str):
+    heavy_modules = ["constraint", "numpy", "particle", "tqdm", "yaml"]
+    command = (
+        f"import sys; import {module};"
+        f" print([m for m in {heavy_modules} if m in sys.modules])"
+    )
+    output = subprocess.check_output([sys.executable, "-c", command])
+    assert output.decode().strip() == "[]"
+
+
+def test_lazy_attributes():
+    assert qrules.StateTransitionManager.__name__ == "StateTransitionManager"
+    assert qrules.io.__name__ == "qrules.io"
+    assert "ReactionInfo" in dir(qrules)
+    assert "transition" in dir(qrules)
+    with pytest.raises(AttributeError, match="non_existent"):
+        _ = qrules.non_existent
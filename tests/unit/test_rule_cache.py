@@ -0,0 +1,81 @@
+# pylint: disable=no-self-use, redefined-outer-name
+import pytest
+
+from qrules._rule_cache import RULE_CACHE, RuleCache, create_rule_key
+from qrules.conservation_rules import (
+    ChargeConservation,
+    MassConservation,
+    impure_rule,
+    spin_validity,
+)
+from qrules.particle import ParticleCollection
+from qrules.settings import InteractionType
+from qrules.transition import StateTransitionManager
+
+
+@pytest.fixture()
+def rule_cache():
+    max_size = RULE_CACHE.max_size
+    RULE_CACHE.clear()
+    yield RULE_CACHE
+    RULE_CACHE.max_size = max_size
+
+
+class TestRuleCache:
+    def test_evaluate(self):
+        cache = RuleCache(max_size=2)
+        assert cache.evaluate("a", lambda: True) is True
+        assert cache.evaluate("a", lambda: False) is True
+        assert cache.evaluate("b", lambda: False) is False
+        assert cache.evaluate("c", lambda: True) is True
+        info = cache.info()
+        assert (info.hits, info.misses, info.size) == (1, 3, 2)
+        assert cache.evaluate("a", lambda: False) is False
+
+    def test_disable(self):
+        cache = RuleCache(max_size=0)
+        assert cache.evaluate("a", lambda: True) is True
+        assert cache.evaluate("a", lambda: False) is False
+        assert cache.info().size == 0
+        with pytest.raises(ValueError, match=r"non-negative"):
+            cache.max_size = -1
+
+
+def test_create_rule_key():
+    assert create_rule_key(spin_validity) is spin_validity
+    assert create_rule_key(ChargeConservation()) == create_rule_key(
+        ChargeConservation()
+    )
+    assert create_rule_key(MassConservation(3)) == create_rule_key(
+        MassConservation(3)
+    )
+    assert create_rule_key(MassConservation(3)) != create_rule_key(
+        MassConservation(5)
+    )
+
+    @impure_rule
+    def impure(_):  # pragma: no cover
+        return True
+
+    assert create_rule_key(impure) is None
+
+
+def test_memoized_solutions(
+    particle_database: ParticleCollection, rule_cache: RuleCache
+):
+    reactions = []
+    for max_size in [0, 2**16]:
+        rule_cache.max_size = max_size
+        stm = StateTransitionManager(
+            initial_state=[("J/psi(1S)", [-1, +1])],
+            final_state=["gamma", "pi0", "pi0"],
+            particle_db=particle_database,
+            allowed_intermediate_particles=["f(0)", "omega"],
+            number_of_threads=1,
+        )
+        stm.set_allowed_interaction_types([InteractionType.STRONG])
+        problem_sets = stm.create_problem_sets()
+        reactions.append(stm.find_solutions(problem_sets))
+    info = rule_cache.info()
+    assert info.hits > info.misses > 0
+    assert reactions[0] == reactions[1]
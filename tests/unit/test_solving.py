@@ -0,0 +1,351 @@
+# pylint: disable=no-self-use
+from typing import FrozenSet, Set, Tuple
+
+import pytest
+from constraint import Domain
+
+from qrules._system_control import create_edge_properties
+from qrules._worker_pool import SerializedContext, SolvingContext
+from qrules.argument_handling import RuleArgumentHandler
+from qrules.conservation_rules import ChargeConservation
+from qrules.particle import ParticleCollection
+from qrules.quantum_numbers import EdgeQuantumNumbers
+from qrules.settings import InteractionType
+from qrules.solving import (
+    CSPSolver,
+    QNResult,
+    RuleStatistics,
+    TreeSolver,
+    _ConservationRuleConstraintWrapper,
+    _ParticleCandidateIndex,
+    _VariableContainer,
+)
+from qrules.transition import ProblemSet, StateTransitionManager
+
+
+def _create_problem_sets(
+    particle_database: ParticleCollection,
+    initial_state,
+    final_state,
+    allowed_intermediate_particles,
+    interaction_types,
+):
+    stm = StateTransitionManager(
+        initial_state,
+        final_state,
+        particle_database,
+        allowed_intermediate_particles=allowed_intermediate_particles,
+        formalism="canonical-helicity",
+    )
+    stm.set_allowed_interaction_types(interaction_types)
+    problem_sets = stm.create_problem_sets()
+    allowed_particles = [
+        create_edge_properties(p)
+        for name in allowed_intermediate_particles
+        for p in particle_database.filter(
+            lambda p: name in p.name  # pylint: disable=cell-var-from-loop
+        )
+    ]
+    problem_set_list = [p for group in problem_sets.values() for p in group]
+    return problem_set_list, allowed_particles
+
+
+def _to_hashable(result: QNResult) -> Set[Tuple[FrozenSet, FrozenSet]]:
+    return {
+        (
+            frozenset(
+                (i, frozenset(props.items()))
+                for i, props in solution.states.items()
+            ),
+            frozenset(
+                (i, frozenset(props.items()))
+                for i, props in solution.interactions.items()
+            ),
+        )
+        for solution in result.solutions
+    }
+
+
+class TestParticleCandidateIndex:
+    @pytest.mark.parametrize(
+        "qn_types",
+        [
+            [],
+            [EdgeQuantumNumbers.charge],
+            [EdgeQuantumNumbers.spin_projection, EdgeQuantumNumbers.charge],
+            [
+                EdgeQuantumNumbers.isospin_magnitude,
+                EdgeQuantumNumbers.parity,
+                EdgeQuantumNumbers.c_parity,
+                EdgeQuantumNumbers.spin_magnitude,
+            ],
+        ],
+    )
+    def test_find_candidates(
+        self, particle_database: ParticleCollection, qn_types
+    ):
+        allowed_particles = [
+            create_edge_properties(p) for p in particle_database
+        ]
+        index = _ParticleCandidateIndex(allowed_particles)
+        for reference in allowed_particles[::25]:
+            state = {
+                qn_type: reference.get(qn_type, 0) for qn_type in qn_types
+            }
+            expected = [
+                particle_qns
+                for particle_qns in allowed_particles
+                if all(
+                    qn_type is EdgeQuantumNumbers.spin_projection
+                    or (
+                        qn_type in particle_qns
+                        and particle_qns[qn_type] == value
+                    )
+                    for qn_type, value in state.items()
+                )
+            ]
+            assert index.find_candidates(state) == expected
+
+
+class TestConservationRuleConstraintWrapper:
+    def test_forward_check(self):
+        charge = EdgeQuantumNumbers.charge
+        scores = []
+        constraint = _ConservationRuleConstraintWrapper(
+            ChargeConservation(),
+            _VariableContainer(
+                ingoing_edge_variables={(0, charge)},
+                outgoing_edge_variables={(1, charge)},
+                fixed_outgoing_edge_variables={2: {charge: -1}},
+            ),
+            RuleArgumentHandler(),
+            lambda passed, duration: scores.append((passed, duration)),
+        )
+        variables = ["0-charge", "1-charge"]
+        domains = {
+            "0-charge": Domain([-1, 0, 1]),
+            "1-charge": Domain([-1, 0, 1, 2]),
+        }
+        assert constraint(variables, domains, {}, forwardcheck=True)
+        assert domains["1-charge"] == [-1, 0, 1, 2]
+        assert scores == []
+
+        assert constraint(variables, domains, {"0-charge": 1}, True)
+        assert domains["1-charge"] == [2]
+        assert [passed for passed, _ in scores] == [False, False, False, True]
+
+        assignments = {"0-charge": 1, "1-charge": 0}
+        assert not constraint(variables, domains, assignments, False)
+        domains["0-charge"].hideValue(0)
+        assert not constraint(variables, domains, {"1-charge": -1}, True)
+        assert domains["0-charge"] == []
+
+
+class TestRuleStatistics:
+    def test_order_rules(
+        self, particle_database: ParticleCollection, tmp_path
+    ):
+        statistics = RuleStatistics()
+        reactions = []
+        for rule_statistics in [None, statistics, statistics]:
+            stm = StateTransitionManager(
+                initial_state=[("J/psi(1S)", [-1, +1])],
+                final_state=["gamma", "pi0", "pi0"],
+                particle_db=particle_database,
+                allowed_intermediate_particles=["f(0)", "omega"],
+                formalism="canonical-helicity",
+                number_of_threads=1,
+                rule_statistics=rule_statistics,
+            )
+            problem_sets = stm.create_problem_sets()
+            reactions.append(stm.find_solutions(problem_sets))
+        assert reactions[0] == reactions[1] == reactions[2]
+
+        definition = statistics.asdict()
+        charge = "qrules.conservation_rules.ChargeConservation"
+        assert definition[charge]["calls"] > 0
+        assert any(values["rejections"] for values in definition.values())
+        # all intermediate particles are neutral
+        assert definition[charge]["rejections"] == 0
+        assert statistics.get_score(ChargeConservation()) == float("inf")
+        rules = [ChargeConservation(), _unknown_rule]
+        assert statistics.sort_rules(rules) == rules[::-1]
+
+        filename = str(tmp_path / "rule-statistics.json")
+        statistics.dump(filename)
+        assert RuleStatistics.load(filename).asdict() == definition
+
+    def test_merge_from_workers(self, particle_database: ParticleCollection):
+        statistics = RuleStatistics()
+        stm = StateTransitionManager(
+            initial_state=[("J/psi(1S)", [-1, +1])],
+            final_state=["gamma", "pi0", "pi0"],
+            particle_db=particle_database,
+            allowed_intermediate_particles=["f(0)", "omega"],
+            formalism="canonical-helicity",
+            number_of_threads=2,
+            rule_statistics=statistics,
+        )
+        stm.find_solutions(stm.create_problem_sets())
+        definition = statistics.asdict()
+        charge = "qrules.conservation_rules.ChargeConservation"
+        assert definition[charge]["calls"] > 0
+
+        merged = RuleStatistics()
+        merged.merge(statistics)
+        merged.merge(statistics)
+        assert merged.asdict()[charge] == {
+            "calls": 2 * definition[charge]["calls"],
+            "rejections": 2 * definition[charge]["rejections"],
+            "time": 2 * definition[charge]["time"],
+        }
+
+        # merged statistics do not restart a persistent pool
+        digests = {
+            SerializedContext.from_context(
+                SolvingContext(CSPSolver, [], rule_statistics=stats)
+            ).digest
+            for stats in [RuleStatistics(), statistics, merged]
+        }
+        assert len(digests) == 1
+
+
+def _unknown_rule(spin_magnitude: EdgeQuantumNumbers.spin_magnitude) -> bool:
+    return spin_magnitude >= 0  # pragma: no cover
+
+
+class TestCSPSolver:
+    @pytest.mark.parametrize("solver_type", [CSPSolver, TreeSolver])
+    def test_particle_table(
+        self, particle_database: ParticleCollection, solver_type
+    ):
+        problem_sets, allowed_particles = _create_problem_sets(
+            particle_database,
+            initial_state=[("J/psi(1S)", [-1, +1])],
+            final_state=["gamma", "pi0", "pi0"],
+            allowed_intermediate_particles=["f(0)", "f(2)", "omega", "b(1)"],
+            interaction_types=[InteractionType.STRONG, InteractionType.EM],
+        )
+        n_solutions = 0
+        for problem_set in problem_sets:
+            qn_problem_set = problem_set.to_qn_problem_set()
+            result = solver_type(allowed_particles).find_solutions(
+                qn_problem_set
+            )
+            table_result = solver_type(
+                allowed_particles, use_particle_table=True
+            ).find_solutions(qn_problem_set)
+            assert _to_hashable(table_result) == _to_hashable(result)
+            streamed_solutions = list(
+                solver_type(allowed_particles).iter_solutions(qn_problem_set)
+            )
+            assert _to_hashable(QNResult(streamed_solutions)) == (
+                _to_hashable(result)
+            )
+            n_solutions += len(result.solutions)
+        assert n_solutions > 0
+
+    @pytest.mark.parametrize("solver_type", [CSPSolver, TreeSolver])
+    def test_reuse_solver(
+        self, particle_database: ParticleCollection, solver_type
+    ):
+        problem_sets, allowed_particles = _create_problem_sets(
+            particle_database,
+            initial_state=[("J/psi(1S)", [-1, +1])],
+            final_state=["gamma", "pi0", "pi0"],
+            allowed_intermediate_particles=["f(0)(980)", "f(0)(1500)"],
+            interaction_types=[InteractionType.STRONG, InteractionType.EM],
+        )
+        solver = solver_type(allowed_particles)
+        for problem_set in problem_sets + problem_sets:
+            qn_problem_set = problem_set.to_qn_problem_set()
+            result = solver.find_solutions(qn_problem_set)
+            expected = solver_type(allowed_particles).find_solutions(
+                qn_problem_set
+            )
+            assert result == expected
+
+
+class TestTreeSolver:
+    @pytest.mark.parametrize(
+        (
+            "initial_state",
+            "final_state",
+            "intermediate_particles",
+            "interaction_types",
+        ),
+        [
+            (
+                [("J/psi(1S)", [-1, +1])],
+                ["gamma", "pi0", "pi0"],
+                ["f(0)(980)", "f(0)(1500)", "omega(782)"],
+                [InteractionType.STRONG, InteractionType.EM],
+            ),
+            (
+                ["D0"],
+                ["K~0", "K+", "K-"],
+                ["a(0)(980)", "phi(1020)"],
+                [InteractionType.STRONG, InteractionType.WEAK],
+            ),
+        ],
+    )
+    def test_same_result_as_csp_solver(
+        self,
+        particle_database: ParticleCollection,
+        initial_state,
+        final_state,
+        intermediate_particles,
+        interaction_types,
+    ):
+        problem_sets, allowed_particles = _create_problem_sets(
+            particle_database,
+            initial_state,
+            final_state,
+            intermediate_particles,
+            interaction_types,
+        )
+        n_solutions = 0
+        for problem_set in problem_sets:
+            assert isinstance(problem_set, ProblemSet)
+            qn_problem_set = problem_set.to_qn_problem_set()
+            csp_result = CSPSolver(allowed_particles).find_solutions(
+                qn_problem_set
+            )
+            tree_result = TreeSolver(allowed_particles).find_solutions(
+                qn_problem_set
+            )
+            assert len(tree_result.solutions) == len(csp_result.solutions)
+            assert _to_hashable(tree_result) == _to_hashable(csp_result)
+            if not csp_result.solutions:
+                assert tree_result.violated_node_rules or (
+                    tree_result.not_executed_node_rules
+                )
+            n_solutions += len(csp_result.solutions)
+        assert n_solutions > 0
+
+    def test_state_transition_manager(
+        self, particle_database: ParticleCollection
+    ):
+        reactions = []
+        for solver in ["csp", "tree"]:
+            stm = StateTransitionManager(
+                initial_state=[("J/psi(1S)", [-1, +1])],
+                final_state=["gamma", "pi0", "pi0"],
+                particle_db=particle_database,
+                allowed_intermediate_particles=["f(0)"],
+                formalism="helicity",
+                solver=solver,
+            )
+            stm.set_allowed_interaction_types([InteractionType.STRONG])
+            problem_sets = stm.create_problem_sets()
+            reactions.append(stm.find_solutions(problem_sets))
+        assert reactions[0] == reactions[1]
+
+    def test_unknown_solver(self, particle_database: ParticleCollection):
+        with pytest.raises(NotImplementedError, match=r"Solver \"dfs\""):
+            StateTransitionManager(
+                initial_state=["J/psi(1S)"],
+                final_state=["gamma", "pi0", "pi0"],
+                particle_db=particle_database,
+                solver="dfs",
+            )
@@ -265,6 +265,34 @@ class TestSolutionFilter:  # pylint: disable=no-self-use
         results = remove_duplicate_solutions(graphs)
         assert len(results) == result
 
+    @pytest.mark.parametrize(
+        ("remove_qns", "ignore_qns", "result"),
+        [
+            (None, None, 3),
+            ({NodeQuantumNumbers.s_magnitude}, None, 2),
+            (None, {NodeQuantumNumbers.s_magnitude}, 2),
+            ({NodeQuantumNumbers.l_magnitude}, None, 2),
+            (
+                {NodeQuantumNumbers.s_magnitude},
+                {NodeQuantumNumbers.l_magnitude},
+                1,
+            ),
+        ],
+    )
+    def test_remove_duplicates_ignoring_qns(
+        self, remove_qns, ignore_qns, result, particle_database
+    ):
+        pi0 = particle_database["pi0"]
+        ls_pairs = [(1, 0), (1, 1), (2, 1), (1, 0)]
+        graphs = [make_ls_test_graph(l, s, pi0) for l, s in ls_pairs]
+        results = remove_duplicate_solutions(graphs, remove_qns, ignore_qns)
+        assert len(results) == result
+        if remove_qns:
+            for graph in results:
+                for interaction in graph.interactions.values():
+                    for qn_type in remove_qns:
+                        assert getattr(interaction, qn_type.__name__) is None
+
     @pytest.mark.parametrize(
         ("input_values", "filter_parameters", "result"),
         [
@@ -1,5 +1,6 @@
 # pylint: disable=eval-used, no-self-use, redefined-outer-name, too-many-arguments
 # pyright: reportUnusedImport=false
+import itertools
 import typing
 
 import pytest
@@ -13,6 +14,7 @@ from qrules.topology import (  # noqa: F401
     MutableTopology,
     SimpleStateTransitionTopologyBuilder,
     Topology,
+    _get_canonical_form,
     create_isobar_topologies,
     create_n_body_topology,
     get_originating_node_list,
@@ -235,6 +237,34 @@ class TestTopology:
         assert get_originating_node_list(topology, edge_ids=[-1]) == []
         assert get_originating_node_list(topology, edge_ids=[1, 2]) == [2, 2]
 
+    def test_cyclic_topology(self):
+        topology = Topology(
+            nodes={0, 1},
+            edges={
+                -1: Edge(None, 0),
+                0: Edge(1, None),
+                1: Edge(0, 1),
+                2: Edge(1, 0),
+            },
+        )
+        assert topology.get_originating_final_state_edge_ids(0) == {0}
+        assert topology.get_originating_final_state_edge_ids(1) == {0}
+
+    def test_edge_ids_around_nodes(self, two_to_three_decay: Topology):
+        topology = two_to_three_decay
+        assert topology.get_edge_ids_ingoing_to_node(0) == {-2, -1}
+        assert topology.get_edge_ids_outgoing_from_node(0) == {3}
+        assert topology.get_edge_ids_ingoing_to_node(2) == {4}
+        assert topology.get_edge_ids_outgoing_from_node(2) == {1, 2}
+        assert topology.get_originating_final_state_edge_ids(0) == {0, 1, 2}
+        assert topology.get_originating_final_state_edge_ids(1) == {0, 1, 2}
+        assert topology.get_originating_final_state_edge_ids(2) == {1, 2}
+        assert topology.get_originating_initial_state_edge_ids(2) == {-2, -1}
+        assert topology.get_edge_ids_ingoing_to_node(666) == set()
+        edge_ids = topology.get_edge_ids_outgoing_from_node(2)
+        edge_ids.add(666)
+        assert topology.get_edge_ids_outgoing_from_node(2) == {1, 2}
+
     @typing.no_type_check
     def test_immutability(self, two_to_three_decay: Topology):
         with pytest.raises(FrozenInstanceError):
@@ -262,6 +292,95 @@ class TestTopology:
         relabeled_topology = relabeled_topology.relabel_edges({3: 4})
         assert set(relabeled_topology.edges) == edge_ids
 
+    def test_is_isomorphic(self, two_to_three_decay: Topology):
+        topology = two_to_three_decay
+        assert topology.is_isomorphic(topology)
+        assert topology.is_isomorphic(topology.swap_edges(0, 1))
+        assert topology.is_isomorphic(topology.swap_edges(-2, -1))
+        node_relabeled = Topology(
+            nodes=topology.nodes,
+            edges={
+                i: Edge(
+                    originating_node_id=_relabel_node(
+                        edge.originating_node_id
+                    ),
+                    ending_node_id=_relabel_node(edge.ending_node_id),
+                )
+                for i, edge in topology.edges.items()
+            },
+        )
+        assert node_relabeled != topology
+        assert topology.is_isomorphic(node_relabeled)
+        assert not topology.is_isomorphic(create_n_body_topology(2, 3))
+
+    def test_is_isomorphic_scattering(self):
+        t_channel = Topology(
+            nodes={0, 1},
+            edges={
+                -2: Edge(None, 0),
+                -1: Edge(None, 1),
+                0: Edge(0, None),
+                1: Edge(1, None),
+                2: Edge(0, 1),
+            },
+        )
+        s_channel = Topology(
+            nodes={0, 1},
+            edges={
+                -2: Edge(None, 0),
+                -1: Edge(None, 0),
+                0: Edge(1, None),
+                1: Edge(1, None),
+                2: Edge(0, 1),
+            },
+        )
+        assert _get_canonical_form(t_channel)[0] == "forest"
+        assert _get_canonical_form(s_channel)[0] == "forest"
+        assert t_channel.is_isomorphic(t_channel.swap_edges(-2, -1))
+        assert s_channel.is_isomorphic(s_channel.swap_edges(0, 1))
+        assert not t_channel.is_isomorphic(s_channel)
+
+        loop = Topology(
+            nodes={0, 1},
+            edges={-1: Edge(None, 0), 0: Edge(1, None), 1: Edge(0, 1)},
+        )
+        double_loop = Topology(
+            nodes={0, 1},
+            edges={
+                -1: Edge(None, 0),
+                0: Edge(1, None),
+                1: Edge(0, 1),
+                2: Edge(0, 1),
+            },
+        )
+        assert _get_canonical_form(double_loop)[0] == "graph"
+        assert double_loop.is_isomorphic(double_loop.swap_edges(1, 2))
+        assert not double_loop.is_isomorphic(loop)
+
+    def test_canonical_form_cycles(self):
+        cycles = [
+            MutableTopology(
+                nodes={0, 1},
+                edges={1: Edge(0, 1), 2: Edge(1, 0)},
+            ),
+            MutableTopology(
+                nodes={0, 1, 2},
+                edges={1: Edge(0, 1), 2: Edge(1, 2), 3: Edge(2, 0)},
+            ),
+            MutableTopology(
+                nodes={0, 1},
+                edges={0: Edge(1, None), 1: Edge(0, 1), 2: Edge(1, 0)},
+            ),
+        ]
+        forms = [_get_canonical_form(topology) for topology in cycles]
+        assert all(form[0] == "graph" for form in forms)
+        assert len(set(forms)) == len(cycles)
+        relabeled = MutableTopology(
+            nodes={0, 1},
+            edges={0: Edge(0, None), 1: Edge(1, 0), 2: Edge(0, 1)},
+        )
+        assert _get_canonical_form(relabeled) == forms[2]
+
     def test_swap_edges(self, two_to_three_decay: Topology):
         original_topology = two_to_three_decay
         topology = original_topology.swap_edges(-2, -1)
@@ -285,10 +404,11 @@ class TestTopology:
         (2, 1, None),
         (3, 1, None),
         (4, 2, None),
-        (5, 5, None),
-        (6, 16, None),
-        (7, 61, None),
-        (8, 272, None),
+        (5, 3, None),
+        (6, 6, None),
+        (7, 11, None),
+        (8, 23, None),
+        (9, 46, None),
     ],
 )
 def test_create_isobar_topologies(
@@ -308,6 +428,8 @@ def test_create_isobar_topologies(
             assert len(topology.outgoing_edge_ids) == n_final
             assert len(topology.intermediate_edge_ids) == n_intermediate_edges
             assert len(topology.nodes) == n_expected_nodes
+        for topology1, topology2 in itertools.combinations(topologies, 2):
+            assert not topology1.is_isomorphic(topology2)
 
 
 @pytest.mark.parametrize(
@@ -334,3 +456,9 @@ def test_create_n_body_topology(n_initial: int, n_final: int, exception):
         assert len(topology.outgoing_edge_ids) == n_final
         assert len(topology.intermediate_edge_ids) == 0
         assert len(topology.nodes) == 1
+
+
+def _relabel_node(node_id):
+    if node_id is None:
+        return None
+    return {0: 2, 1: 0, 2: 1}[node_id]
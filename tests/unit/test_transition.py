@@ -5,6 +5,7 @@ from copy import deepcopy
 import pytest
 from IPython.lib.pretty import pretty
 
+from qrules import _worker_pool
 from qrules.particle import (  # noqa: F401
     Parity,
     Particle,
@@ -12,6 +13,11 @@ from qrules.particle import (  # noqa: F401
     Spin,
 )
 from qrules.quantum_numbers import InteractionProperties  # noqa: F401
+from qrules.settings import (
+    InteractionType,
+    NumberOfThreads,
+    PersistentWorkerPool,
+)
 from qrules.topology import (  # noqa: F401
     Edge,
     FrozenDict,
@@ -82,3 +88,80 @@ class TestStateTransitionManager:
             ),
         ):
             stm.set_allowed_intermediate_particles([particle_name])
+
+    @pytest.mark.parametrize("number_of_threads", [1, 2])
+    def test_iter_transitions(self, number_of_threads: int):
+        stm = StateTransitionManager(
+            initial_state=[("J/psi(1S)", [-1, +1])],
+            final_state=["gamma", "pi0", "pi0"],
+            allowed_intermediate_particles=["f(0)(980)", "f(0)(1500)"],
+            number_of_threads=number_of_threads,
+        )
+        NumberOfThreads.set(1)
+        stm.set_allowed_interaction_types([InteractionType.STRONG])
+        problem_sets = stm.create_problem_sets()
+        transitions = stm.iter_transitions(problem_sets)
+        first_transition = next(transitions)
+        assert isinstance(first_transition, FrozenTransition)
+        reaction = ReactionInfo(
+            [first_transition, *transitions], stm.formalism
+        )
+        assert reaction == stm.find_solutions(problem_sets)
+        assert len(reaction.transitions) == 8
+
+    def test_persistent_worker_pool(self):
+        PersistentWorkerPool.set(True)
+        try:
+            reactions = []
+            pools = []
+            for _ in range(2):
+                stm = StateTransitionManager(
+                    initial_state=[("J/psi(1S)", [-1, +1])],
+                    final_state=["gamma", "pi0", "pi0"],
+                    allowed_intermediate_particles=["f(0)(980)", "f(0)(1500)"],
+                    number_of_threads=2,
+                )
+                NumberOfThreads.set(1)
+                stm.set_allowed_interaction_types([InteractionType.STRONG])
+                problem_sets = stm.create_problem_sets()
+                reactions.append(stm.find_solutions(problem_sets))
+                pools.append(_worker_pool._PERSISTENT_POOL)
+            assert pools[0] is not None
+            assert pools[0] is pools[1]
+            assert reactions[0] == reactions[1]
+        finally:
+            PersistentWorkerPool.set(False)
+        assert _worker_pool._PERSISTENT_POOL is None
+
+    def test_worker_context(self):
+        PersistentWorkerPool.set(True)
+        try:
+            stm = StateTransitionManager(
+                initial_state=[("J/psi(1S)", [-1, +1])],
+                final_state=["gamma", "pi0", "pi0"],
+                allowed_intermediate_particles=["f(0)(980)"],
+                number_of_threads=2,
+            )
+            NumberOfThreads.set(1)
+            stm.set_allowed_interaction_types([InteractionType.STRONG])
+            problem_sets = stm.create_problem_sets()
+            stm.find_solutions(problem_sets)
+            pool = _worker_pool._PERSISTENT_POOL
+            assert pool is not None
+            problem_set = next(iter(problem_sets.values()))[0]
+            task = ("unknown", problem_set.to_qn_problem_set())
+            with pytest.raises(RuntimeError, match="not been initialized"):
+                pool.apply(_worker_pool.solve_problem_set, [task])
+        finally:
+            PersistentWorkerPool.set(False)
+
+    def test_iter_transitions_no_solutions(self):
+        stm = StateTransitionManager(
+            initial_state=["J/psi(1S)"],
+            final_state=["gamma", "gamma", "gamma", "gamma"],
+            allowed_intermediate_particles=["f(0)(980)"],
+        )
+        stm.set_allowed_interaction_types([InteractionType.STRONG])
+        problem_sets = stm.create_problem_sets()
+        with pytest.raises(RuntimeError, match=r"violated conservation rules"):
+            list(stm.iter_transitions(problem_sets))